@@ -169,7 +169,7 @@ class APIConfigView(HomeAssistantView):
     @ha.callback
     def get(self, request):
         """Get current configuration."""
-        return self.json(request.app["hass"].config.as_dict())
+        return self.json(request.app["hass"].config.as_dict(), request=request)
 
 
 class APIDiscoveryView(HomeAssistantView):
@@ -224,12 +224,41 @@ class APIStatesView(HomeAssistantView):
         """Get current states."""
         user = request["hass_user"]
         entity_perm = user.permissions.check_entity
-        states = [
-            state
-            for state in request.app["hass"].states.async_all()
-            if entity_perm(state.entity_id, "read")
-        ]
-        return self.json(states)
+        hass = request.app["hass"]
+
+        if "since" not in request.query:
+            states = [
+                state
+                for state in hass.states.async_all()
+                if entity_perm(state.entity_id, "read")
+            ]
+            return self.json(states, request=request)
+
+        try:
+            since = int(request.query["since"])
+        except ValueError:
+            return self.json_message("Invalid revision.", HTTP_BAD_REQUEST)
+
+        changes = hass.states.async_changes_since(since)
+        if changes is None:
+            # The changes are no longer known, send all states
+            changed, removed = hass.states.async_all(), []
+        else:
+            changed, removed = changes
+
+        return self.json(
+            {
+                "revision": hass.states.revision,
+                "full": changes is None,
+                "changed": [
+                    state for state in changed if entity_perm(state.entity_id, "read")
+                ],
+                "removed": [
+                    entity_id for entity_id in removed if entity_perm(entity_id, "read")
+                ],
+            },
+            request=request,
+        )
 
 
 class APIEntityStateView(HomeAssistantView):
@@ -247,7 +276,7 @@ class APIEntityStateView(HomeAssistantView):
 
         state = request.app["hass"].states.get(entity_id)
         if state:
-            return self.json(state)
+            return self.json(state, request=request)
         return self.json_message("Entity not found.", HTTP_NOT_FOUND)
 
     async def post(self, request, entity_id):
@@ -302,7 +331,7 @@ class APIEventListenersView(HomeAssistantView):
     @ha.callback
     def get(self, request):
         """Get event listeners."""
-        return self.json(async_events_json(request.app["hass"]))
+        return self.json(async_events_json(request.app["hass"]), request=request)
 
 
 class APIEventView(HomeAssistantView):
@@ -353,7 +382,7 @@ class APIServicesView(HomeAssistantView):
     async def get(self, request):
         """Get registered services."""
         services = await async_services_json(request.app["hass"])
-        return self.json(services)
+        return self.json(services, request=request)
 
 
 class APIDomainServicesView(HomeAssistantView):
@@ -394,7 +423,7 @@ class APIComponentsView(HomeAssistantView):
     @ha.callback
     def get(self, request):
         """Get current loaded components."""
-        return self.json(request.app["hass"].config.components)
+        return self.json(request.app["hass"].config.components, request=request)
 
 
 class APITemplateView(HomeAssistantView):
@@ -30,7 +30,12 @@ from homeassistant.core import (
     split_entity_id,
 )
 from homeassistant.exceptions import HomeAssistantError
-from homeassistant.helpers import condition, extract_domain_configs, template
+from homeassistant.helpers import (
+    condition,
+    extract_domain_configs,
+    reference_index,
+    template,
+)
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity import ToggleEntity
 from homeassistant.helpers.entity_component import EntityComponent
@@ -127,63 +132,25 @@ def is_on(hass, entity_id):
 @callback
 def automations_with_entity(hass: HomeAssistant, entity_id: str) -> List[str]:
     """Return all automations that reference the entity."""
-    if DOMAIN not in hass.data:
-        return []
-
-    component = hass.data[DOMAIN]
-
-    return [
-        automation_entity.entity_id
-        for automation_entity in component.entities
-        if entity_id in automation_entity.referenced_entities
-    ]
+    return reference_index.async_get(hass).async_sources_with_entity(entity_id, DOMAIN)
 
 
 @callback
 def entities_in_automation(hass: HomeAssistant, entity_id: str) -> List[str]:
     """Return all entities in a scene."""
-    if DOMAIN not in hass.data:
-        return []
-
-    component = hass.data[DOMAIN]
-
-    automation_entity = component.get_entity(entity_id)
-
-    if automation_entity is None:
-        return []
-
-    return list(automation_entity.referenced_entities)
+    return reference_index.async_get(hass).async_entities(entity_id)
 
 
 @callback
 def automations_with_device(hass: HomeAssistant, device_id: str) -> List[str]:
     """Return all automations that reference the device."""
-    if DOMAIN not in hass.data:
-        return []
-
-    component = hass.data[DOMAIN]
-
-    return [
-        automation_entity.entity_id
-        for automation_entity in component.entities
-        if device_id in automation_entity.referenced_devices
-    ]
+    return reference_index.async_get(hass).async_sources_with_device(device_id, DOMAIN)
 
 
 @callback
 def devices_in_automation(hass: HomeAssistant, entity_id: str) -> List[str]:
     """Return all devices in a scene."""
-    if DOMAIN not in hass.data:
-        return []
-
-    component = hass.data[DOMAIN]
-
-    automation_entity = component.get_entity(entity_id)
-
-    if automation_entity is None:
-        return []
-
-    return list(automation_entity.referenced_devices)
+    return reference_index.async_get(hass).async_devices(entity_id)
 
 
 async def async_setup(hass, config):
@@ -334,6 +301,10 @@ class AutomationEntity(ToggleEntity, RestoreEntity):
         """Startup with initial state or previous state."""
         await super().async_added_to_hass()
 
+        reference_index.async_get(self.hass).async_set(
+            self.entity_id, self.referenced_entities, self.referenced_devices
+        )
+
         self._logger = logging.getLogger(
             f"{__name__}.{split_entity_id(self.entity_id)[1]}"
         )
@@ -432,6 +403,7 @@ class AutomationEntity(ToggleEntity, RestoreEntity):
     async def async_will_remove_from_hass(self):
         """Remove listeners when removing automation from Home Assistant."""
         await super().async_will_remove_from_hass()
+        reference_index.async_get(self.hass).async_remove(self.entity_id)
         await self.async_disable()
 
     async def async_enable(self):
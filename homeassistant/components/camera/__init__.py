@@ -54,6 +54,7 @@ from homeassistant.helpers.network import get_url
 from homeassistant.loader import bind_hass
 
 from .const import DATA_CAMERA_PREFS, DOMAIN
+from .hub import CameraHub, mjpeg_frame
 from .prefs import CameraPreferences
 
 # mypy: allow-untyped-calls, allow-untyped-defs
@@ -150,13 +151,13 @@ async def async_request_stream(hass, entity_id, fmt):
 
 
 @bind_hass
-async def async_get_image(hass, entity_id, timeout=10):
-    """Fetch an image from a camera entity."""
+async def async_get_image(hass, entity_id, timeout=10, width=None):
+    """Fetch an image from a camera entity, scaled down to width if given."""
     camera = _get_camera_from_entity_id(hass, entity_id)
 
     with suppress(asyncio.CancelledError, asyncio.TimeoutError):
         async with async_timeout.timeout(timeout):
-            image = await camera.async_camera_image()
+            image = await camera.hub.async_camera_image(width=width)
 
             if image:
                 return Image(camera.content_type, image)
@@ -191,16 +192,7 @@ async def async_get_still_stream(request, image_cb, content_type, interval):
 
     async def write_to_mjpeg_stream(img_bytes):
         """Write image to stream."""
-        await response.write(
-            bytes(
-                "--frameboundary\r\n"
-                "Content-Type: {}\r\n"
-                "Content-Length: {}\r\n\r\n".format(content_type, len(img_bytes)),
-                "utf-8",
-            )
-            + img_bytes
-            + b"\r\n"
-        )
+        await response.write(mjpeg_frame(content_type, img_bytes))
 
     last_image = None
 
@@ -327,6 +319,8 @@ async def async_unload_entry(hass, entry):
 class Camera(Entity):
     """The base class for camera entities."""
 
+    _hub = None
+
     def __init__(self):
         """Initialize a camera."""
         self.is_streaming = False
@@ -340,6 +334,13 @@ class Camera(Entity):
         """No need to poll cameras."""
         return False
 
+    @property
+    def hub(self):
+        """Return the hub sharing the images of this camera between viewers."""
+        if self._hub is None:
+            self._hub = CameraHub(self)
+        return self._hub
+
     @property
     def entity_picture(self):
         """Return a link to the camera feed as entity picture."""
@@ -388,10 +389,11 @@ class Camera(Entity):
         return await self.hass.async_add_executor_job(self.camera_image)
 
     async def handle_async_still_stream(self, request, interval):
-        """Generate an HTTP MJPEG stream from camera images."""
-        return await async_get_still_stream(
-            request, self.async_camera_image, self.content_type, interval
-        )
+        """Generate an HTTP MJPEG stream from camera images.
+
+        Viewers of the same camera share the fetched images.
+        """
+        return await self.hub.async_handle_still_stream(request, interval)
 
     async def handle_async_mjpeg_stream(self, request):
         """Serve an HTTP MJPEG stream from the camera.
@@ -514,9 +516,19 @@ class CameraImageView(CameraView):
 
     async def handle(self, request: web.Request, camera: Camera) -> web.Response:
         """Serve camera image."""
+        width = request.query.get("width")
+
+        if width is not None:
+            try:
+                width = int(width)
+                if width < 1:
+                    raise ValueError(f"Width must be positive: {width}")
+            except ValueError as err:
+                raise web.HTTPBadRequest() from err
+
         with suppress(asyncio.CancelledError, asyncio.TimeoutError):
             async with async_timeout.timeout(10):
-                image = await camera.async_camera_image()
+                image = await camera.hub.async_camera_image(width=width)
 
             if image:
                 return web.Response(body=image, content_type=camera.content_type)
@@ -0,0 +1,221 @@
+"""Share upstream camera images between viewers."""
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Dict, Optional, Set
+
+from aiohttp import web
+
+from homeassistant.const import CONTENT_TYPE_MULTIPART
+from homeassistant.core import callback
+
+from .img_util import scale_jpeg_image
+
+if TYPE_CHECKING:
+    from . import Camera  # noqa: F401
+
+_LOGGER = logging.getLogger(__name__)
+
+# Seconds a fetched snapshot is served to other requests
+SNAPSHOT_CACHE_TTL = 1.0
+# Number of scaled variants kept for the current snapshot
+MAX_SCALED_VARIANTS = 8
+
+
+def mjpeg_frame(content_type: str, img_bytes: bytes) -> bytes:
+    """Return an image as a part of a multipart MJPEG stream."""
+    return (
+        bytes(
+            "--frameboundary\r\n"
+            "Content-Type: {}\r\n"
+            "Content-Length: {}\r\n\r\n".format(content_type, len(img_bytes)),
+            "utf-8",
+        )
+        + img_bytes
+        + b"\r\n"
+    )
+
+
+class CameraSubscription:
+    """A viewer of the frames of a camera hub."""
+
+    def __init__(self, hub: "CameraHub", interval: float) -> None:
+        """Initialize the subscription."""
+        self.interval = interval
+        self._hub = hub
+        # Only the latest frame is kept, slow viewers skip frames
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=1)
+
+    @callback
+    def async_put(self, img_bytes: Optional[bytes]) -> None:
+        """Queue a frame, replacing a frame the viewer did not read yet."""
+        if self._queue.full():
+            self._queue.get_nowait()
+        self._queue.put_nowait(img_bytes)
+
+    async def async_get(self) -> Optional[bytes]:
+        """Wait for the next frame, None if the stream ended."""
+        return await self._queue.get()
+
+    @callback
+    def async_unsubscribe(self) -> None:
+        """Stop receiving frames."""
+        self._hub.async_unsubscribe(self)
+
+
+class CameraHub:
+    """Fetch images of a camera once and fan them out to all viewers."""
+
+    def __init__(self, camera: "Camera") -> None:
+        """Initialize the hub."""
+        self.camera = camera
+        self._image: Optional[bytes] = None
+        self._image_time = 0.0
+        self._fetch: Optional[asyncio.Future] = None
+        self._subscriptions: Set[CameraSubscription] = set()
+        self._stream_task: Optional[asyncio.Task] = None
+        self._last_frame: Optional[bytes] = None
+        self._scaled_frame: Optional[bytes] = None
+        self._scaled: Dict[int, asyncio.Future] = {}
+
+    async def async_camera_image(
+        self, max_age: Optional[float] = None, width: Optional[int] = None
+    ) -> Optional[bytes]:
+        """Return a recent camera image, scaled down to width if given.
+
+        Concurrent requests share a single upstream fetch.
+        """
+        image = await self._async_get_image(max_age)
+
+        if not image or width is None or self.camera.content_type != "image/jpeg":
+            return image
+
+        return await self._async_scale_image(image, width)
+
+    async def _async_get_image(self, max_age: Optional[float]) -> Optional[bytes]:
+        """Return the cached image or fetch a new one."""
+        hass = self.camera.hass
+
+        if max_age is None:
+            max_age = SNAPSHOT_CACHE_TTL
+
+        if self._image is not None and hass.loop.time() - self._image_time < max_age:
+            return self._image
+
+        if self._fetch is None:
+            self._fetch = hass.async_create_task(self._async_fetch())
+
+        # One viewer timing out must not cancel the fetch for the others
+        return await asyncio.shield(self._fetch)
+
+    async def _async_fetch(self) -> Optional[bytes]:
+        """Fetch an image from the camera."""
+        try:
+            image = await self.camera.async_camera_image()
+        finally:
+            self._fetch = None
+
+        self._image = image
+        self._image_time = self.camera.hass.loop.time()
+        return image
+
+    async def _async_scale_image(self, image: bytes, width: int) -> bytes:
+        """Return a scaled variant of an image, scaling it once per width."""
+        if self._scaled_frame is not image:
+            self._scaled_frame = image
+            self._scaled = {}
+
+        if width not in self._scaled:
+            if len(self._scaled) >= MAX_SCALED_VARIANTS:
+                self._scaled.pop(next(iter(self._scaled)))
+            self._scaled[width] = self.camera.hass.async_add_executor_job(
+                scale_jpeg_image, image, width
+            )
+
+        return await asyncio.shield(self._scaled[width])
+
+    @callback
+    def async_subscribe(self, interval: float) -> CameraSubscription:
+        """Subscribe to camera frames fetched at least every interval."""
+        subscription = CameraSubscription(self, interval)
+        self._subscriptions.add(subscription)
+
+        if self._stream_task is None:
+            self._stream_task = self.camera.hass.async_create_task(self._async_stream())
+        elif self._last_frame is not None:
+            # Frames are only sent when they change, start with the current one
+            subscription.async_put(self._last_frame)
+
+        return subscription
+
+    @callback
+    def async_unsubscribe(self, subscription: CameraSubscription) -> None:
+        """Remove a subscription and stop fetching after the last one."""
+        self._subscriptions.discard(subscription)
+
+        if not self._subscriptions and self._stream_task is not None:
+            self._stream_task.cancel()
+            self._stream_task = None
+
+    async def _async_stream(self) -> None:
+        """Fetch frames while there are subscriptions."""
+        try:
+            while self._subscriptions:
+                interval = min(sub.interval for sub in self._subscriptions)
+                try:
+                    img_bytes = await self.async_camera_image(interval)
+                except Exception:  # pylint: disable=broad-except
+                    _LOGGER.exception(
+                        "Error fetching image from %s", self.camera.entity_id
+                    )
+                    break
+
+                if not img_bytes:
+                    break
+
+                if img_bytes != self._last_frame:
+                    for subscription in self._subscriptions:
+                        subscription.async_put(img_bytes)
+                    self._last_frame = img_bytes
+
+                await asyncio.sleep(interval)
+        finally:
+            self._last_frame = None
+            if self._stream_task is asyncio.current_task():
+                self._stream_task = None
+
+        # Tell the viewers the stream ended
+        for subscription in self._subscriptions:
+            subscription.async_put(None)
+        self._subscriptions.clear()
+
+    async def async_handle_still_stream(
+        self, request: web.Request, interval: float
+    ) -> web.StreamResponse:
+        """Generate an HTTP MJPEG stream from shared camera images."""
+        response = web.StreamResponse()
+        response.content_type = CONTENT_TYPE_MULTIPART.format("--frameboundary")
+        await response.prepare(request)
+
+        subscription = self.async_subscribe(interval)
+        first = True
+
+        try:
+            while True:
+                img_bytes = await subscription.async_get()
+                if not img_bytes:
+                    break
+
+                frame = mjpeg_frame(self.camera.content_type, img_bytes)
+                await response.write(frame)
+
+                # Chrome seems to always ignore first picture,
+                # print it twice.
+                if first:
+                    await response.write(frame)
+                    first = False
+
+                await asyncio.sleep(interval)
+        finally:
+            subscription.async_unsubscribe()
+
+        return response
@@ -0,0 +1,106 @@
+"""Image scaling for the camera component."""
+import io
+import logging
+from typing import Optional
+
+SUPPORTED_SCALING_FACTORS = [(7, 8), (3, 4), (5, 8), (1, 2), (3, 8), (1, 4), (1, 8)]
+
+JPEG_QUALITY = 75
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def scale_jpeg_image(content: bytes, width: int, height: Optional[int] = None) -> bytes:
+    """Scale a jpeg image down to about the given size.
+
+    Uses TurboJPEG when available and falls back to Pillow. The image is
+    returned as is when it is already small enough or cannot be scaled.
+    """
+    turbo_jpeg = TurboJPEGSingleton.instance()
+    if not turbo_jpeg:
+        return _scale_jpeg_image_pillow(content, width, height)
+
+    (current_width, current_height, _, _) = turbo_jpeg.decode_header(content)
+
+    if current_width <= width or (height is not None and current_height <= height):
+        return content
+
+    ratio = width / current_width
+
+    scaling_factor = SUPPORTED_SCALING_FACTORS[-1]
+    for supported_sf in SUPPORTED_SCALING_FACTORS:
+        if ratio >= (supported_sf[0] / supported_sf[1]):
+            scaling_factor = supported_sf
+            break
+
+    return turbo_jpeg.scale_with_quality(
+        content,
+        scaling_factor=scaling_factor,
+        quality=JPEG_QUALITY,
+    )
+
+
+def _scale_jpeg_image_pillow(
+    content: bytes, width: int, height: Optional[int] = None
+) -> bytes:
+    """Scale a jpeg image with Pillow."""
+    try:
+        from PIL import Image  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        return content
+
+    try:
+        img = Image.open(io.BytesIO(content))
+        current_width, current_height = img.size
+
+        if current_width <= width or (height is not None and current_height <= height):
+            return content
+
+        size = (width, round(current_height * width / current_width))
+        # Let the decoder skip the work for the pixels we drop
+        img.draft("RGB", size)
+        img = img.convert("RGB")
+        img.thumbnail(size)
+
+        output = io.BytesIO()
+        img.save(output, format="JPEG", quality=JPEG_QUALITY)
+    except (OSError, ValueError) as err:
+        _LOGGER.debug("Unable to scale image: %s", err)
+        return content
+
+    return output.getvalue()
+
+
+class TurboJPEGSingleton:
+    """
+    Load TurboJPEG only once.
+
+    Ensures we do not log load failures each snapshot
+    since camera image fetches happen every few
+    seconds.
+    """
+
+    __instance = None
+
+    @staticmethod
+    def instance():
+        """Singleton for TurboJPEG."""
+        if TurboJPEGSingleton.__instance is None:
+            TurboJPEGSingleton()
+        return TurboJPEGSingleton.__instance
+
+    def __init__(self):
+        """Try to create TurboJPEG only once."""
+        try:
+            # TurboJPEG checks for libturbojpeg
+            # when its created, but it imports
+            # numpy which may or may not work so
+            # we have to guard the import here.
+            from turbojpeg import TurboJPEG  # pylint: disable=import-outside-toplevel
+
+            TurboJPEGSingleton.__instance = TurboJPEG()
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.exception(
+                "libturbojpeg is not installed, scaling camera images will be slower"
+            )
+            TurboJPEGSingleton.__instance = False
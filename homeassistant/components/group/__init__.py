@@ -30,6 +30,7 @@ from homeassistant.const import (
     STATE_UNLOCKED,
 )
 from homeassistant.core import CoreState, callback
+from homeassistant.helpers import reference_index
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity import Entity, async_generate_entity_id
 from homeassistant.helpers.entity_component import EntityComponent
@@ -190,16 +191,7 @@ def groups_with_entity(hass: HomeAssistantType, entity_id: str) -> List[str]:
 
     Async friendly.
     """
-    if DOMAIN not in hass.data:
-        return []
-
-    groups = []
-
-    for group in hass.data[DOMAIN].entities:
-        if entity_id in group.tracking:
-            groups.append(group.entity_id)
-
-    return groups
+    return reference_index.async_get(hass).async_sources_with_entity(entity_id, DOMAIN)
 
 
 async def async_setup(hass, config):
@@ -553,6 +545,7 @@ class Group(Entity):
         await self.async_stop()
         self.tracking = tuple(ent_id.lower() for ent_id in entity_ids)
         self.group_on, self.group_off = None, None
+        reference_index.async_get(self.hass).async_set(self.entity_id, self.tracking)
 
         await self.async_update_ha_state(True)
         self.async_start()
@@ -584,11 +577,13 @@ class Group(Entity):
 
     async def async_added_to_hass(self):
         """Handle addition to Home Assistant."""
+        reference_index.async_get(self.hass).async_set(self.entity_id, self.tracking)
         if self.tracking:
             self.async_start()
 
     async def async_will_remove_from_hass(self):
         """Handle removal from Home Assistant."""
+        reference_index.async_get(self.hass).async_remove(self.entity_id)
         if self._async_unsub_state_changed:
             self._async_unsub_state_changed()
             self._async_unsub_state_changed = None
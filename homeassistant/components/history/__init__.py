@@ -1,30 +1,42 @@
 """Provide pre-made queries on top of the recorder component."""
+import asyncio
 from collections import defaultdict
 from datetime import timedelta
 from itertools import groupby
 import json
 import logging
+import math
+import threading
 import time
 from typing import Optional, cast
 
 from aiohttp import web
+from aiohttp.hdrs import CONTENT_TYPE
 from sqlalchemy import and_, bindparam, func, not_, or_
 from sqlalchemy.ext import baked
 import voluptuous as vol
 
-from homeassistant.components import recorder
+from homeassistant.components import recorder, websocket_api
 from homeassistant.components.http import HomeAssistantView
 from homeassistant.components.recorder.models import (
+    StateAttributes,
     States,
     process_timestamp,
     process_timestamp_to_utc_isoformat,
 )
+from homeassistant.components.recorder.statistics import (
+    PERIOD_DAY,
+    PERIOD_HOUR,
+    statistics_during_period,
+)
 from homeassistant.components.recorder.util import execute, session_scope
+from homeassistant.components.websocket_api.const import JSON_DUMP
 from homeassistant.const import (
     CONF_DOMAINS,
     CONF_ENTITIES,
     CONF_EXCLUDE,
     CONF_INCLUDE,
+    CONTENT_TYPE_JSON,
     HTTP_BAD_REQUEST,
 )
 from homeassistant.core import Context, State, split_entity_id
@@ -33,6 +45,7 @@ from homeassistant.helpers.entityfilter import (
     CONF_ENTITY_GLOBS,
     INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA,
 )
+from homeassistant.util.async_ import run_callback_threadsafe
 import homeassistant.util.dt as dt_util
 
 # mypy: allow-untyped-defs, no-check-untyped-defs
@@ -78,12 +91,38 @@ QUERY_STATES = [
     States.domain,
     States.entity_id,
     States.state,
-    States.attributes,
+    # Attributes are stored inline on old rows and shared on new ones
+    func.coalesce(States.attributes, StateAttributes.shared_attrs).label("attributes"),
     States.last_changed,
     States.last_updated,
 ]
 
 HISTORY_BAKERY = "history_bakery"
+HISTORY_FILTERS = "history_filters"
+
+# Number of rows fetched from the database cursor at a time when streaming
+STREAM_BATCH_ROWS = 1000
+
+# Upper limit for the resolution parameter of the history API
+MAX_RESOLUTION = 10000
+
+QUERY_DOWNSAMPLE_STATES = [
+    States.entity_id,
+    States.state,
+    States.last_updated,
+]
+
+
+def _query_states(session):
+    """Return a query for QUERY_STATES with the shared attributes joined."""
+    return session.query(*QUERY_STATES).outerjoin(
+        StateAttributes, States.attributes_id == StateAttributes.attributes_id
+    )
+
+
+def _query_downsample_states(session):
+    """Return a query for the columns needed to downsample states."""
+    return session.query(*QUERY_DOWNSAMPLE_STATES)
 
 
 def get_significant_states(hass, *args, **kwargs):
@@ -112,10 +151,227 @@ def _get_significant_states(
     """
     timer_start = time.perf_counter()
 
-    baked_query = hass.data[HISTORY_BAKERY](
-        lambda session: session.query(*QUERY_STATES)
+    states = execute(
+        _significant_states_query(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            filters,
+            significant_changes_only,
+        )
+    )
+
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        elapsed = time.perf_counter() - timer_start
+        _LOGGER.debug("get_significant_states took %fs", elapsed)
+
+    return _sorted_states_to_json(
+        hass,
+        session,
+        states,
+        start_time,
+        entity_ids,
+        filters,
+        include_start_time_state,
+        minimal_response,
     )
 
+
+def stream_significant_states(
+    hass,
+    session,
+    start_time,
+    end_time=None,
+    entity_ids=None,
+    filters=None,
+    include_start_time_state=True,
+    significant_changes_only=True,
+    minimal_response=False,
+):
+    """Yield the significant states of one entity at a time.
+
+    Works like _get_significant_states, but rows are fetched from the
+    cursor in batches and the states of an entity are yielded as soon as
+    the next entity starts. Memory use depends on the busiest entity instead
+    of the length of the period. Entities are yielded in entity_id order.
+    """
+    query = _significant_states_query(
+        hass,
+        session,
+        start_time,
+        end_time,
+        entity_ids,
+        filters,
+        significant_changes_only,
+    ).with_post_criteria(lambda q: q.yield_per(STREAM_BATCH_ROWS))
+
+    start_time_states = {}
+    if include_start_time_state:
+        start_time_states = {
+            state.entity_id: state
+            for state in _get_start_time_states(
+                hass, session, start_time, entity_ids, filters
+            )
+        }
+
+    for ent_id, group in groupby(query, lambda state: state.entity_id):
+        ent_results = []
+        start_time_state = start_time_states.pop(ent_id, None)
+        if start_time_state is not None:
+            ent_results.append(start_time_state)
+        _append_entity_states(ent_id, group, ent_results, minimal_response)
+        yield ent_results
+
+    # Entities that did not change during the period
+    for state in start_time_states.values():
+        yield [state]
+
+
+def get_downsampled_states(
+    hass,
+    start_time,
+    end_time,
+    bucket,
+    entity_ids=None,
+    filters=None,
+    significant_changes_only=True,
+):
+    """Return states during start_time - end_time aggregated into buckets.
+
+    bucket is a timedelta. Every entity gets a list of the buckets that
+    contain at least one state, with the min, max and mean of the numeric
+    states and the last state in the bucket. Non numeric states only show
+    up as last.
+    """
+    with session_scope(hass=hass) as session:
+        return _get_downsampled_states(
+            hass,
+            session,
+            start_time,
+            end_time,
+            bucket,
+            entity_ids,
+            filters,
+            significant_changes_only,
+        )
+
+
+def _get_downsampled_states(
+    hass,
+    session,
+    start_time,
+    end_time,
+    bucket,
+    entity_ids,
+    filters,
+    significant_changes_only,
+):
+    """Aggregate states into buckets while reading the cursor.
+
+    Attributes are never loaded and only the bucket being filled is kept
+    besides the result, so the work is a single pass over the rows.
+    """
+    timer_start = time.perf_counter()
+
+    query = _significant_states_query(
+        hass,
+        session,
+        start_time,
+        end_time,
+        entity_ids,
+        filters,
+        significant_changes_only,
+        _query_downsample_states,
+    ).with_post_criteria(lambda q: q.yield_per(STREAM_BATCH_ROWS))
+
+    start_timestamp = start_time.timestamp()
+    bucket_seconds = bucket.total_seconds()
+    result = {}
+    if entity_ids is not None:
+        for ent_id in entity_ids:
+            result[ent_id] = []
+
+    for ent_id, group in groupby(query, lambda row: row.entity_id):
+        ent_buckets = result.setdefault(ent_id, [])
+        current = None
+        for row in group:
+            index = int(
+                (process_timestamp(row.last_updated).timestamp() - start_timestamp)
+                // bucket_seconds
+            )
+            if current is None or current.index != index:
+                if current is not None:
+                    ent_buckets.append(current.as_dict())
+                current = _StateBucket(index, start_timestamp + index * bucket_seconds)
+            current.add(row.state)
+        if current is not None:
+            ent_buckets.append(current.as_dict())
+
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        elapsed = time.perf_counter() - timer_start
+        _LOGGER.debug("get_downsampled_states took %fs", elapsed)
+
+    # Filter out the empty lists if some states had 0 results.
+    return {key: val for key, val in result.items() if val}
+
+
+class _StateBucket:
+    """Aggregate of the states recorded in one bucket."""
+
+    __slots__ = ["index", "start", "count", "total", "min", "max", "last"]
+
+    def __init__(self, index, start):
+        """Initialize an empty bucket."""
+        self.index = index
+        self.start = start
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+        self.last = None
+
+    def add(self, state):
+        """Add a state to the bucket."""
+        self.last = state
+        try:
+            value = float(state)
+        except (TypeError, ValueError):
+            return
+        if not math.isfinite(value):
+            return
+        self.count += 1
+        self.total += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    def as_dict(self):
+        """Return a JSON friendly representation of the bucket."""
+        return {
+            "start": dt_util.utc_from_timestamp(self.start).isoformat(),
+            "min": self.min,
+            "max": self.max,
+            "mean": self.total / self.count if self.count else None,
+            "last": self.last,
+        }
+
+
+def _significant_states_query(
+    hass,
+    session,
+    start_time,
+    end_time,
+    entity_ids,
+    filters,
+    significant_changes_only,
+    query_states=_query_states,
+):
+    """Return the query for significant states without running it."""
+    baked_query = hass.data[HISTORY_BAKERY](query_states)
+
     if significant_changes_only:
         baked_query += lambda q: q.filter(
             (
@@ -135,34 +391,15 @@ def _get_significant_states(
 
     baked_query += lambda q: q.order_by(States.entity_id, States.last_updated)
 
-    states = execute(
-        baked_query(session).params(
-            start_time=start_time, end_time=end_time, entity_ids=entity_ids
-        )
-    )
-
-    if _LOGGER.isEnabledFor(logging.DEBUG):
-        elapsed = time.perf_counter() - timer_start
-        _LOGGER.debug("get_significant_states took %fs", elapsed)
-
-    return _sorted_states_to_json(
-        hass,
-        session,
-        states,
-        start_time,
-        entity_ids,
-        filters,
-        include_start_time_state,
-        minimal_response,
+    return baked_query(session).params(
+        start_time=start_time, end_time=end_time, entity_ids=entity_ids
     )
 
 
 def state_changes_during_period(hass, start_time, end_time=None, entity_id=None):
     """Return states changes during UTC period start_time - end_time."""
     with session_scope(hass=hass) as session:
-        baked_query = hass.data[HISTORY_BAKERY](
-            lambda session: session.query(*QUERY_STATES)
-        )
+        baked_query = hass.data[HISTORY_BAKERY](_query_states)
 
         baked_query += lambda q: q.filter(
             (States.last_changed == States.last_updated)
@@ -175,7 +412,9 @@ def state_changes_during_period(hass, start_time, end_time=None, entity_id=None)
             )
 
         if entity_id is not None:
-            baked_query += lambda q: q.filter_by(entity_id=bindparam("entity_id"))
+            baked_query += lambda q: q.filter(
+                States.entity_id == bindparam("entity_id")
+            )
             entity_id = entity_id.lower()
 
         baked_query += lambda q: q.order_by(States.entity_id, States.last_updated)
@@ -196,13 +435,13 @@ def get_last_state_changes(hass, number_of_states, entity_id):
     start_time = dt_util.utcnow()
 
     with session_scope(hass=hass) as session:
-        baked_query = hass.data[HISTORY_BAKERY](
-            lambda session: session.query(*QUERY_STATES)
-        )
+        baked_query = hass.data[HISTORY_BAKERY](_query_states)
         baked_query += lambda q: q.filter(States.last_changed == States.last_updated)
 
         if entity_id is not None:
-            baked_query += lambda q: q.filter_by(entity_id=bindparam("entity_id"))
+            baked_query += lambda q: q.filter(
+                States.entity_id == bindparam("entity_id")
+            )
             entity_id = entity_id.lower()
 
         baked_query += lambda q: q.order_by(
@@ -263,7 +502,7 @@ def _get_states_with_session(
     # We have more than one entity to look at (most commonly we want
     # all entities,) so we need to do a search on all states since the
     # last recorder run started.
-    query = session.query(*QUERY_STATES)
+    query = _query_states(session)
 
     most_recent_states_by_date = session.query(
         States.entity_id.label("max_entity_id"),
@@ -307,9 +546,7 @@ def _get_states_with_session(
 def _get_single_entity_states_with_session(hass, session, utc_point_in_time, entity_id):
     # Use an entirely different (and extremely fast) query if we only
     # have a single entity id
-    baked_query = hass.data[HISTORY_BAKERY](
-        lambda session: session.query(*QUERY_STATES)
-    )
+    baked_query = hass.data[HISTORY_BAKERY](_query_states)
     baked_query += lambda q: q.filter(
         States.last_updated < bindparam("utc_point_in_time"),
         States.entity_id == bindparam("entity_id"),
@@ -354,65 +591,82 @@ def _sorted_states_to_json(
     # Get the states at the start time
     timer_start = time.perf_counter()
     if include_start_time_state:
-        run = recorder.run_information_from_instance(hass, start_time)
-        for state in _get_states_with_session(
-            hass, session, start_time, entity_ids, run=run, filters=filters
+        for state in _get_start_time_states(
+            hass, session, start_time, entity_ids, filters
         ):
-            state.last_changed = start_time
-            state.last_updated = start_time
             result[state.entity_id].append(state)
 
     if _LOGGER.isEnabledFor(logging.DEBUG):
         elapsed = time.perf_counter() - timer_start
         _LOGGER.debug("getting %d first datapoints took %fs", len(result), elapsed)
 
-    # Called in a tight loop so cache the function
-    # here
-    _process_timestamp_to_utc_isoformat = process_timestamp_to_utc_isoformat
-
     # Append all changes to it
     for ent_id, group in groupby(states, lambda state: state.entity_id):
-        domain = split_entity_id(ent_id)[0]
-        ent_results = result[ent_id]
-        if not minimal_response or domain in NEED_ATTRIBUTE_DOMAINS:
-            ent_results.extend(LazyState(db_state) for db_state in group)
-
-        # With minimal response we only provide a native
-        # State for the first and last response. All the states
-        # in-between only provide the "state" and the
-        # "last_changed".
-        if not ent_results:
-            ent_results.append(LazyState(next(group)))
-
-        prev_state = ent_results[-1]
-        initial_state_count = len(ent_results)
-
-        for db_state in group:
-            # With minimal response we do not care about attribute
-            # changes so we can filter out duplicate states
-            if db_state.state == prev_state.state:
-                continue
-
-            ent_results.append(
-                {
-                    STATE_KEY: db_state.state,
-                    LAST_CHANGED_KEY: _process_timestamp_to_utc_isoformat(
-                        db_state.last_changed
-                    ),
-                }
-            )
-            prev_state = db_state
-
-        if prev_state and len(ent_results) != initial_state_count:
-            # There was at least one state change
-            # replace the last minimal state with
-            # a full state
-            ent_results[-1] = LazyState(prev_state)
+        _append_entity_states(ent_id, group, result[ent_id], minimal_response)
 
     # Filter out the empty lists if some states had 0 results.
     return {key: val for key, val in result.items() if val}
 
 
+def _get_start_time_states(hass, session, start_time, entity_ids, filters):
+    """Return the states at start_time moved to start_time.
+
+    This is the synthetic zero data point that makes graphs start
+    on the Y axis.
+    """
+    run = recorder.run_information_from_instance(hass, start_time)
+    states = _get_states_with_session(
+        hass, session, start_time, entity_ids, run=run, filters=filters
+    )
+    for state in states:
+        state.last_changed = start_time
+        state.last_updated = start_time
+    return states
+
+
+def _append_entity_states(ent_id, group, ent_results, minimal_response):
+    """Append the rows of one entity, sorted by last_updated, to ent_results."""
+    # Called in a tight loop so cache the function
+    # here
+    _process_timestamp_to_utc_isoformat = process_timestamp_to_utc_isoformat
+
+    domain = split_entity_id(ent_id)[0]
+    if not minimal_response or domain in NEED_ATTRIBUTE_DOMAINS:
+        ent_results.extend(LazyState(db_state) for db_state in group)
+
+    # With minimal response we only provide a native
+    # State for the first and last response. All the states
+    # in-between only provide the "state" and the
+    # "last_changed".
+    if not ent_results:
+        ent_results.append(LazyState(next(group)))
+
+    prev_state = ent_results[-1]
+    initial_state_count = len(ent_results)
+
+    for db_state in group:
+        # With minimal response we do not care about attribute
+        # changes so we can filter out duplicate states
+        if db_state.state == prev_state.state:
+            continue
+
+        ent_results.append(
+            {
+                STATE_KEY: db_state.state,
+                LAST_CHANGED_KEY: _process_timestamp_to_utc_isoformat(
+                    db_state.last_changed
+                ),
+            }
+        )
+        prev_state = db_state
+
+    if prev_state and len(ent_results) != initial_state_count:
+        # There was at least one state change
+        # replace the last minimal state with
+        # a full state
+        ent_results[-1] = LazyState(prev_state)
+
+
 def get_state(hass, utc_point_in_time, entity_id, run=None):
     """Return a state at a specific point in time."""
     states = get_states(hass, utc_point_in_time, (entity_id,), run)
@@ -426,10 +680,13 @@ async def async_setup(hass, config):
     filters = sqlalchemy_filter_from_include_exclude_conf(conf)
 
     hass.data[HISTORY_BAKERY] = baked.bakery()
+    hass.data[HISTORY_FILTERS] = filters
 
     use_include_order = conf.get(CONF_ORDER)
 
     hass.http.register_view(HistoryPeriodView(filters, use_include_order))
+    websocket_api.async_register_command(hass, ws_stream_history_period)
+    websocket_api.async_register_command(hass, ws_get_statistics_during_period)
     hass.components.frontend.async_register_built_in_panel(
         "history", "history", "hass:poll-box"
     )
@@ -492,6 +749,54 @@ class HistoryPeriodView(HomeAssistantView):
 
         hass = request.app["hass"]
 
+        resolution = request.query.get("resolution")
+        if resolution is not None:
+            try:
+                resolution = int(resolution)
+            except ValueError:
+                return self.json_message("Invalid resolution", HTTP_BAD_REQUEST)
+            if not 0 < resolution <= MAX_RESOLUTION or end_time <= start_time:
+                return self.json_message("Invalid resolution", HTTP_BAD_REQUEST)
+            unsupported = [
+                param
+                for param in ("stream", "minimal_response", "skip_initial_state")
+                if param in request.query
+            ]
+            if unsupported:
+                return self.json_message(
+                    f"{', '.join(unsupported)} not supported with resolution",
+                    HTTP_BAD_REQUEST,
+                )
+            return cast(
+                web.Response,
+                await hass.async_add_executor_job(
+                    self._downsampled_states_json,
+                    hass,
+                    start_time,
+                    end_time,
+                    (end_time - start_time) / resolution,
+                    entity_ids,
+                    significant_changes_only,
+                ),
+            )
+
+        if "stream" in request.query:
+            response = web.StreamResponse(headers={CONTENT_TYPE: CONTENT_TYPE_JSON})
+            await response.prepare(request)
+            await hass.async_add_executor_job(
+                self._stream_significant_states_json,
+                hass,
+                response,
+                start_time,
+                end_time,
+                entity_ids,
+                include_start_time_state,
+                significant_changes_only,
+                minimal_response,
+            )
+            await response.write_eof()
+            return response
+
         return cast(
             web.Response,
             await hass.async_add_executor_job(
@@ -540,18 +845,208 @@ class HistoryPeriodView(HomeAssistantView):
         # Optionally reorder the result to respect the ordering given
         # by any entities explicitly included in the configuration.
         if self.use_include_order:
-            sorted_result = []
-            for order_entity in self.filters.included_entities:
-                for state_list in result:
-                    if state_list[0].entity_id == order_entity:
-                        sorted_result.append(state_list)
-                        result.remove(state_list)
-                        break
-            sorted_result.extend(result)
-            result = sorted_result
+            result = self._sort_by_include_order(
+                result, lambda state_list: state_list[0].entity_id
+            )
+
+        return self.json(result)
+
+    def _downsampled_states_json(
+        self,
+        hass,
+        start_time,
+        end_time,
+        bucket,
+        entity_ids,
+        significant_changes_only,
+    ):
+        """Fetch downsampled states as json, with a list of buckets per entity."""
+        result = [
+            [{"entity_id": entity_id, **bucket} for bucket in buckets]
+            for entity_id, buckets in get_downsampled_states(
+                hass,
+                start_time,
+                end_time,
+                bucket,
+                entity_ids,
+                self.filters,
+                significant_changes_only,
+            ).items()
+        ]
+
+        if self.use_include_order:
+            result = self._sort_by_include_order(
+                result, lambda buckets: buckets[0]["entity_id"]
+            )
 
         return self.json(result)
 
+    def _sort_by_include_order(self, result, get_entity_id):
+        """Reorder per entity lists to follow the included entities."""
+        sorted_result = []
+        for order_entity in self.filters.included_entities:
+            for entity_list in result:
+                if get_entity_id(entity_list) == order_entity:
+                    sorted_result.append(entity_list)
+                    result.remove(entity_list)
+                    break
+        sorted_result.extend(result)
+        return sorted_result
+
+    def _stream_significant_states_json(
+        self,
+        hass,
+        response,
+        start_time,
+        end_time,
+        entity_ids,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+    ):
+        """Write significant states to the response one entity at a time.
+
+        The states are not reordered for use_include_order as that would
+        require holding the whole result in memory.
+        """
+
+        def write(data):
+            """Write data and wait until the transport accepted it."""
+            asyncio.run_coroutine_threadsafe(response.write(data), hass.loop).result()
+
+        separator = b"["
+        with session_scope(hass=hass) as session:
+            for ent_results in stream_significant_states(
+                hass,
+                session,
+                start_time,
+                end_time,
+                entity_ids,
+                self.filters,
+                include_start_time_state,
+                significant_changes_only,
+                minimal_response,
+            ):
+                write(separator + JSON_DUMP(ent_results).encode("utf-8"))
+                separator = b","
+
+        write(b"[]" if separator == b"[" else b"]")
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "history/stream_period",
+        vol.Required("start_time"): str,
+        vol.Optional("end_time"): str,
+        vol.Optional("entity_ids"): [cv.entity_id],
+        vol.Optional("include_start_time_state", default=True): bool,
+        vol.Optional("significant_changes_only", default=True): bool,
+        vol.Optional("minimal_response", default=False): bool,
+    }
+)
+@websocket_api.async_response
+async def ws_stream_history_period(hass, connection, msg):
+    """Stream significant states as events, one message per entity.
+
+    A final event with finished set to True is sent after the last entity.
+    """
+    start_time = dt_util.parse_datetime(msg["start_time"])
+    if start_time is None:
+        connection.send_error(msg["id"], "invalid_start_time", "Invalid start_time")
+        return
+    start_time = dt_util.as_utc(start_time)
+
+    end_time = msg.get("end_time")
+    if end_time is None:
+        end_time = start_time + timedelta(days=1)
+    else:
+        end_time = dt_util.parse_datetime(end_time)
+        if end_time is None:
+            connection.send_error(msg["id"], "invalid_end_time", "Invalid end_time")
+            return
+        end_time = dt_util.as_utc(end_time)
+
+    cancelled = threading.Event()
+    connection.subscriptions[msg["id"]] = cancelled.set
+    connection.send_result(msg["id"])
+
+    try:
+        await hass.async_add_executor_job(
+            _stream_history_messages,
+            hass,
+            connection,
+            msg,
+            start_time,
+            end_time,
+            cancelled,
+        )
+    finally:
+        connection.subscriptions.pop(msg["id"], None)
+
+
+def _stream_history_messages(hass, connection, msg, start_time, end_time, cancelled):
+    """Send the states of each entity as soon as they have been read."""
+
+    def send(event):
+        """Encode the message here and hand it over to the event loop."""
+        message = JSON_DUMP(websocket_api.event_message(msg["id"], event))
+        run_callback_threadsafe(hass.loop, connection.send_message, message).result()
+
+    with session_scope(hass=hass) as session:
+        for ent_results in stream_significant_states(
+            hass,
+            session,
+            start_time,
+            end_time,
+            msg.get("entity_ids"),
+            hass.data[HISTORY_FILTERS],
+            msg["include_start_time_state"],
+            msg["significant_changes_only"],
+            msg["minimal_response"],
+        ):
+            if cancelled.is_set():
+                return
+            send({"states": ent_results})
+
+    send({"finished": True})
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "history/statistics_during_period",
+        vol.Required("start_time"): str,
+        vol.Optional("end_time"): str,
+        vol.Optional("entity_ids"): [cv.entity_id],
+        vol.Optional("period", default=PERIOD_HOUR): vol.In([PERIOD_HOUR, PERIOD_DAY]),
+    }
+)
+@websocket_api.async_response
+async def ws_get_statistics_during_period(hass, connection, msg):
+    """Return the hourly or daily rollups of numeric states per entity."""
+    start_time = dt_util.parse_datetime(msg["start_time"])
+    if start_time is None:
+        connection.send_error(msg["id"], "invalid_start_time", "Invalid start_time")
+        return
+    start_time = dt_util.as_utc(start_time)
+
+    end_time = msg.get("end_time")
+    if end_time is not None:
+        end_time = dt_util.parse_datetime(end_time)
+        if end_time is None:
+            connection.send_error(msg["id"], "invalid_end_time", "Invalid end_time")
+            return
+        end_time = dt_util.as_utc(end_time)
+
+    statistics = await hass.async_add_executor_job(
+        statistics_during_period,
+        hass,
+        start_time,
+        end_time,
+        msg.get("entity_ids"),
+        msg["period"],
+    )
+    connection.send_result(msg["id"], statistics)
+
 
 def sqlalchemy_filter_from_include_exclude_conf(conf):
     """Build a sql filter from config."""
@@ -26,6 +26,7 @@ from homeassistant.helpers import (
     config_per_platform,
     config_validation as cv,
     entity_platform,
+    reference_index,
 )
 from homeassistant.helpers.state import async_reproduce_state
 from homeassistant.loader import async_get_integration
@@ -120,32 +121,15 @@ _LOGGER = logging.getLogger(__name__)
 @callback
 def scenes_with_entity(hass: HomeAssistant, entity_id: str) -> List[str]:
     """Return all scenes that reference the entity."""
-    if DATA_PLATFORM not in hass.data:
-        return []
-
-    platform = hass.data[DATA_PLATFORM]
-
-    return [
-        scene_entity.entity_id
-        for scene_entity in platform.entities.values()
-        if entity_id in scene_entity.scene_config.states
-    ]
+    return reference_index.async_get(hass).async_sources_with_entity(
+        entity_id, SCENE_DOMAIN
+    )
 
 
 @callback
 def entities_in_scene(hass: HomeAssistant, entity_id: str) -> List[str]:
     """Return all entities in a scene."""
-    if DATA_PLATFORM not in hass.data:
-        return []
-
-    platform = hass.data[DATA_PLATFORM]
-
-    entity = platform.entities.get(entity_id)
-
-    if entity is None:
-        return []
-
-    return list(entity.scene_config.states)
+    return reference_index.async_get(hass).async_entities(entity_id)
 
 
 async def async_setup_platform(hass, config, async_add_entities, discovery_info=None):
@@ -306,6 +290,16 @@ class HomeAssistantScene(Scene):
             attributes[CONF_ID] = unique_id
         return attributes
 
+    async def async_added_to_hass(self) -> None:
+        """Add the entities of the scene to the reference index."""
+        reference_index.async_get(self.hass).async_set(
+            self.entity_id, self.scene_config.states
+        )
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Remove the scene from the reference index."""
+        reference_index.async_get(self.hass).async_remove(self.entity_id)
+
     async def async_activate(self, **kwargs: Any) -> None:
         """Activate scene. Try to get entities into requested state."""
         await async_reproduce_state(
@@ -56,7 +56,6 @@ from .const import (
     SERV_SPEAKER,
     SERV_STATELESS_PROGRAMMABLE_SWITCH,
 )
-from .img_util import scale_jpeg_camera_image
 from .util import pid_is_alive
 
 _LOGGER = logging.getLogger(__name__)
@@ -444,12 +443,18 @@ class Camera(HomeAccessory, PyhapCamera):
         return True
 
     def get_snapshot(self, image_size):
-        """Return a jpeg of a snapshot from the camera."""
-        return scale_jpeg_camera_image(
+        """Return a jpeg of a snapshot from the camera.
+
+        The camera caches scaled snapshots, so concurrent requests for the
+        same size are only scaled once.
+        """
+        return (
             asyncio.run_coroutine_threadsafe(
-                self.hass.components.camera.async_get_image(self.entity_id),
+                self.hass.components.camera.async_get_image(
+                    self.entity_id, width=image_size["image-width"]
+                ),
                 self.hass.loop,
-            ).result(),
-            image_size["image-width"],
-            image_size["image-height"],
+            )
+            .result()
+            .content
         )
@@ -5,7 +5,7 @@ import logging
 import os
 import ssl
 from traceback import extract_stack
-from typing import Dict, Optional, cast
+from typing import Dict, List, Optional, cast
 
 from aiohttp import web
 from aiohttp.web_exceptions import HTTPMovedPermanently
@@ -312,6 +312,7 @@ class HomeAssistantHTTP:
         setup_cors(app, cors_origins)
 
         self.hass = hass
+        self._static_resources: List[CachingStaticResource] = []
         self.ssl_certificate = ssl_certificate
         self.ssl_peer_certificate = ssl_peer_certificate
         self.ssl_key = ssl_key
@@ -365,10 +366,11 @@ class HomeAssistantHTTP:
         """Register a folder or file to serve as a static path."""
         if os.path.isdir(path):
             if cache_headers:
-                resource = CachingStaticResource
+                resource = CachingStaticResource(url_path, path)
+                self._static_resources.append(resource)
             else:
-                resource = web.StaticResource
-            self.app.router.register_resource(resource(url_path, path))
+                resource = web.StaticResource(url_path, path)
+            self.app.router.register_resource(resource)
             return
 
         if cache_headers:
@@ -433,6 +435,10 @@ class HomeAssistantHTTP:
                 "Failed to create HTTP server at port %d: %s", self.server_port, error
             )
 
+        # Compress static files for the first clients in the background
+        for resource in self._static_resources:
+            self.hass.async_create_task(resource.async_precompress(self.hass))
+
     async def stop(self):
         """Stop the aiohttp server."""
         await self.site.stop()
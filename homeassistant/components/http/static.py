@@ -1,8 +1,15 @@
 """Static file handling for HTTP component."""
+import asyncio
+from collections import OrderedDict
+import gzip
+import mimetypes
+import os
 from pathlib import Path
+import threading
+from typing import Optional, Tuple
 
 from aiohttp import hdrs
-from aiohttp.web import FileResponse
+from aiohttp.web import FileResponse, Request, Response, StreamResponse
 from aiohttp.web_exceptions import HTTPForbidden, HTTPNotFound
 from aiohttp.web_urldispatcher import StaticResource
 
@@ -11,12 +18,174 @@ from aiohttp.web_urldispatcher import StaticResource
 CACHE_TIME = 31 * 86400  # = 1 month
 CACHE_HEADERS = {hdrs.CACHE_CONTROL: f"public, max-age={CACHE_TIME}"}
 
+# Files served compressed when there is no precompressed sibling
+COMPRESSIBLE_EXTENSIONS = {
+    ".css",
+    ".html",
+    ".js",
+    ".json",
+    ".map",
+    ".svg",
+    ".txt",
+    ".xml",
+}
+MIN_COMPRESS_SIZE = 1024
+# Compressed bodies kept in memory, shared by all static paths
+COMPRESSED_CACHE_MAX_BYTES = 16 * 1024 * 1024
+# Precompressed siblings in order of preference
+ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+# Number of resolved file paths kept per static path
+RESOLVE_CACHE_SIZE = 1024
+
+HTTP_NOT_MODIFIED = 304
+
+
+def file_etag(stat: os.stat_result) -> str:
+    """Return an ETag for a file based on its modification time and size."""
+    return f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Return if the ETag is in the If-None-Match header of the request."""
+    if_none_match = request.headers.get(hdrs.IF_NONE_MATCH)
+    if if_none_match is None:
+        return False
+    return if_none_match.strip() == "*" or etag in (
+        tag.strip() for tag in if_none_match.split(",")
+    )
+
+
+class CompressedCache:
+    """Thread safe LRU of compressed file bodies bounded by size."""
+
+    def __init__(self, max_bytes: int = COMPRESSED_CACHE_MAX_BYTES) -> None:
+        """Initialize the cache."""
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._bodies: "OrderedDict[Tuple[Path, str, str], bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple[Path, str, str]) -> Optional[bytes]:
+        """Return a cached body."""
+        with self._lock:
+            body = self._bodies.get(key)
+            if body is not None:
+                self._bodies.move_to_end(key)
+            return body
+
+    def set(self, key: Tuple[Path, str, str], body: bytes) -> bool:
+        """Cache a body, return False if the cache is full."""
+        with self._lock:
+            if len(body) > self.max_bytes:
+                return False
+            old = self._bodies.pop(key, None)
+            if old is not None:
+                self.size -= len(old)
+            self._bodies[key] = body
+            self.size += len(body)
+            while self.size > self.max_bytes:
+                _, evicted = self._bodies.popitem(last=False)
+                self.size -= len(evicted)
+            return True
+
+    def is_full(self) -> bool:
+        """Return if adding more bodies will evict others."""
+        return self.size >= self.max_bytes
+
+
+COMPRESSED_CACHE = CompressedCache()
+
+
+def _compressed_body(
+    filepath: Path, stat: os.stat_result, accept_encoding: str
+) -> Optional[Tuple[str, bytes]]:
+    """Return the encoding and compressed body to serve for a file.
+
+    Precompressed siblings are preferred, compressible files without one are
+    compressed once and cached. Runs in the executor.
+    """
+    etag = file_etag(stat)
+
+    for encoding, suffix in ENCODINGS:
+        if encoding not in accept_encoding:
+            continue
+        key = (filepath, encoding, etag)
+        body = COMPRESSED_CACHE.get(key)
+        if body is not None:
+            return encoding, body
+        sibling = filepath.with_name(filepath.name + suffix)
+        try:
+            body = sibling.read_bytes()
+        except OSError:
+            continue
+        COMPRESSED_CACHE.set(key, body)
+        return encoding, body
+
+    if "gzip" not in accept_encoding or not _is_compressible(filepath, stat):
+        return None
+
+    key = (filepath, "gzip", etag)
+    body = COMPRESSED_CACHE.get(key)
+    if body is None:
+        body = gzip.compress(filepath.read_bytes())
+        COMPRESSED_CACHE.set(key, body)
+    return "gzip", body
+
+
+def _is_compressible(filepath: Path, stat: os.stat_result) -> bool:
+    """Return if a file is worth compressing."""
+    return (
+        filepath.suffix in COMPRESSIBLE_EXTENSIONS and stat.st_size >= MIN_COMPRESS_SIZE
+    )
+
+
+def precompress_directory(directory: Path) -> int:
+    """Compress the compressible files in a directory into the cache.
+
+    Files with a precompressed sibling are skipped. Returns the number of
+    files compressed. Runs in the executor.
+    """
+    compressed = 0
+    for root, _, files in os.walk(directory):
+        names = set(files)
+        for name in files:
+            if COMPRESSED_CACHE.is_full():
+                return compressed
+            if any(name + suffix in names for _, suffix in ENCODINGS):
+                continue
+            filepath = Path(root, name)
+            try:
+                stat = filepath.stat()
+                if not _is_compressible(filepath, stat):
+                    continue
+                key = (filepath, "gzip", file_etag(stat))
+                if COMPRESSED_CACHE.get(key) is None:
+                    COMPRESSED_CACHE.set(key, gzip.compress(filepath.read_bytes()))
+                    compressed += 1
+            except OSError:
+                continue
+    return compressed
+
 
 class CachingStaticResource(StaticResource):
-    """Static Resource handler that will add cache headers."""
+    """Static Resource handler that will add cache headers.
+
+    Files are served with an ETag, compressed when the client accepts it.
+    """
+
+    def __init__(self, *args, **kwargs):
+        """Initialize the resource."""
+        super().__init__(*args, **kwargs)
+        self._resolved: "OrderedDict[str, Path]" = OrderedDict()
 
-    async def _handle(self, request):
+    def _resolve(self, request: Request) -> Path:
+        """Resolve the requested file."""
         rel_url = request.match_info["filename"]
+        filepath = self._resolved.get(rel_url)
+        if filepath is not None:
+            self._resolved.move_to_end(rel_url)
+            return filepath
+
         try:
             filename = Path(rel_url)
             if filename.anchor:
@@ -35,14 +204,58 @@ class CachingStaticResource(StaticResource):
             request.app.logger.exception(error)
             raise HTTPNotFound() from error
 
+        if filepath.is_file():
+            self._resolved[rel_url] = filepath
+            if len(self._resolved) > RESOLVE_CACHE_SIZE:
+                self._resolved.popitem(last=False)
+
+        return filepath
+
+    async def _handle(self, request: Request) -> StreamResponse:
+        filepath = self._resolve(request)
+
         # on opening a dir, load its contents if allowed
         if filepath.is_dir():
             return await super()._handle(request)
-        if filepath.is_file():
+
+        loop = asyncio.get_running_loop()
+        try:
+            stat = await loop.run_in_executor(None, filepath.stat)
+        except OSError as error:
+            self._resolved.pop(request.match_info["filename"], None)
+            raise HTTPNotFound() from error
+
+        etag = file_etag(stat)
+        headers = {**CACHE_HEADERS, hdrs.ETAG: etag}
+
+        if etag_matches(request, etag):
+            return Response(status=HTTP_NOT_MODIFIED, headers=headers)
+
+        accept_encoding = request.headers.get(hdrs.ACCEPT_ENCODING, "").lower()
+        compressed = None
+        if accept_encoding:
+            compressed = await loop.run_in_executor(
+                None, _compressed_body, filepath, stat, accept_encoding
+            )
+
+        if compressed is None:
             return FileResponse(
                 filepath,
                 chunk_size=self._chunk_size,
                 # type ignore: https://github.com/aio-libs/aiohttp/pull/3976
-                headers=CACHE_HEADERS,  # type: ignore
+                headers=headers,  # type: ignore
             )
-        raise HTTPNotFound
+
+        encoding, body = compressed
+        content_type, _ = mimetypes.guess_type(str(filepath))
+        headers[hdrs.CONTENT_ENCODING] = encoding
+        headers[hdrs.VARY] = hdrs.ACCEPT_ENCODING
+        return Response(
+            body=body,
+            content_type=content_type or "application/octet-stream",
+            headers=headers,
+        )
+
+    async def async_precompress(self, hass) -> None:
+        """Compress the files of this resource in the executor."""
+        await hass.async_add_executor_job(precompress_directory, self._directory)
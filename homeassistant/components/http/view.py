@@ -1,10 +1,11 @@
 """Support for views."""
 import asyncio
+import hashlib
 import json
 import logging
 from typing import Any, Callable, List, Optional
 
-from aiohttp import web
+from aiohttp import hdrs, web
 from aiohttp.typedefs import LooseHeaders
 from aiohttp.web_exceptions import (
     HTTPBadRequest,
@@ -19,6 +20,7 @@ from homeassistant.core import Context, is_callback
 from homeassistant.helpers.json import JSONEncoder
 
 from .const import KEY_AUTHENTICATED, KEY_HASS
+from .static import HTTP_NOT_MODIFIED, MIN_COMPRESS_SIZE, etag_matches
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -46,20 +48,34 @@ class HomeAssistantView:
         result: Any,
         status_code: int = HTTP_OK,
         headers: Optional[LooseHeaders] = None,
+        request: Optional[web.Request] = None,
     ) -> web.Response:
-        """Return a JSON response."""
+        """Return a JSON response.
+
+        When the request is passed, the response gets an ETag and a client
+        that already has the result gets a 304 without a body.
+        """
         try:
             msg = json.dumps(result, cls=JSONEncoder, allow_nan=False).encode("UTF-8")
         except (ValueError, TypeError) as err:
             _LOGGER.error("Unable to serialize to JSON: %s\n%s", err, result)
             raise HTTPInternalServerError from err
+
+        if request is not None and status_code == HTTP_OK:
+            etag = f'"{hashlib.sha1(msg).hexdigest()}"'
+            headers = {**(headers or {}), hdrs.ETAG: etag}
+            if etag_matches(request, etag):
+                return web.Response(status=HTTP_NOT_MODIFIED, headers=headers)
+
         response = web.Response(
             body=msg,
             content_type=CONTENT_TYPE_JSON,
             status=status_code,
             headers=headers,
         )
-        response.enable_compression()
+        # Compressing small bodies costs more than sending them
+        if len(msg) >= MIN_COMPRESS_SIZE:
+            response.enable_compression()
         return response
 
     def json_message(
@@ -1,9 +1,11 @@
 """Event parser and human readable log generator."""
+from collections import OrderedDict
 from datetime import timedelta
 from itertools import groupby
 import json
 import logging
 import re
+import threading
 
 import sqlalchemy
 from sqlalchemy.orm import aliased
@@ -16,6 +18,7 @@ from homeassistant.components.history import sqlalchemy_filter_from_include_excl
 from homeassistant.components.http import HomeAssistantView
 from homeassistant.components.recorder.models import (
     Events,
+    StateAttributes,
     States,
     process_timestamp,
     process_timestamp_to_utc_isoformat,
@@ -71,6 +74,10 @@ DOMAIN = "logbook"
 
 GROUP_BY_MINUTES = 15
 
+# Number of context origins and entities remembered between requests
+CONTEXT_CACHE_SIZE = 8192
+ENTITY_ATTRIBUTE_CACHE_SIZE = 4096
+
 EMPTY_JSON_OBJECT = "{}"
 UNIT_OF_MEASUREMENT_JSON = '"unit_of_measurement":'
 
@@ -104,6 +111,11 @@ EVENT_COLUMNS = [
     Events.context_user_id,
 ]
 
+# Attributes are stored inline on old rows and shared on new ones
+STATE_ATTRIBUTES = sqlalchemy.func.coalesce(
+    States.attributes, StateAttributes.shared_attrs
+)
+
 SCRIPT_AUTOMATION_EVENTS = [EVENT_AUTOMATION_TRIGGERED, EVENT_SCRIPT_STARTED]
 
 LOG_MESSAGE_SCHEMA = vol.Schema(
@@ -169,7 +181,26 @@ async def async_setup(hass, config):
         filters = None
         entities_filter = None
 
-    hass.http.register_view(LogbookView(conf, filters, entities_filter))
+    entity_attr_cache = EntityAttributeCache(hass, ENTITY_ATTRIBUTE_CACHE_SIZE)
+    context_lookup = ContextLookup(CONTEXT_CACHE_SIZE)
+
+    @callback
+    def _async_invalidate_entity_attributes(event):
+        """Drop cached attributes of entities that changed them."""
+        old_state = event.data.get("old_state")
+        new_state = event.data.get("new_state")
+        if (
+            old_state is None
+            or new_state is None
+            or old_state.attributes != new_state.attributes
+        ):
+            entity_attr_cache.invalidate(event.data[ATTR_ENTITY_ID])
+
+    hass.bus.async_listen(EVENT_STATE_CHANGED, _async_invalidate_entity_attributes)
+
+    hass.http.register_view(
+        LogbookView(conf, filters, entities_filter, entity_attr_cache, context_lookup)
+    )
 
     hass.services.async_register(DOMAIN, "log", log_message, schema=LOG_MESSAGE_SCHEMA)
 
@@ -196,11 +227,15 @@ class LogbookView(HomeAssistantView):
     name = "api:logbook"
     extra_urls = ["/api/logbook/{datetime}"]
 
-    def __init__(self, config, filters, entities_filter):
+    def __init__(
+        self, config, filters, entities_filter, entity_attr_cache, context_lookup
+    ):
         """Initialize the logbook view."""
         self.config = config
         self.filters = filters
         self.entities_filter = entities_filter
+        self.entity_attr_cache = entity_attr_cache
+        self.context_lookup = context_lookup
 
     async def get(self, request, datetime=None):
         """Retrieve logbook entries."""
@@ -238,6 +273,15 @@ class LogbookView(HomeAssistantView):
             if end_day is None:
                 return self.json_message("Invalid end_time", HTTP_BAD_REQUEST)
 
+        limit = request.query.get("limit")
+        if limit is not None:
+            try:
+                limit = int(limit)
+            except ValueError:
+                limit = 0
+            if limit < 1:
+                return self.json_message("Invalid limit", HTTP_BAD_REQUEST)
+
         hass = request.app["hass"]
 
         entity_matches_only = "entity_matches_only" in request.query
@@ -253,6 +297,9 @@ class LogbookView(HomeAssistantView):
                     self.filters,
                     self.entities_filter,
                     entity_matches_only,
+                    limit,
+                    self.entity_attr_cache,
+                    self.context_lookup,
                 )
             )
 
@@ -431,17 +478,27 @@ def _get_events(
     filters=None,
     entities_filter=None,
     entity_matches_only=False,
+    limit=None,
+    entity_attr_cache=None,
+    context_lookup=None,
 ):
-    """Get events for a period of time."""
+    """Get events for a period of time.
+
+    With a limit, only the first limit entries are returned, extended with
+    the entries that happened at the same time as the last one. The time of
+    the last entry can be used as the start of the next page.
+    """
 
-    entity_attr_cache = EntityAttributeCache(hass)
-    context_lookup = {None: None}
+    if entity_attr_cache is None:
+        entity_attr_cache = EntityAttributeCache(hass)
+    if context_lookup is None:
+        context_lookup = ContextLookup()
 
     def yield_events(query):
         """Yield Events that are not filtered away."""
         for row in query.yield_per(1000):
             event = LazyEventPartialState(row)
-            context_lookup.setdefault(event.context_id, event)
+            context_lookup.add(event)
             if event.event_type == EVENT_CALL_SERVICE:
                 continue
             if event.event_type == EVENT_STATE_CHANGED or _keep_event(
@@ -487,9 +544,22 @@ def _get_events(
 
         query = query.order_by(Events.time_fired)
 
-        return list(
-            humanify(hass, yield_events(query), entity_attr_cache, context_lookup)
-        )
+        entries = humanify(hass, yield_events(query), entity_attr_cache, context_lookup)
+
+        if limit is None:
+            return list(entries)
+
+        return _first_entries(entries, limit)
+
+
+def _first_entries(entries, limit):
+    """Return the first limit entries without splitting entries of the same time."""
+    result = []
+    for entry in entries:
+        if len(result) >= limit and entry["when"] != result[-1]["when"]:
+            break
+        result.append(entry)
+    return result
 
 
 def _generate_events_query(session):
@@ -498,7 +568,7 @@ def _generate_events_query(session):
         States.state,
         States.entity_id,
         States.domain,
-        States.attributes,
+        STATE_ATTRIBUTES.label("attributes"),
     )
 
 
@@ -517,6 +587,9 @@ def _generate_states_query(session, start_day, end_day, old_state, entity_ids):
         _generate_events_query(session)
         .outerjoin(Events, (States.event_id == Events.event_id))
         .outerjoin(old_state, (States.old_state_id == old_state.state_id))
+        .outerjoin(
+            StateAttributes, (States.attributes_id == StateAttributes.attributes_id)
+        )
         .filter(_missing_state_matcher(old_state))
         .filter(_continuous_entity_matcher())
         .filter((States.last_updated > start_day) & (States.last_updated < end_day))
@@ -531,6 +604,9 @@ def _apply_events_types_and_states_filter(hass, query, old_state):
     events_query = (
         query.outerjoin(States, (Events.event_id == States.event_id))
         .outerjoin(old_state, (States.old_state_id == old_state.state_id))
+        .outerjoin(
+            StateAttributes, (States.attributes_id == StateAttributes.attributes_id)
+        )
         .filter(
             (Events.event_type != EVENT_STATE_CHANGED)
             | _missing_state_matcher(old_state)
@@ -560,7 +636,7 @@ def _continuous_entity_matcher():
     #
     return sqlalchemy.or_(
         sqlalchemy.not_(States.domain.in_(CONTINUOUS_DOMAINS)),
-        sqlalchemy.not_(States.attributes.contains(UNIT_OF_MEASUREMENT_JSON)),
+        sqlalchemy.not_(STATE_ATTRIBUTES.contains(UNIT_OF_MEASUREMENT_JSON)),
     )
 
 
@@ -863,34 +939,86 @@ class LazyEventPartialState:
         return self._time_fired_isoformat
 
 
+class ContextLookup:
+    """Lookup of the event that started a context.
+
+    The first event seen for a context is remembered as its origin. When
+    the lookup is kept between requests, an earlier event of a context
+    replaces a later one and the least recently added contexts are dropped
+    once max_size is reached.
+    """
+
+    def __init__(self, max_size=None):
+        """Init the lookup."""
+        self._max_size = max_size
+        self._lookup = OrderedDict()
+        self._lock = threading.Lock()
+
+    def add(self, event):
+        """Remember event as the origin of its context if it is the first."""
+        context_id = event.context_id
+        if context_id is None:
+            return
+
+        with self._lock:
+            origin = self._lookup.get(context_id)
+            if origin is None:
+                self._lookup[context_id] = event
+            elif origin is not event and origin.time_fired > event.time_fired:
+                self._lookup[context_id] = event
+
+            if self._max_size is None:
+                return
+
+            self._lookup.move_to_end(context_id)
+            if len(self._lookup) > self._max_size:
+                self._lookup.popitem(last=False)
+
+    def get(self, context_id):
+        """Return the event that started a context."""
+        return self._lookup.get(context_id)
+
+
 class EntityAttributeCache:
     """A cache to lookup static entity_id attribute.
 
     This class should not be used to lookup attributes
-    that are expected to change state.
+    that are expected to change state. Entries of entities
+    that change their attributes have to be invalidated.
     """
 
-    def __init__(self, hass):
+    def __init__(self, hass, max_entities=None):
         """Init the cache."""
         self._hass = hass
+        self._max_entities = max_entities
         self._cache = {}
 
+    def invalidate(self, entity_id):
+        """Forget the cached attributes of an entity."""
+        self._cache.pop(entity_id, None)
+
     def get(self, entity_id, attribute, event):
         """Lookup an attribute for an entity or get it from the cache."""
-        if entity_id in self._cache:
-            if attribute in self._cache[entity_id]:
-                return self._cache[entity_id][attribute]
-        else:
-            self._cache[entity_id] = {}
+        entity_cache = self._cache.get(entity_id)
+        if entity_cache is None:
+            if (
+                self._max_entities is not None
+                and len(self._cache) >= self._max_entities
+            ):
+                self._cache.clear()
+            entity_cache = self._cache[entity_id] = {}
+        elif attribute in entity_cache:
+            return entity_cache[attribute]
 
         current_state = self._hass.states.get(entity_id)
         if current_state:
             # Try the current state as its faster than decoding the
             # attributes
-            self._cache[entity_id][attribute] = current_state.attributes.get(attribute)
+            value = current_state.attributes.get(attribute)
         else:
             # If the entity has been removed, decode the attributes
             # instead
-            self._cache[entity_id][attribute] = event.attributes.get(attribute)
+            value = event.attributes.get(attribute)
 
-        return self._cache[entity_id][attribute]
+        entity_cache[attribute] = value
+        return value
@@ -1,7 +1,5 @@
 """Component to interface with various media players."""
-import asyncio
 import base64
-import collections
 from datetime import timedelta
 import functools as ft
 import hashlib
@@ -11,9 +9,8 @@ from typing import List, Optional
 from urllib.parse import urlparse
 
 from aiohttp import web
-from aiohttp.hdrs import CACHE_CONTROL, CONTENT_TYPE
+from aiohttp.hdrs import CACHE_CONTROL
 from aiohttp.typedefs import LooseHeaders
-import async_timeout
 import voluptuous as vol
 
 from homeassistant.components import websocket_api
@@ -26,7 +23,6 @@ from homeassistant.components.websocket_api.const import (
 from homeassistant.const import (
     HTTP_INTERNAL_SERVER_ERROR,
     HTTP_NOT_FOUND,
-    HTTP_OK,
     HTTP_UNAUTHORIZED,
     SERVICE_MEDIA_NEXT_TRACK,
     SERVICE_MEDIA_PAUSE,
@@ -47,7 +43,6 @@ from homeassistant.const import (
     STATE_OFF,
     STATE_PLAYING,
 )
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.config_validation import (  # noqa: F401
     PLATFORM_SCHEMA,
@@ -111,6 +106,7 @@ from .const import (
     SUPPORT_VOLUME_STEP,
 )
 from .errors import BrowseError
+from .image_cache import ImageCache
 
 # mypy: allow-untyped-defs, no-check-untyped-defs
 
@@ -119,12 +115,9 @@ _RND = SystemRandom()
 
 ENTITY_ID_FORMAT = DOMAIN + ".{}"
 
-CACHE_IMAGES = "images"
-CACHE_MAXSIZE = "maxsize"
-CACHE_LOCK = "lock"
-CACHE_URL = "url"
-CACHE_CONTENT = "content"
-ENTITY_IMAGE_CACHE = {CACHE_IMAGES: collections.OrderedDict(), CACHE_MAXSIZE: 16}
+DATA_IMAGE_CACHE = "media_player_image_cache"
+# Create this directory in the config directory to keep images across restarts
+IMAGE_CACHE_DIR = ".media_player_cache"
 
 SCAN_INTERVAL = timedelta(seconds=10)
 
@@ -831,41 +824,18 @@ class MediaPlayerEntity(Entity):
 async def _async_fetch_image(hass, url):
     """Fetch image.
 
-    Images are cached in memory (the images are typically 10-100kB in size).
+    Images are cached in memory and, if enabled, on disk.
     """
-    cache_images = ENTITY_IMAGE_CACHE[CACHE_IMAGES]
-    cache_maxsize = ENTITY_IMAGE_CACHE[CACHE_MAXSIZE]
-
     if urlparse(url).hostname is None:
         url = f"{get_url(hass)}{url}"
 
-    if url not in cache_images:
-        cache_images[url] = {CACHE_LOCK: asyncio.Lock()}
-
-    async with cache_images[url][CACHE_LOCK]:
-        if CACHE_CONTENT in cache_images[url]:
-            return cache_images[url][CACHE_CONTENT]
-
-        content, content_type = (None, None)
-        websession = async_get_clientsession(hass)
-        try:
-            with async_timeout.timeout(10):
-                response = await websession.get(url)
-
-                if response.status == HTTP_OK:
-                    content = await response.read()
-                    content_type = response.headers.get(CONTENT_TYPE)
-                    if content_type:
-                        content_type = content_type.split(";")[0]
-                    cache_images[url][CACHE_CONTENT] = content, content_type
-
-        except asyncio.TimeoutError:
-            pass
-
-        while len(cache_images) > cache_maxsize:
-            cache_images.popitem(last=False)
+    cache = hass.data.get(DATA_IMAGE_CACHE)
+    if cache is None:
+        cache = hass.data[DATA_IMAGE_CACHE] = ImageCache(
+            hass, disk_dir=hass.config.path(IMAGE_CACHE_DIR)
+        )
 
-        return content, content_type
+    return await cache.async_get(url)
 
 
 class MediaPlayerImageView(HomeAssistantView):
@@ -0,0 +1,260 @@
+"""Cache for media player artwork."""
+import asyncio
+import collections
+import hashlib
+import json
+import logging
+import os
+import time
+from typing import Dict, Optional, Tuple
+
+from aiohttp import hdrs
+import async_timeout
+
+from homeassistant.const import HTTP_OK
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+_LOGGER = logging.getLogger(__name__)
+
+HTTP_NOT_MODIFIED = 304
+
+# Images are typically 10-100kB in size
+CACHE_MAX_BYTES = 8 * 1024 * 1024
+DISK_CACHE_MAX_BYTES = 64 * 1024 * 1024
+# Cached images older than this are revalidated with the server
+CACHE_REVALIDATE_AFTER = 3600
+FETCH_TIMEOUT = 10
+
+ImageResult = Tuple[Optional[bytes], Optional[str]]
+
+
+class CachedImage:
+    """An image and the validators returned by the server."""
+
+    __slots__ = ("content", "content_type", "etag", "last_modified", "fetched")
+
+    def __init__(
+        self,
+        content: bytes,
+        content_type: Optional[str],
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        fetched: float = 0,
+    ) -> None:
+        """Initialize the cached image."""
+        self.content = content
+        self.content_type = content_type
+        self.etag = etag
+        self.last_modified = last_modified
+        self.fetched = fetched
+
+    def as_dict(self) -> dict:
+        """Return the metadata of the image as a dictionary."""
+        return {
+            "content_type": self.content_type,
+            "etag": self.etag,
+            "last_modified": self.last_modified,
+            "fetched": self.fetched,
+        }
+
+
+class ImageCache:
+    """LRU cache of images bounded by size, with an optional disk tier.
+
+    The disk tier is used when disk_dir exists.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        max_bytes: int = CACHE_MAX_BYTES,
+        disk_dir: Optional[str] = None,
+        disk_max_bytes: int = DISK_CACHE_MAX_BYTES,
+    ) -> None:
+        """Initialize the cache."""
+        self.hass = hass
+        self.max_bytes = max_bytes
+        self.disk_dir = disk_dir
+        self.disk_max_bytes = disk_max_bytes
+        self.size = 0
+        self._images: "collections.OrderedDict[str, CachedImage]" = (
+            collections.OrderedDict()
+        )
+        self._fetches: Dict[str, asyncio.Future] = {}
+
+    async def async_get(self, url: str) -> ImageResult:
+        """Return the content and content type of the image at url."""
+        image = self._images.get(url)
+
+        if image is not None and time.time() - image.fetched < CACHE_REVALIDATE_AFTER:
+            self._images.move_to_end(url)
+            return image.content, image.content_type
+
+        if url not in self._fetches:
+            self._fetches[url] = self.hass.async_create_task(
+                self._async_fetch(url, image)
+            )
+
+        # A request timing out must not cancel the fetch for the others
+        return await asyncio.shield(self._fetches[url])
+
+    async def _async_fetch(self, url: str, image: Optional[CachedImage]) -> ImageResult:
+        """Fetch an image, revalidating the cached one if there is one."""
+        try:
+            if image is None and self.disk_dir is not None:
+                image = await self.hass.async_add_executor_job(self._load, url)
+
+            if (
+                image is not None
+                and time.time() - image.fetched < CACHE_REVALIDATE_AFTER
+            ):
+                fetched: Optional[CachedImage] = image
+            else:
+                fetched = await self._async_request(url, image)
+        finally:
+            del self._fetches[url]
+
+        if fetched is None:
+            # Serve the stale image rather than nothing
+            if image is None:
+                return None, None
+            fetched = image
+        else:
+            self._async_store(url, fetched)
+
+        return fetched.content, fetched.content_type
+
+    async def _async_request(
+        self, url: str, image: Optional[CachedImage]
+    ) -> Optional[CachedImage]:
+        """Request an image from the server."""
+        headers = {}
+        if image is not None:
+            if image.etag:
+                headers[hdrs.IF_NONE_MATCH] = image.etag
+            if image.last_modified:
+                headers[hdrs.IF_MODIFIED_SINCE] = image.last_modified
+
+        websession = async_get_clientsession(self.hass)
+        try:
+            with async_timeout.timeout(FETCH_TIMEOUT):
+                response = await websession.get(url, headers=headers)
+
+                if response.status == HTTP_NOT_MODIFIED and image is not None:
+                    image.fetched = time.time()
+                    if self.disk_dir is not None:
+                        self.hass.async_add_executor_job(self._save, url, image, False)
+                    return image
+
+                if response.status != HTTP_OK:
+                    return None
+
+                content = await response.read()
+        except asyncio.TimeoutError:
+            return None
+
+        content_type = response.headers.get(hdrs.CONTENT_TYPE)
+        if content_type:
+            content_type = content_type.split(";")[0]
+
+        fetched = CachedImage(
+            content,
+            content_type,
+            response.headers.get(hdrs.ETAG),
+            response.headers.get(hdrs.LAST_MODIFIED),
+            time.time(),
+        )
+        if self.disk_dir is not None:
+            self.hass.async_add_executor_job(self._save, url, fetched, True)
+        return fetched
+
+    def _async_store(self, url: str, image: CachedImage) -> None:
+        """Store an image in memory, evicting the least recently used ones."""
+        old = self._images.pop(url, None)
+        if old is not None:
+            self.size -= len(old.content)
+
+        if len(image.content) > self.max_bytes:
+            return
+
+        self._images[url] = image
+        self.size += len(image.content)
+
+        while self.size > self.max_bytes:
+            _, evicted = self._images.popitem(last=False)
+            self.size -= len(evicted.content)
+
+    def _disk_path(self, url: str) -> str:
+        """Return the path of the cached image on disk, without extension."""
+        assert self.disk_dir is not None
+        return os.path.join(
+            self.disk_dir, hashlib.sha256(url.encode("utf-8")).hexdigest()
+        )
+
+    def _load(self, url: str) -> Optional[CachedImage]:
+        """Load an image from disk."""
+        if not os.path.isdir(self.disk_dir):  # type: ignore
+            return None
+
+        path = self._disk_path(url)
+        try:
+            with open(f"{path}.json", encoding="utf-8") as fdesc:
+                meta = json.load(fdesc)
+            with open(path, "rb") as fdesc:
+                content = fdesc.read()
+            # Keep recently used images when trimming the cache
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as err:
+            _LOGGER.warning("Unable to load cached image for %s: %s", url, err)
+            return None
+
+        return CachedImage(
+            content,
+            meta.get("content_type"),
+            meta.get("etag"),
+            meta.get("last_modified"),
+            meta.get("fetched", 0),
+        )
+
+    def _save(self, url: str, image: CachedImage, write_content: bool) -> None:
+        """Write an image to disk and trim the disk cache."""
+        if not os.path.isdir(self.disk_dir):  # type: ignore
+            return
+
+        path = self._disk_path(url)
+        try:
+            if write_content:
+                with open(f"{path}.tmp", "wb") as fdesc:
+                    fdesc.write(image.content)
+                os.replace(f"{path}.tmp", path)
+            with open(f"{path}.json", "w", encoding="utf-8") as fdesc:
+                json.dump(image.as_dict(), fdesc)
+        except OSError as err:
+            _LOGGER.warning("Unable to cache image for %s: %s", url, err)
+            return
+
+        self._trim_disk()
+
+    def _trim_disk(self) -> None:
+        """Remove the least recently used images above the disk size limit."""
+        files = []
+        total = 0
+        for entry in os.scandir(self.disk_dir):
+            if not entry.is_file() or entry.name.endswith((".json", ".tmp")):
+                continue
+            stat = entry.stat()
+            files.append((stat.st_mtime, stat.st_size, entry.path))
+            total += stat.st_size
+
+        files.sort()
+        while total > self.disk_max_bytes and files:
+            _, size, path = files.pop(0)
+            total -= size
+            for remove in (path, f"{path}.json"):
+                try:
+                    os.remove(remove)
+                except FileNotFoundError:
+                    pass
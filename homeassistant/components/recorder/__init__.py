@@ -1,6 +1,6 @@
 """Support for recording details."""
 import asyncio
-from collections import namedtuple
+from collections import OrderedDict, namedtuple
 import concurrent.futures
 from datetime import datetime
 import logging
@@ -36,7 +36,8 @@ import homeassistant.util.dt as dt_util
 
 from . import migration, purge
 from .const import CONF_DB_INTEGRITY_CHECK, DATA_INSTANCE, DOMAIN, SQLITE_URL_PREFIX
-from .models import Base, Events, RecorderRuns, States
+from .models import Base, Events, RecorderRuns, StateAttributes, States
+from .statistics import StatisticsCompiler
 from .util import session_scope, validate_or_move_away_sqlite_database
 
 _LOGGER = logging.getLogger(__name__)
@@ -193,6 +194,21 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     return await instance.async_db_ready
 
 
+# Number of serialized attribute sets whose attributes_id is kept in memory
+STATE_ATTRIBUTES_ID_CACHE_SIZE = 2048
+# Columns written when states are inserted, created uses its default
+STATE_INSERT_COLUMNS = (
+    "domain",
+    "entity_id",
+    "state",
+    "attributes",
+    "event_id",
+    "last_changed",
+    "last_updated",
+    "old_state_id",
+    "attributes_id",
+)
+
 PurgeTask = namedtuple("PurgeTask", ["keep_days", "repack"])
 
 
@@ -233,13 +249,18 @@ class Recorder(threading.Thread):
         self._queue_watch = threading.Event()
         self.engine: Any = None
         self.run_info: Any = None
+        self.purge_progress: Any = None
 
         self.entity_filter = entity_filter
         self.exclude_t = exclude_t
 
         self._timechanges_seen = 0
         self._keepalive_count = 0
-        self._old_state_ids = {}
+        self._old_states = {}
+        self._pending_states = []
+        self._state_attributes_ids = OrderedDict()
+        self._pending_state_attributes = {}
+        self._statistics = StatisticsCompiler()
         self.event_session = None
         self.get_session = None
         self._completed_database_setup = False
@@ -354,9 +375,15 @@ class Recorder(threading.Thread):
                 self._close_connection()
                 return
             if isinstance(event, PurgeTask):
+                # Write pending rows first so the purge sees every
+                # state that references a shared attributes row
+                self._commit_event_session_or_retry()
                 # Schedule a new purge task if this one didn't finish
                 if not purge.purge_old_data(self, event.keep_days, event.repack):
                     self.queue.put(PurgeTask(event.keep_days, event.repack))
+                # The purge closed the event session, which detached the
+                # statistics rows the rollups hold on to
+                self._statistics.reset()
                 continue
             if isinstance(event, WaitTask):
                 self._queue_watch.set()
@@ -380,46 +407,109 @@ class Recorder(threading.Thread):
                 if not self.entity_filter(entity_id):
                     continue
 
-            try:
-                dbevent = Events.from_event(event)
-                if event.event_type == EVENT_STATE_CHANGED:
-                    dbevent.event_data = "{}"
-                self.event_session.add(dbevent)
-                self.event_session.flush()
-            except (TypeError, ValueError):
-                _LOGGER.warning("Event is not JSON serializable: %s", event)
-            except Exception as err:  # pylint: disable=broad-except
-                # Must catch the exception to prevent the loop from collapsing
-                _LOGGER.exception("Error adding event: %s", err)
-
-            if dbevent and event.event_type == EVENT_STATE_CHANGED:
-                try:
-                    dbstate = States.from_event(event)
-                    has_new_state = event.data.get("new_state")
-                    dbstate.old_state_id = self._old_state_ids.get(dbstate.entity_id)
-                    if not has_new_state:
-                        dbstate.state = None
-                    dbstate.event_id = dbevent.event_id
-                    self.event_session.add(dbstate)
-                    self.event_session.flush()
-                    if has_new_state:
-                        self._old_state_ids[dbstate.entity_id] = dbstate.state_id
-                    elif dbstate.entity_id in self._old_state_ids:
-                        del self._old_state_ids[dbstate.entity_id]
-                except (TypeError, ValueError):
-                    _LOGGER.warning(
-                        "State is not JSON serializable: %s",
-                        event.data.get("new_state"),
-                    )
-                except Exception as err:  # pylint: disable=broad-except
-                    # Must catch the exception to prevent the loop from collapsing
-                    _LOGGER.exception("Error adding state change: %s", err)
+            self._process_one_event(event)
 
             # If they do not have a commit interval
             # than we commit right away
             if not self.commit_interval:
                 self._commit_event_session_or_retry()
 
+    def _process_one_event(self, event):
+        """Add an event and its state change to the pending block of rows.
+
+        Nothing is flushed here. Events are added to the event session and
+        states are kept aside, the whole block of rows is written when the
+        session is committed.
+        """
+        try:
+            if event.event_type == EVENT_STATE_CHANGED:
+                dbevent = Events.from_event(event, event_data="{}")
+            else:
+                dbevent = Events.from_event(event)
+            self.event_session.add(dbevent)
+        except (TypeError, ValueError):
+            _LOGGER.warning("Event is not JSON serializable: %s", event)
+            return
+        except Exception as err:  # pylint: disable=broad-except
+            # Must catch the exception to prevent the loop from collapsing
+            _LOGGER.exception("Error adding event: %s", err)
+            return
+
+        if event.event_type != EVENT_STATE_CHANGED:
+            return
+
+        try:
+            dbstate = States.from_event(event)
+            has_new_state = event.data.get("new_state")
+            old_state = self._old_states.pop(dbstate.entity_id, None)
+            if not has_new_state:
+                dbstate.state = None
+            if has_new_state:
+                shared_attrs = dbstate.attributes
+                dbstate.attributes = None
+                self._link_state_attributes(dbstate, shared_attrs)
+            # The state is not added to the session, it is inserted
+            # together with the rest of the block in _insert_pending_states
+            self._pending_states.append((dbstate, dbevent, old_state))
+            if has_new_state:
+                self._old_states[dbstate.entity_id] = dbstate
+                self._statistics.add_state(
+                    dbstate.entity_id, dbstate.state, dbstate.last_updated
+                )
+        except (TypeError, ValueError):
+            _LOGGER.warning(
+                "State is not JSON serializable: %s",
+                event.data.get("new_state"),
+            )
+        except Exception as err:  # pylint: disable=broad-except
+            # Must catch the exception to prevent the loop from collapsing
+            _LOGGER.exception("Error adding state change: %s", err)
+
+    def _link_state_attributes(self, dbstate, shared_attrs):
+        """Point a state at the row holding its serialized attributes.
+
+        Attribute sets are looked up in memory first, then in the database,
+        and only inserted when they have never been seen before.
+        """
+        attributes_id = self._state_attributes_ids.get(shared_attrs)
+        if attributes_id is not None:
+            self._state_attributes_ids.move_to_end(shared_attrs)
+            dbstate.attributes_id = attributes_id
+            return
+
+        dbattrs = self._pending_state_attributes.get(shared_attrs)
+        if dbattrs is not None:
+            dbstate.state_attributes = dbattrs
+            return
+
+        attr_hash = StateAttributes.hash_shared_attrs(shared_attrs)
+        with self.event_session.no_autoflush:
+            row = (
+                self.event_session.query(StateAttributes.attributes_id)
+                .filter(StateAttributes.hash == attr_hash)
+                .filter(StateAttributes.shared_attrs == shared_attrs)
+                .first()
+            )
+        if row is not None:
+            self._cache_state_attributes_id(shared_attrs, row[0])
+            dbstate.attributes_id = row[0]
+            return
+
+        dbattrs = StateAttributes(hash=attr_hash, shared_attrs=shared_attrs)
+        self.event_session.add(dbattrs)
+        self._pending_state_attributes[shared_attrs] = dbattrs
+        dbstate.state_attributes = dbattrs
+
+    def _cache_state_attributes_id(self, shared_attrs, attributes_id):
+        """Remember the attributes_id of a serialized attribute set."""
+        self._state_attributes_ids[shared_attrs] = attributes_id
+        if len(self._state_attributes_ids) > STATE_ATTRIBUTES_ID_CACHE_SIZE:
+            self._state_attributes_ids.popitem(last=False)
+
+    def clear_state_attributes_cache(self):
+        """Forget all cached attributes_ids after rows have been deleted."""
+        self._state_attributes_ids.clear()
+
     def _send_keep_alive(self):
         try:
             _LOGGER.debug("Sending keepalive")
@@ -471,6 +561,8 @@ class Recorder(threading.Thread):
         self._reopen_event_session()
 
     def _reopen_event_session(self):
+        self._reset_old_states()
+
         try:
             self.event_session.rollback()
         except Exception as err:  # pylint: disable=broad-except
@@ -491,12 +583,77 @@ class Recorder(threading.Thread):
 
     def _commit_event_session(self):
         try:
+            self._statistics.write(self.event_session)
+            self.event_session.flush()
+            self._insert_pending_states()
+            inserted_attributes = [
+                (shared_attrs, dbattrs.attributes_id)
+                for shared_attrs, dbattrs in self._pending_state_attributes.items()
+            ]
+            self._pending_state_attributes = {}
             self.event_session.commit()
+            for shared_attrs, attributes_id in inserted_attributes:
+                self._cache_state_attributes_id(shared_attrs, attributes_id)
         except Exception as err:
             _LOGGER.error("Error executing query: %s", err)
             self.event_session.rollback()
+            self._reset_old_states()
             raise
 
+    def _insert_pending_states(self):
+        """Insert the pending states with a single executemany statement.
+
+        Must be called after the events and attributes of the block have
+        been flushed so their ids are known. The ids of the new states are
+        read back to link the states whose old state is in the same block.
+        """
+        if not self._pending_states:
+            return
+
+        event_ids = []
+        for dbstate, dbevent, old_state in self._pending_states:
+            dbstate.event_id = dbevent.event_id
+            event_ids.append(dbevent.event_id)
+            if dbstate.state_attributes is not None:
+                dbstate.attributes_id = dbstate.state_attributes.attributes_id
+            if old_state is not None:
+                dbstate.old_state_id = old_state.state_id
+
+        self.event_session.bulk_insert_mappings(
+            States,
+            [
+                {column: getattr(dbstate, column) for column in STATE_INSERT_COLUMNS}
+                for dbstate, _, _ in self._pending_states
+            ],
+            # Keep one statement when some of the values are None
+            render_nulls=True,
+        )
+
+        state_ids = dict(
+            self.event_session.query(States.event_id, States.state_id).filter(
+                States.event_id.between(min(event_ids), max(event_ids))
+            )
+        )
+        old_state_links = []
+        for dbstate, _, old_state in self._pending_states:
+            dbstate.state_id = state_ids[dbstate.event_id]
+            if old_state is not None and dbstate.old_state_id is None:
+                # The old state was inserted in the same statement
+                old_state_links.append(
+                    {"state_id": dbstate.state_id, "old_state_id": old_state.state_id}
+                )
+        if old_state_links:
+            self.event_session.bulk_update_mappings(States, old_state_links)
+
+        self._pending_states = []
+
+    def _reset_old_states(self):
+        """Forget states that may have been discarded by a rollback."""
+        self._old_states = {}
+        self._pending_states = []
+        self._pending_state_attributes = {}
+        self._statistics.reset()
+
     @callback
     def event_listener(self, event):
         """Listen for new events and put them in the process queue."""
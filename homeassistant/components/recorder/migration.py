@@ -205,6 +205,23 @@ def _add_columns(engine, table_name, columns_def):
             )
 
 
+def _add_foreign_key(engine, table_name, column, ref_table, ref_column):
+    """Add a foreign key constraint to an existing column."""
+    _LOGGER.debug(
+        "Adding foreign key from %s.%s to %s.%s",
+        table_name,
+        column,
+        ref_table,
+        ref_column,
+    )
+    engine.execute(
+        text(
+            f"ALTER TABLE {table_name} ADD FOREIGN KEY ({column}) "
+            f"REFERENCES {ref_table} ({ref_column})"
+        )
+    )
+
+
 def _apply_update(engine, new_version, old_version):
     """Perform operations to bring schema up to date."""
     if new_version == 1:
@@ -277,6 +294,26 @@ def _apply_update(engine, new_version, old_version):
         _drop_index(engine, "states", "ix_states_entity_id")
         _create_index(engine, "events", "ix_events_event_type_time_fired")
         _drop_index(engine, "events", "ix_events_event_type")
+    elif new_version == 10:
+        # The state_attributes table is created by create_all, states
+        # only need the column pointing at the shared attributes row
+        if engine.dialect.name == "sqlite":
+            # SQLite can only add the constraint with the column
+            _add_columns(
+                engine,
+                "states",
+                ["attributes_id INTEGER REFERENCES state_attributes(attributes_id)"],
+            )
+        else:
+            _add_columns(engine, "states", ["attributes_id INTEGER"])
+            _add_foreign_key(
+                engine, "states", "attributes_id", "state_attributes", "attributes_id"
+            )
+        _create_index(engine, "states", "ix_states_attributes_id")
+    elif new_version == 11:
+        # The statistics tables are created by create_all and
+        # existing states are not rolled up
+        pass
     else:
         raise ValueError(f"No schema migration defined for version {new_version}")
 
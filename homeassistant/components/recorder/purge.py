@@ -2,75 +2,87 @@
 from datetime import timedelta
 import logging
 import time
+from typing import Optional
 
+from sqlalchemy import exists
 from sqlalchemy.exc import OperationalError, SQLAlchemyError
 
 import homeassistant.util.dt as dt_util
 
-from .models import Events, RecorderRuns, States
-from .util import execute, session_scope
+from .const import EVENT_RECORDER_PURGE_PROGRESS
+from .models import Events, RecorderRuns, StateAttributes, States
+from .util import session_scope
 
 _LOGGER = logging.getLogger(__name__)
 
+# Maximum number of states or events deleted by one purge task
+PURGE_CHUNK_SIZE = 10000
+# Ids per DELETE statement, older SQLite versions allow 999 bound variables
+MAX_IDS_PER_DELETE = 999
+
 
 def purge_old_data(instance, purge_days: int, repack: bool) -> bool:
     """Purge events and states older than purge_days ago.
 
-    Cleans up an timeframe of an hour, based on the oldest record.
+    Deletes at most PURGE_CHUNK_SIZE rows per call so the recorder can
+    process its queue between chunks. Returns False until all old rows
+    have been removed.
     """
     purge_before = dt_util.utcnow() - timedelta(days=purge_days)
     _LOGGER.debug("Purging states and events before target %s", purge_before)
 
     try:
         with session_scope(session=instance.get_session()) as session:
-            # Purge a max of 1 hour, based on the oldest states or events record
-            batch_purge_before = purge_before
-
-            query = session.query(States).order_by(States.last_updated.asc()).limit(1)
-            states = execute(query, to_native=True, validate_entity_ids=False)
-            if states:
-                batch_purge_before = min(
-                    batch_purge_before,
-                    states[0].last_updated + timedelta(hours=1),
-                )
-
-            query = session.query(Events).order_by(Events.time_fired.asc()).limit(1)
-            events = execute(query, to_native=True)
-            if events:
-                batch_purge_before = min(
-                    batch_purge_before,
-                    events[0].time_fired + timedelta(hours=1),
+            progress = instance.purge_progress
+            if progress is None:
+                progress = instance.purge_progress = PurgeProgress(
+                    _estimate_rows(
+                        session, States.state_id, States.last_updated, purge_before
+                    )
+                    + _estimate_rows(
+                        session, Events.event_id, Events.time_fired, purge_before
+                    )
                 )
 
-            _LOGGER.debug("Purging states and events before %s", batch_purge_before)
-
-            deleted_rows = (
-                session.query(States)
-                .filter(States.last_updated < batch_purge_before)
-                .delete(synchronize_session=False)
+            # States reference events, so they have to go first
+            deleted_rows, states_done = _purge_chunk(
+                session, States, States.state_id, States.last_updated, purge_before
             )
             _LOGGER.debug("Deleted %s states", deleted_rows)
+            progress.deleted_states += deleted_rows
 
-            deleted_rows = (
-                session.query(Events)
-                .filter(Events.time_fired < batch_purge_before)
-                .delete(synchronize_session=False)
-            )
-            _LOGGER.debug("Deleted %s events", deleted_rows)
-
-            # If states or events purging isn't processing the purge_before yet,
-            # return false, as we are not done yet.
-            if batch_purge_before != purge_before:
-                _LOGGER.debug("Purging hasn't fully completed yet")
-                return False
-
-            # Recorder runs is small, no need to batch run it
-            deleted_rows = (
-                session.query(RecorderRuns)
-                .filter(RecorderRuns.start < purge_before)
-                .delete(synchronize_session=False)
-            )
-            _LOGGER.debug("Deleted %s recorder_runs", deleted_rows)
+            events_done = False
+            if states_done:
+                deleted_rows, events_done = _purge_chunk(
+                    session, Events, Events.event_id, Events.time_fired, purge_before
+                )
+                _LOGGER.debug("Deleted %s events", deleted_rows)
+                progress.deleted_events += deleted_rows
+
+            attributes_done = False
+            if events_done:
+                deleted_rows, attributes_done = _purge_unused_attributes_chunk(session)
+                _LOGGER.debug("Deleted %s state_attributes", deleted_rows)
+                if deleted_rows:
+                    instance.clear_state_attributes_cache()
+
+            finished = states_done and events_done and attributes_done
+            if finished:
+                # Recorder runs is small, no need to batch run it
+                deleted_rows = (
+                    session.query(RecorderRuns)
+                    .filter(RecorderRuns.start < purge_before)
+                    .delete(synchronize_session=False)
+                )
+                _LOGGER.debug("Deleted %s recorder_runs", deleted_rows)
+
+        _fire_purge_progress(instance, progress, finished)
+
+        # If states or events purging isn't processing the purge_before yet,
+        # return false, as we are not done yet.
+        if not finished:
+            _LOGGER.debug("Purging hasn't fully completed yet")
+            return False
 
         if repack:
             # Execute sqlite or postgresql vacuum command to free up space on disk
@@ -80,7 +92,9 @@ def purge_old_data(instance, purge_days: int, repack: bool) -> bool:
             # Optimize mysql / mariadb tables to free up space on disk
             elif instance.engine.driver in ("mysqldb", "pymysql"):
                 _LOGGER.debug("Optimizing SQL DB to free space")
-                instance.engine.execute("OPTIMIZE TABLE states, events, recorder_runs")
+                instance.engine.execute(
+                    "OPTIMIZE TABLE states, state_attributes, events, recorder_runs"
+                )
 
     except OperationalError as err:
         # Retry when one of the following MySQL errors occurred:
@@ -99,4 +113,110 @@ def purge_old_data(instance, purge_days: int, repack: bool) -> bool:
         _LOGGER.warning("Error purging history: %s", err)
     except SQLAlchemyError as err:
         _LOGGER.warning("Error purging history: %s", err)
+    instance.purge_progress = None
     return True
+
+
+class PurgeProgress:
+    """Keep track of a purge that spans multiple chunks."""
+
+    def __init__(self, total_rows: int) -> None:
+        """Initialize the purge progress.
+
+        total_rows is an estimate, counting the old rows could take longer
+        than deleting a chunk of them.
+        """
+        self.started = time.monotonic()
+        self.total_rows = total_rows
+        self.deleted_states = 0
+        self.deleted_events = 0
+
+    @property
+    def remaining_rows(self) -> int:
+        """Return the estimated number of rows left to delete."""
+        return max(self.total_rows - self.deleted_states - self.deleted_events, 0)
+
+    @property
+    def time_remaining(self) -> Optional[float]:
+        """Return the estimated number of seconds left, based on the rate so far."""
+        deleted_rows = self.deleted_states + self.deleted_events
+        if not deleted_rows:
+            return None
+        elapsed = time.monotonic() - self.started
+        return round(elapsed / deleted_rows * self.remaining_rows, 1)
+
+
+def _estimate_rows(session, id_column, time_column, purge_before) -> int:
+    """Estimate the number of rows older than purge_before.
+
+    Ids grow with time, so the ids of the oldest and the newest old row
+    bound the number of old rows. Both are found through the time index,
+    unlike a COUNT that reads every old row.
+    """
+    old_ids = session.query(id_column).filter(time_column < purge_before)
+    newest_id = old_ids.order_by(time_column.desc()).limit(1).scalar()
+    if newest_id is None:
+        return 0
+    oldest_id = old_ids.order_by(time_column.asc()).limit(1).scalar()
+    return max(newest_id - oldest_id + 1, 1)
+
+
+def _purge_chunk(session, table, id_column, time_column, purge_before):
+    """Delete the next chunk of rows older than purge_before.
+
+    The ids of the chunk are selected in time index order, so only about
+    PURGE_CHUNK_SIZE rows of the index are read, and the rows are deleted
+    by id. Returns the number of deleted rows and if this was the last
+    chunk.
+    """
+    ids = [
+        row[0]
+        for row in session.query(id_column)
+        .filter(time_column < purge_before)
+        .order_by(time_column.asc())
+        .limit(PURGE_CHUNK_SIZE)
+    ]
+    return _delete_ids(session, table, id_column, ids), len(ids) < PURGE_CHUNK_SIZE
+
+
+def _purge_unused_attributes_chunk(session):
+    """Delete the next chunk of attributes no state refers to anymore.
+
+    Returns the number of deleted rows and if this was the last chunk.
+    """
+    ids = [
+        row[0]
+        for row in session.query(StateAttributes.attributes_id)
+        .filter(~exists().where(States.attributes_id == StateAttributes.attributes_id))
+        .limit(PURGE_CHUNK_SIZE)
+    ]
+    deleted_rows = _delete_ids(
+        session, StateAttributes, StateAttributes.attributes_id, ids
+    )
+    return deleted_rows, len(ids) < PURGE_CHUNK_SIZE
+
+
+def _delete_ids(session, table, id_column, ids) -> int:
+    """Delete rows by id, in statements of at most MAX_IDS_PER_DELETE ids."""
+    deleted_rows = 0
+    for start in range(0, len(ids), MAX_IDS_PER_DELETE):
+        deleted_rows += (
+            session.query(table)
+            .filter(id_column.in_(ids[start : start + MAX_IDS_PER_DELETE]))
+            .delete(synchronize_session=False)
+        )
+    return deleted_rows
+
+
+def _fire_purge_progress(instance, progress: PurgeProgress, finished: bool) -> None:
+    """Report the progress of the purge on the event bus."""
+    instance.hass.bus.fire(
+        EVENT_RECORDER_PURGE_PROGRESS,
+        {
+            "deleted_states": progress.deleted_states,
+            "deleted_events": progress.deleted_events,
+            "remaining_rows": 0 if finished else progress.remaining_rows,
+            "time_remaining": 0 if finished else progress.time_remaining,
+            "finished": finished,
+        },
+    )
@@ -0,0 +1,181 @@
+"""Long-term statistics of numeric states, rolled up by the recorder."""
+from datetime import datetime
+import math
+from typing import Any, Dict, Iterable, List, Optional
+
+import homeassistant.util.dt as dt_util
+
+from .models import StatisticsDaily, StatisticsHourly, process_timestamp
+from .util import execute, session_scope
+
+PERIOD_HOUR = "hour"
+PERIOD_DAY = "day"
+
+STATISTICS_TABLES = {PERIOD_HOUR: StatisticsHourly, PERIOD_DAY: StatisticsDaily}
+
+
+def _hour_start(time: datetime) -> datetime:
+    """Return the start of the UTC hour of time."""
+    return dt_util.as_utc(time).replace(minute=0, second=0, microsecond=0)
+
+
+def _day_start(time: datetime) -> datetime:
+    """Return the start of the local day of time in UTC."""
+    return dt_util.as_utc(dt_util.start_of_local_day(dt_util.as_local(time)))
+
+
+PERIOD_START = {PERIOD_HOUR: _hour_start, PERIOD_DAY: _day_start}
+
+
+class _Rollup:
+    """Running rollup of the values of one entity in one period."""
+
+    __slots__ = [
+        "table",
+        "entity_id",
+        "start",
+        "count",
+        "min",
+        "max",
+        "sum",
+        "last",
+        "row",
+    ]
+
+    def __init__(self, table, entity_id: str, start: datetime) -> None:
+        """Initialize an empty rollup."""
+        self.table = table
+        self.entity_id = entity_id
+        self.start = start
+        self.count = 0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+        self.sum = 0.0
+        self.last: Optional[float] = None
+        self.row: Any = None
+
+    def add(self, value: float) -> None:
+        """Add a value to the rollup."""
+        self.count += 1
+        self.sum += value
+        self.last = value
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    def merge_row(self, row) -> None:
+        """Include the values that were already written to the database."""
+        self.count += row.count
+        self.sum += row.sum
+        if self.min is None or row.min < self.min:
+            self.min = row.min
+        if self.max is None or row.max > self.max:
+            self.max = row.max
+        self.row = row
+
+    def write_row(self) -> None:
+        """Copy the rollup to its database row."""
+        row = self.row
+        row.count = self.count
+        row.min = self.min
+        row.max = self.max
+        row.mean = self.sum / self.count
+        row.sum = self.sum
+        row.last = self.last
+
+
+class StatisticsCompiler:
+    """Maintain the hourly and daily rollups while states are recorded.
+
+    Only the rollup of the current period of each entity is kept in memory.
+    Changed rollups are written to the event session right before it is
+    committed.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the compiler."""
+        self._rollups: Dict[tuple, _Rollup] = {}
+        self._changed: Dict[tuple, _Rollup] = {}
+
+    def add_state(self, entity_id: str, state: str, last_updated: datetime) -> None:
+        """Add the state of an entity if it is numeric."""
+        try:
+            value = float(state)
+        except (TypeError, ValueError):
+            return
+        if not math.isfinite(value):
+            return
+
+        for period, table in STATISTICS_TABLES.items():
+            start = PERIOD_START[period](last_updated)
+            key = (period, entity_id)
+            rollup = self._rollups.get(key)
+            if rollup is None or rollup.start != start:
+                rollup = self._rollups[key] = _Rollup(table, entity_id, start)
+            rollup.add(value)
+            # Keyed by start as well, so a period that ended since the
+            # last commit is still written
+            self._changed[(period, entity_id, start)] = rollup
+
+    def write(self, session) -> None:
+        """Write the changed rollups to the session."""
+        for rollup in self._changed.values():
+            if rollup.row is None:
+                row = (
+                    session.query(rollup.table)
+                    .filter(rollup.table.entity_id == rollup.entity_id)
+                    .filter(rollup.table.start == rollup.start)
+                    .first()
+                )
+                if row is None:
+                    rollup.row = rollup.table(
+                        entity_id=rollup.entity_id, start=rollup.start
+                    )
+                    session.add(rollup.row)
+                else:
+                    rollup.merge_row(row)
+            rollup.write_row()
+        self._changed = {}
+
+    def reset(self) -> None:
+        """Forget the rollups after the session was rolled back or closed.
+
+        They are merged with the rows in the database again when the
+        entities change next.
+        """
+        self._rollups = {}
+        self._changed = {}
+
+
+def statistics_during_period(
+    hass,
+    start_time: datetime,
+    end_time: Optional[datetime] = None,
+    entity_ids: Optional[Iterable[str]] = None,
+    period: str = PERIOD_HOUR,
+) -> Dict[str, List[Dict[str, Any]]]:
+    """Return the rollups of the periods starting between start_time - end_time."""
+    table = STATISTICS_TABLES[period]
+    with session_scope(hass=hass) as session:
+        query = session.query(table).filter(table.start >= start_time)
+        if end_time is not None:
+            query = query.filter(table.start < end_time)
+        if entity_ids is not None:
+            query = query.filter(table.entity_id.in_(list(entity_ids)))
+        query = query.order_by(table.entity_id, table.start)
+
+        result: Dict[str, List[Dict[str, Any]]] = {}
+        for row in execute(query):
+            result.setdefault(row.entity_id, []).append(
+                {
+                    "start": process_timestamp(row.start),
+                    "count": row.count,
+                    "min": row.min,
+                    "max": row.max,
+                    "mean": row.mean,
+                    "sum": row.sum,
+                    "last": row.last,
+                }
+            )
+        return result
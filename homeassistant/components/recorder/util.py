@@ -10,7 +10,7 @@ from sqlalchemy.exc import OperationalError, SQLAlchemyError
 import homeassistant.util.dt as dt_util
 
 from .const import CONF_DB_INTEGRITY_CHECK, DATA_INSTANCE, SQLITE_URL_PREFIX
-from .models import ALL_TABLES, process_timestamp
+from .models import TABLES_TO_CHECK, process_timestamp
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -148,7 +148,7 @@ def last_run_was_recently_clean(cursor):
 def basic_sanity_check(cursor):
     """Check tables to make sure select does not fail."""
 
-    for table in ALL_TABLES:
+    for table in TABLES_TO_CHECK:
         cursor.execute(f"SELECT * FROM {table} LIMIT 1;")  # sec: not injection
 
     return True
@@ -20,6 +20,7 @@ from homeassistant.const import (
     STATE_ON,
 )
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import reference_index
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.config_validation import make_entity_service_schema
 from homeassistant.helpers.entity import ToggleEntity
@@ -91,63 +92,25 @@ def is_on(hass, entity_id):
 @callback
 def scripts_with_entity(hass: HomeAssistant, entity_id: str) -> List[str]:
     """Return all scripts that reference the entity."""
-    if DOMAIN not in hass.data:
-        return []
-
-    component = hass.data[DOMAIN]
-
-    return [
-        script_entity.entity_id
-        for script_entity in component.entities
-        if entity_id in script_entity.script.referenced_entities
-    ]
+    return reference_index.async_get(hass).async_sources_with_entity(entity_id, DOMAIN)
 
 
 @callback
 def entities_in_script(hass: HomeAssistant, entity_id: str) -> List[str]:
     """Return all entities in script."""
-    if DOMAIN not in hass.data:
-        return []
-
-    component = hass.data[DOMAIN]
-
-    script_entity = component.get_entity(entity_id)
-
-    if script_entity is None:
-        return []
-
-    return list(script_entity.script.referenced_entities)
+    return reference_index.async_get(hass).async_entities(entity_id)
 
 
 @callback
 def scripts_with_device(hass: HomeAssistant, device_id: str) -> List[str]:
     """Return all scripts that reference the device."""
-    if DOMAIN not in hass.data:
-        return []
-
-    component = hass.data[DOMAIN]
-
-    return [
-        script_entity.entity_id
-        for script_entity in component.entities
-        if device_id in script_entity.script.referenced_devices
-    ]
+    return reference_index.async_get(hass).async_sources_with_device(device_id, DOMAIN)
 
 
 @callback
 def devices_in_script(hass: HomeAssistant, entity_id: str) -> List[str]:
     """Return all devices in script."""
-    if DOMAIN not in hass.data:
-        return []
-
-    component = hass.data[DOMAIN]
-
-    script_entity = component.get_entity(entity_id)
-
-    if script_entity is None:
-        return []
-
-    return list(script_entity.script.referenced_devices)
+    return reference_index.async_get(hass).async_devices(entity_id)
 
 
 async def async_setup(hass, config):
@@ -331,8 +294,17 @@ class ScriptEntity(ToggleEntity):
         """Turn script off."""
         await self.script.async_stop()
 
+    async def async_added_to_hass(self):
+        """Add the references of the script to the index."""
+        reference_index.async_get(self.hass).async_set(
+            self.entity_id,
+            self.script.referenced_entities,
+            self.script.referenced_devices,
+        )
+
     async def async_will_remove_from_hass(self):
         """Stop script and remove service when it will be removed from Home Assistant."""
+        reference_index.async_get(self.hass).async_remove(self.entity_id)
         await self.script.async_stop()
 
         # remove service
@@ -4,10 +4,9 @@ import logging
 
 import voluptuous as vol
 
-from homeassistant.components import automation, group, script, websocket_api
-from homeassistant.components.homeassistant import scene
+from homeassistant.components import group, websocket_api
 from homeassistant.core import HomeAssistant, callback, split_entity_id
-from homeassistant.helpers import device_registry, entity_registry
+from homeassistant.helpers import device_registry, entity_registry, reference_index
 
 DOMAIN = "search"
 _LOGGER = logging.getLogger(__name__)
@@ -74,6 +73,7 @@ class Searcher:
         self.hass = hass
         self._device_reg = device_reg
         self._entity_reg = entity_reg
+        self._references = reference_index.async_get(hass)
         self.results = defaultdict(set)
         self._to_resolve = deque()
 
@@ -143,27 +143,16 @@ class Searcher:
         ):
             self._add_or_resolve("entity", entity_entry.entity_id)
 
-        for entity_id in script.scripts_with_device(self.hass, device_id):
-            self._add_or_resolve("entity", entity_id)
-
-        for entity_id in automation.automations_with_device(self.hass, device_id):
+        # Find automations and scripts that reference this device.
+        for entity_id in self._references.async_sources_with_device(device_id):
             self._add_or_resolve("entity", entity_id)
 
     @callback
     def _resolve_entity(self, entity_id) -> None:
         """Resolve an entity."""
-        # Extra: Find automations and scripts that reference this entity.
-
-        for entity in scene.scenes_with_entity(self.hass, entity_id):
-            self._add_or_resolve("entity", entity)
-
-        for entity in group.groups_with_entity(self.hass, entity_id):
-            self._add_or_resolve("entity", entity)
-
-        for entity in automation.automations_with_entity(self.hass, entity_id):
-            self._add_or_resolve("entity", entity)
-
-        for entity in script.scripts_with_entity(self.hass, entity_id):
+        # Extra: Find scenes, groups, automations and scripts that reference
+        # this entity.
+        for entity in self._references.async_sources_with_entity(entity_id):
             self._add_or_resolve("entity", entity)
 
         # Find devices
@@ -186,12 +175,10 @@ class Searcher:
 
         Will only be called if automation is an entry point.
         """
-        for entity in automation.entities_in_automation(
-            self.hass, automation_entity_id
-        ):
+        for entity in self._references.async_entities(automation_entity_id):
             self._add_or_resolve("entity", entity)
 
-        for device in automation.devices_in_automation(self.hass, automation_entity_id):
+        for device in self._references.async_devices(automation_entity_id):
             self._add_or_resolve("device", device)
 
     @callback
@@ -200,10 +187,10 @@ class Searcher:
 
         Will only be called if script is an entry point.
         """
-        for entity in script.entities_in_script(self.hass, script_entity_id):
+        for entity in self._references.async_entities(script_entity_id):
             self._add_or_resolve("entity", entity)
 
-        for device in script.devices_in_script(self.hass, script_entity_id):
+        for device in self._references.async_devices(script_entity_id):
             self._add_or_resolve("device", device)
 
     @callback
@@ -221,7 +208,7 @@ class Searcher:
 
         Will only be called if scene is an entry point.
         """
-        for entity in scene.entities_in_scene(self.hass, scene_entity_id):
+        for entity in self._references.async_entities(scene_entity_id):
             self._add_or_resolve("entity", entity)
 
     @callback
@@ -6,6 +6,10 @@ import statistics
 import voluptuous as vol
 
 from homeassistant.components.recorder.models import States
+from homeassistant.components.recorder.statistics import (
+    PERIOD_HOUR,
+    statistics_during_period,
+)
 from homeassistant.components.recorder.util import execute, session_scope
 from homeassistant.components.sensor import PLATFORM_SCHEMA
 from homeassistant.const import (
@@ -99,6 +103,8 @@ class StatisticsSensor(Entity):
         self._unit_of_measurement = None
         self.states = deque(maxlen=self._sampling_size)
         self.ages = deque(maxlen=self._sampling_size)
+        # Hourly rollups of the part of max_age older than the recorded states
+        self.rollups = deque()
 
         self.count = 0
         self.mean = self.median = self.stdev = self.variance = None
@@ -230,8 +236,32 @@ class StatisticsSensor(Entity):
             self.ages.popleft()
             self.states.popleft()
 
+    def _purge_rollups(self):
+        """Remove rollups which are older than self._max_age or not needed.
+
+        The rollups are dropped oldest first once the states and rollups
+        together hold more than self._sampling_size values.
+        """
+        if self._max_age is not None:
+            now = dt_util.utcnow()
+            while self.rollups and (now - self.rollups[0]["start"]) > self._max_age:
+                self.rollups.popleft()
+
+        while (
+            self.rollups
+            and len(self.states) + self._rollup_count() > self._sampling_size
+        ):
+            self.rollups.popleft()
+
+    def _rollup_count(self):
+        """Return the number of values in the rollups."""
+        return sum(rollup["count"] for rollup in self.rollups)
+
     def _next_to_purge_timestamp(self):
         """Find the timestamp when the next purge would occur."""
+        if self.rollups and self._max_age:
+            # Rollups are always older than the states
+            return self.rollups[0]["start"] + self._max_age
         if self.ages and self._max_age:
             # Take the oldest entry from the ages list and add the configured max_age.
             # If executed after purging old states, the result is the next timestamp
@@ -245,15 +275,26 @@ class StatisticsSensor(Entity):
         if self._max_age is not None:
             self._purge_old()
 
-        self.count = len(self.states)
+        self._purge_rollups()
+
+        self.count = len(self.states) + self._rollup_count()
 
         if not self.is_binary:
             try:  # require only one data point
-                self.mean = round(statistics.mean(self.states), self._precision)
                 self.median = round(statistics.median(self.states), self._precision)
             except statistics.StatisticsError as err:
                 _LOGGER.debug("%s: %s", self.entity_id, err)
-                self.mean = self.median = STATE_UNKNOWN
+                self.median = STATE_UNKNOWN
+
+            if self.rollups:
+                rollup_total = sum(rollup["sum"] for rollup in self.rollups)
+                self.mean = round(
+                    (sum(self.states) + rollup_total) / self.count, self._precision
+                )
+            elif self.states:
+                self.mean = round(statistics.mean(self.states), self._precision)
+            else:
+                self.mean = STATE_UNKNOWN
 
             try:  # require at least two data points
                 self.stdev = round(statistics.stdev(self.states), self._precision)
@@ -262,14 +303,32 @@ class StatisticsSensor(Entity):
                 _LOGGER.debug("%s: %s", self.entity_id, err)
                 self.stdev = self.variance = STATE_UNKNOWN
 
-            if self.states:
-                self.total = round(sum(self.states), self._precision)
-                self.min = round(min(self.states), self._precision)
-                self.max = round(max(self.states), self._precision)
+            if self.states or self.rollups:
+                self.total = round(
+                    sum(self.states) + sum(rollup["sum"] for rollup in self.rollups),
+                    self._precision,
+                )
+                self.min = round(
+                    min([*self.states, *(rollup["min"] for rollup in self.rollups)]),
+                    self._precision,
+                )
+                self.max = round(
+                    max([*self.states, *(rollup["max"] for rollup in self.rollups)]),
+                    self._precision,
+                )
 
-                self.min_age = self.ages[0]
-                self.max_age = self.ages[-1]
+                self.min_age = (
+                    self.rollups[0]["start"] if self.rollups else self.ages[0]
+                )
+                self.max_age = self.ages[-1] if self.ages else self.rollups[-1]["start"]
 
+            else:
+                self.total = self.min = self.max = STATE_UNKNOWN
+                self.min_age = self.max_age = dt_util.utcnow()
+
+            # The rollups do not keep the order of the values, the change
+            # is only known from the states
+            if self.states:
                 self.change = self.states[-1] - self.states[0]
                 self.average_change = self.change
                 self.change_rate = 0
@@ -277,7 +336,7 @@ class StatisticsSensor(Entity):
                 if len(self.states) > 1:
                     self.average_change /= len(self.states) - 1
 
-                    time_diff = (self.max_age - self.min_age).total_seconds()
+                    time_diff = (self.ages[-1] - self.ages[0]).total_seconds()
                     if time_diff > 0:
                         self.change_rate = self.change / time_diff
 
@@ -286,8 +345,6 @@ class StatisticsSensor(Entity):
                 self.change_rate = round(self.change_rate, self._precision)
 
             else:
-                self.total = self.min = self.max = STATE_UNKNOWN
-                self.min_age = self.max_age = dt_util.utcnow()
                 self.change = self.average_change = STATE_UNKNOWN
                 self.change_rate = STATE_UNKNOWN
 
@@ -320,7 +377,10 @@ class StatisticsSensor(Entity):
         list so that we get it in the right order again.
 
         If MaxAge is provided then query will restrict to entries younger then
-        current datetime - MaxAge.
+        current datetime - MaxAge. When the states do not fill the sample
+        size, the hours of MaxAge before the oldest state are taken from the
+        hourly rollups of the recorder, which are kept after the states were
+        purged.
         """
 
         _LOGGER.debug("%s: initializing values from the database", self.entity_id)
@@ -349,6 +409,47 @@ class StatisticsSensor(Entity):
         for state in reversed(states):
             self._add_state_to_queue(state)
 
+        if (
+            not self.is_binary
+            and self._max_age is not None
+            and len(states) < self._sampling_size
+        ):
+            self._initialize_rollups_from_database(
+                states[-1].last_updated if states else dt_util.utcnow()
+            )
+
         self.async_schedule_update_ha_state(True)
 
         _LOGGER.debug("%s: initializing from database completed", self.entity_id)
+
+    def _initialize_rollups_from_database(self, oldest_state_time):
+        """Load the rollups of the hours of MaxAge before the oldest state.
+
+        The hour of the oldest state is left out, as it is partially covered
+        by the states. Rollups are loaded newest first until the sample size
+        is reached.
+        """
+        entity_id = self._entity_id.lower()
+        end_time = dt_util.as_utc(oldest_state_time).replace(
+            minute=0, second=0, microsecond=0
+        )
+        rollups = statistics_during_period(
+            self.hass,
+            dt_util.utcnow() - self._max_age,
+            end_time,
+            [entity_id],
+            PERIOD_HOUR,
+        ).get(entity_id, [])
+
+        count = len(self.states)
+        for rollup in reversed(rollups):
+            if count + rollup["count"] > self._sampling_size:
+                break
+            count += rollup["count"]
+            self.rollups.appendleft(rollup)
+
+        _LOGGER.debug(
+            "%s: loaded %d hourly rollups from the database",
+            self.entity_id,
+            len(self.rollups),
+        )
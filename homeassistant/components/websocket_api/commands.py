@@ -15,6 +15,7 @@ from homeassistant.exceptions import (
     Unauthorized,
 )
 from homeassistant.helpers import config_validation as cv, entity
+from homeassistant.helpers.entity_platform import DATA_ENTITY_PLATFORM
 from homeassistant.helpers.event import TrackTemplate, async_track_template_result
 from homeassistant.helpers.service import async_get_all_descriptions
 from homeassistant.helpers.template import Template
@@ -26,6 +27,8 @@ _LOGGER = logging.getLogger(__name__)
 
 # mypy: allow-untyped-calls, allow-untyped-defs
 
+DATA_EVENT_FORWARDERS = f"{const.DOMAIN}.event_forwarders"
+
 
 @callback
 def async_register_commands(hass, async_reg):
@@ -41,6 +44,7 @@ def async_register_commands(hass, async_reg):
     async_reg(hass, handle_manifest_list)
     async_reg(hass, handle_manifest_get)
     async_reg(hass, handle_entity_source)
+    async_reg(hass, handle_entity_poll_timings)
     async_reg(hass, handle_subscribe_trigger)
     async_reg(hass, handle_test_condition)
 
@@ -50,6 +54,59 @@ def pong_message(iden):
     return {"id": iden, "type": "pong"}
 
 
+class EventForwarder:
+    """Forward the events of one event type to all subscribed connections.
+
+    A single bus listener is shared by all subscriptions to the event type
+    and every event is serialized once, only the subscription id of the
+    message differs per connection.
+    """
+
+    def __init__(self, hass, event_type):
+        """Initialize the event forwarder."""
+        self.hass = hass
+        self.event_type = event_type
+        self.subscriptions = set()
+        self._check_entity = event_type == EVENT_STATE_CHANGED
+        self._unsub_listener = None
+
+    @callback
+    def async_add(self, connection, iden):
+        """Add a subscription of a connection and return a remove callback."""
+        key = (connection, iden)
+        self.subscriptions.add(key)
+
+        if self._unsub_listener is None:
+            self._unsub_listener = self.hass.bus.async_listen(
+                self.event_type, self._async_forward_event
+            )
+
+        @callback
+        def async_remove():
+            """Remove the subscription."""
+            self.subscriptions.discard(key)
+            if not self.subscriptions and self._unsub_listener is not None:
+                self._unsub_listener()
+                self._unsub_listener = None
+
+        return async_remove
+
+    @callback
+    def _async_forward_event(self, event):
+        """Forward an event to the subscribed connections."""
+        if event.event_type == EVENT_TIME_CHANGED:
+            return
+
+        # Copy as sending may cause a connection to unsubscribe
+        for connection, iden in list(self.subscriptions):
+            if self._check_entity and not connection.user.permissions.check_entity(
+                event.data["entity_id"], POLICY_READ
+            ):
+                continue
+
+            connection.send_message(messages.cached_event_message(iden, event))
+
+
 @callback
 @decorators.websocket_command(
     {
@@ -68,31 +125,12 @@ def handle_subscribe_events(hass, connection, msg):
     if event_type not in SUBSCRIBE_WHITELIST and not connection.user.is_admin:
         raise Unauthorized
 
-    if event_type == EVENT_STATE_CHANGED:
-
-        @callback
-        def forward_events(event):
-            """Forward state changed events to websocket."""
-            if not connection.user.permissions.check_entity(
-                event.data["entity_id"], POLICY_READ
-            ):
-                return
-
-            connection.send_message(messages.cached_event_message(msg["id"], event))
+    forwarders = hass.data.setdefault(DATA_EVENT_FORWARDERS, {})
+    forwarder = forwarders.get(event_type)
+    if forwarder is None:
+        forwarder = forwarders[event_type] = EventForwarder(hass, event_type)
 
-    else:
-
-        @callback
-        def forward_events(event):
-            """Forward events to websocket."""
-            if event.event_type == EVENT_TIME_CHANGED:
-                return
-
-            connection.send_message(messages.cached_event_message(msg["id"], event))
-
-    connection.subscriptions[msg["id"]] = hass.bus.async_listen(
-        event_type, forward_events
-    )
+    connection.subscriptions[msg["id"]] = forwarder.async_add(connection, msg["id"])
 
     connection.send_message(messages.result_message(msg["id"]))
 
@@ -171,20 +209,43 @@ async def handle_call_service(hass, connection, msg):
 
 
 @callback
-@decorators.websocket_command({vol.Required("type"): "get_states"})
+@decorators.websocket_command(
+    {vol.Required("type"): "get_states", vol.Optional("since"): int}
+)
 def handle_get_states(hass, connection, msg):
-    """Handle get states command."""
-    if connection.user.permissions.access_all_entities("read"):
-        states = hass.states.async_all()
+    """Handle get states command.
+
+    With since, only the states changed after that revision are sent.
+    """
+    changes = None
+    if "since" in msg:
+        changes = hass.states.async_changes_since(msg["since"])
+
+    if changes is None:
+        states, removed = hass.states.async_all(), []
     else:
+        states, removed = changes
+
+    if not connection.user.permissions.access_all_entities("read"):
         entity_perm = connection.user.permissions.check_entity
-        states = [
-            state
-            for state in hass.states.async_all()
-            if entity_perm(state.entity_id, "read")
-        ]
+        states = [state for state in states if entity_perm(state.entity_id, "read")]
+        removed = [entity_id for entity_id in removed if entity_perm(entity_id, "read")]
 
-    connection.send_message(messages.result_message(msg["id"], states))
+    if "since" not in msg:
+        connection.send_message(messages.result_message(msg["id"], states))
+        return
+
+    connection.send_message(
+        messages.result_message(
+            msg["id"],
+            {
+                "revision": hass.states.revision,
+                "full": changes is None,
+                "changed": states,
+                "removed": removed,
+            },
+        )
+    )
 
 
 @decorators.websocket_command({vol.Required("type"): "get_services"})
@@ -341,6 +402,33 @@ def handle_entity_source(hass, connection, msg):
     connection.send_result(msg["id"], sources)
 
 
+@callback
+@decorators.require_admin
+@decorators.websocket_command({vol.Required("type"): "entity/poll_timings"})
+def handle_entity_poll_timings(hass, connection, msg):
+    """Handle entity poll timings command."""
+    result = []
+
+    for platforms in hass.data.get(DATA_ENTITY_PLATFORM, {}).values():
+        for platform in platforms:
+            if not platform.poll_timings:
+                continue
+
+            result.append(
+                {
+                    "domain": platform.domain,
+                    "platform": platform.platform_name,
+                    "scan_interval": platform.scan_interval.total_seconds(),
+                    "entities": {
+                        entity_id: timing.as_dict()
+                        for entity_id, timing in platform.poll_timings.items()
+                    },
+                }
+            )
+
+    connection.send_result(msg["id"], result)
+
+
 @callback
 @decorators.websocket_command(
     {
@@ -5,7 +5,7 @@ from datetime import datetime, timedelta
 import functools as ft
 import logging
 from timeit import default_timer as timer
-from typing import Any, Awaitable, Dict, Iterable, List, Optional
+from typing import Any, Awaitable, Dict, Iterable, List, Optional, Tuple
 
 from homeassistant.config import DATA_CUSTOMIZE
 from homeassistant.const import (
@@ -110,6 +110,19 @@ class Entity(ABC):
     # Process updates in parallel
     parallel_updates: Optional[asyncio.Semaphore] = None
 
+    # Minimum time between state writes of the platform
+    _platform_state_write_interval: Optional[timedelta] = None
+
+    # Attributes that do not change during the life of the entity, with the
+    # registry entry and customize config they were built from
+    _static_attributes: Optional[
+        Tuple[Tuple[Any, ...], Dict[str, Any], Dict[str, Any]]
+    ] = None
+
+    # Coalesced state writes
+    _state_written: Optional[float] = None
+    _state_write_handle: Optional[asyncio.TimerHandle] = None
+
     # Entry in the entity registry
     registry_entry: Optional[RegistryEntry] = None
 
@@ -232,6 +245,16 @@ class Entity(ABC):
         """Time that a context is considered recent."""
         return timedelta(seconds=5)
 
+    @property
+    def state_write_interval(self) -> Optional[timedelta]:
+        """Return the minimum time between two writes of the state.
+
+        State writes requested within the interval are coalesced into a single
+        write of the latest state at the end of the interval. Defaults to the
+        STATE_WRITE_INTERVAL of the platform, None writes every state right away.
+        """
+        return self._platform_state_write_interval
+
     @property
     def entity_registry_enabled_default(self) -> bool:
         """Return if the entity should be enabled when first added to the entity registry."""
@@ -280,7 +303,7 @@ class Entity(ABC):
                 _LOGGER.exception("Update for %s fails", self.entity_id)
                 return
 
-        self._async_write_ha_state()
+        self._async_schedule_write_ha_state()
 
     @callback
     def async_write_ha_state(self) -> None:
@@ -293,8 +316,49 @@ class Entity(ABC):
                 f"No entity id specified for entity {self.name}"
             )
 
+        self._async_schedule_write_ha_state()
+
+    @callback
+    def _async_schedule_write_ha_state(self) -> None:
+        """Write the state now or coalesce it with a pending write."""
+        interval = self.state_write_interval
+
+        if interval is None:
+            self._async_write_ha_state()
+            return
+
+        if self._state_write_handle is not None:
+            # The pending write will pick up the latest state
+            return
+
+        assert self.hass is not None
+        now = self.hass.loop.time()
+        if self._state_written is not None:
+            delay = self._state_written + interval.total_seconds() - now
+            if delay > 0:
+                self._state_write_handle = self.hass.loop.call_later(
+                    delay, self._async_write_pending_ha_state
+                )
+                return
+
+        self._state_written = now
+        self._async_write_ha_state()
+
+    @callback
+    def _async_write_pending_ha_state(self) -> None:
+        """Write the state that was held back by the state write interval."""
+        assert self.hass is not None
+        self._state_write_handle = None
+        self._state_written = self.hass.loop.time()
         self._async_write_ha_state()
 
+    @callback
+    def _async_cancel_pending_write_ha_state(self) -> None:
+        """Drop a state write that was held back."""
+        if self._state_write_handle is not None:
+            self._state_write_handle.cancel()
+            self._state_write_handle = None
+
     @callback
     def _async_write_ha_state(self) -> None:
         """Write the state to the state machine."""
@@ -311,8 +375,8 @@ class Entity(ABC):
 
         start = timer()
 
-        attr = self.capability_attributes
-        attr = dict(attr) if attr else {}
+        capability_attr, customize = self._async_static_attributes()
+        attr = dict(capability_attr)
 
         if not self.available:
             state = STATE_UNAVAILABLE
@@ -379,8 +443,8 @@ class Entity(ABC):
 
         # Overwrite properties that have been set in the config file.
         assert self.hass is not None
-        if DATA_CUSTOMIZE in self.hass.data:
-            attr.update(self.hass.data[DATA_CUSTOMIZE].get(self.entity_id))
+        if customize:
+            attr.update(customize)
 
         # Convert temperature if we detect one
         try:
@@ -409,6 +473,45 @@ class Entity(ABC):
             self.entity_id, state, attr, self.force_update, self._context
         )
 
+    @callback
+    def _async_static_attributes(
+        self,
+    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Return the capability attributes and customizations.
+
+        They are only rebuilt when the registry entry, the entity_id or the
+        customize config change, or after async_invalidate_static_attributes.
+        """
+        assert self.hass is not None
+        customize_values = self.hass.data.get(DATA_CUSTOMIZE)
+        key = (self.registry_entry, self.entity_id, customize_values)
+        cached = self._static_attributes
+
+        if cached is not None:
+            cached_key = cached[0]
+            if (
+                cached_key[0] is key[0]
+                and cached_key[1] == key[1]
+                and cached_key[2] is key[2]
+            ):
+                return cached[1:]
+
+        capability_attr = self.capability_attributes
+        cached = self._static_attributes = (
+            key,
+            dict(capability_attr) if capability_attr else {},
+            customize_values.get(self.entity_id) if customize_values else {},
+        )
+        return cached[1:]
+
+    @callback
+    def async_invalidate_static_attributes(self) -> None:
+        """Rebuild the capability attributes on the next write.
+
+        To be called by entities whose capabilities change while they are added.
+        """
+        self._static_attributes = None
+
     def schedule_update_ha_state(self, force_refresh: bool = False) -> None:
         """Schedule an update ha state change task.
 
@@ -495,6 +598,7 @@ class Entity(ABC):
         hass: HomeAssistant,
         platform: EntityPlatform,
         parallel_updates: Optional[asyncio.Semaphore],
+        state_write_interval: Optional[timedelta] = None,
     ) -> None:
         """Start adding an entity to a platform."""
         if self._added:
@@ -505,6 +609,8 @@ class Entity(ABC):
         self.hass = hass
         self.platform = platform
         self.parallel_updates = parallel_updates
+        self._platform_state_write_interval = state_write_interval
+        self._static_attributes = None
         self._added = True
 
     @callback
@@ -513,6 +619,7 @@ class Entity(ABC):
         self.hass = None
         self.platform = None
         self.parallel_updates = None
+        self._platform_state_write_interval = None
         self._added = False
 
     async def add_to_platform_finish(self) -> None:
@@ -531,6 +638,7 @@ class Entity(ABC):
             )
 
         self._added = False
+        self._async_cancel_pending_write_ha_state()
 
         if self._on_remove is not None:
             while self._on_remove:
@@ -24,7 +24,7 @@ from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
 from homeassistant.loader import async_get_integration, bind_hass
 from homeassistant.setup import async_prepare_setup_platform
 
-from .entity_platform import EntityPlatform
+from .entity_platform import DATA_DOMAIN_ENTITIES, EntityPlatform
 
 DEFAULT_SCAN_INTERVAL = timedelta(seconds=15)
 DATA_INSTANCES = "entity_components"
@@ -95,11 +95,11 @@ class EntityComponent:
 
     def get_entity(self, entity_id: str) -> Optional[entity.Entity]:
         """Get an entity."""
-        for platform in self._platforms.values():
-            entity_obj = platform.entities.get(entity_id)
-            if entity_obj is not None:
-                return entity_obj
-        return None
+        return (
+            self.hass.data.get(DATA_DOMAIN_ENTITIES, {})
+            .get(self.domain, {})
+            .get(entity_id)
+        )
 
     def setup(self, config: ConfigType) -> None:
         """Set up a full entity component.
@@ -262,15 +262,10 @@ class EntityComponent:
 
     async def async_remove_entity(self, entity_id: str) -> None:
         """Remove an entity managed by one of the platforms."""
-        found = None
-
-        for platform in self._platforms.values():
-            if entity_id in platform.entities:
-                found = platform
-                break
+        entity_obj = self.get_entity(entity_id)
 
-        if found:
-            await found.async_remove_entity(entity_id)
+        if entity_obj is not None and entity_obj.platform is not None:
+            await entity_obj.platform.async_remove_entity(entity_id)
 
     async def async_prepare_reload(self, *, skip_reset: bool = False) -> Optional[dict]:
         """Prepare reloading this entity component.
@@ -4,7 +4,17 @@ from contextvars import ContextVar
 from datetime import datetime, timedelta
 from logging import Logger
 from types import ModuleType
-from typing import TYPE_CHECKING, Callable, Coroutine, Dict, Iterable, List, Optional
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Coroutine,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+)
 
 from homeassistant import config_entries
 from homeassistant.const import DEVICE_DEFAULT_NAME
@@ -35,6 +45,40 @@ SLOW_ADD_MIN_TIMEOUT = 500
 
 PLATFORM_NOT_READY_RETRIES = 10
 DATA_ENTITY_PLATFORM = "entity_platform"
+DATA_DOMAIN_ENTITIES = "domain_entities"
+
+
+class PollTiming:
+    """Keep track of how long the updates of a polling entity take."""
+
+    __slots__ = ["count", "skipped", "last", "average", "maximum"]
+
+    def __init__(self) -> None:
+        """Initialize the poll timing."""
+        self.count = 0
+        self.skipped = 0
+        self.last = 0.0
+        self.average = 0.0
+        self.maximum = 0.0
+
+    def add(self, duration: float) -> None:
+        """Record the duration of an update."""
+        self.count += 1
+        self.last = duration
+        self.average += (duration - self.average) / self.count
+        self.maximum = max(self.maximum, duration)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return a dictionary version of the poll timing."""
+        return {
+            "count": self.count,
+            "skipped": self.skipped,
+            "last": self.last,
+            "average": self.average,
+            "maximum": self.maximum,
+        }
+
+
 PLATFORM_NOT_READY_BASE_WAIT_TIME = 30  # seconds
 
 
@@ -62,14 +106,26 @@ class EntityPlatform:
         self.entity_namespace = entity_namespace
         self.config_entry: Optional[config_entries.ConfigEntry] = None
         self.entities: Dict[str, Entity] = {}  # pylint: disable=used-before-assignment
+        # Index of the entities of all platforms of the domain
+        self.domain_entities: Dict[str, Entity] = hass.data.setdefault(
+            DATA_DOMAIN_ENTITIES, {}
+        ).setdefault(domain, {})
         self._tasks: List[asyncio.Future] = []
         # Method to cancel the state change listener
         self._async_unsub_polling: Optional[CALLBACK_TYPE] = None
         # Method to cancel the retry of setup
         self._async_cancel_retry_setup: Optional[CALLBACK_TYPE] = None
-        self._process_updates: Optional[asyncio.Lock] = None
+        # Polling entities whose update is scheduled or running
+        self._polls_in_progress: Set[str] = set()
+        self.poll_timings: Dict[str, PollTiming] = {}
+        # Start the updates of a round spread over the scan interval
+        self.spread_polling: bool = getattr(platform, "SPREAD_POLLING", False)
 
         self.parallel_updates: Optional[asyncio.Semaphore] = None
+        # Minimum time between two state writes of an entity
+        self.state_write_interval: Optional[timedelta] = getattr(
+            platform, "STATE_WRITE_INTERVAL", None
+        )
 
         # Platform is None for the EntityComponent "catch-all" EntityPlatform
         # which powers entity_component.add_entities
@@ -338,6 +394,7 @@ class EntityPlatform:
             self.hass,
             self,
             self._get_parallel_updates_semaphore(hasattr(entity, "async_update")),
+            self.state_write_interval,
         )
 
         # Update properties before we generate the entity_id
@@ -476,7 +533,16 @@ class EntityPlatform:
 
         entity_id = entity.entity_id
         self.entities[entity_id] = entity
-        entity.async_on_remove(lambda: self.entities.pop(entity_id))
+        self.domain_entities[entity_id] = entity
+
+        @callback
+        def remove_entity_cb() -> None:
+            """Remove entity from entities list."""
+            self.entities.pop(entity_id)
+            self.domain_entities.pop(entity_id)
+            self.poll_timings.pop(entity_id, None)
+
+        entity.async_on_remove(remove_entity_cb)
 
         await entity.add_to_platform_finish()
 
@@ -565,31 +631,77 @@ class EntityPlatform:
     async def _update_entity_states(self, now: datetime) -> None:
         """Update the states of all the polling entities.
 
-        To protect from flooding the executor, we will update async entities
-        in parallel and other entities sequential.
+        Every entity is polled on its own. An entity whose previous update is
+        still running skips this round, the other entities are still updated.
+        To protect from flooding the executor, sync entities are limited by
+        the parallel updates semaphore. With SPREAD_POLLING the updates are
+        started spread over the scan interval instead of all at once.
 
         This method must be run in the event loop.
         """
-        if self._process_updates is None:
-            self._process_updates = asyncio.Lock()
-        if self._process_updates.locked():
-            self.logger.warning(
-                "Updating %s %s took longer than the scheduled update interval %s",
-                self.platform_name,
-                self.domain,
-                self.scan_interval,
-            )
+        entities = [entity for entity in self.entities.values() if entity.should_poll]
+
+        if not entities:
             return
 
-        async with self._process_updates:
-            tasks = []
-            for entity in self.entities.values():
-                if not entity.should_poll:
-                    continue
-                tasks.append(entity.async_update_ha_state(True))
+        spread = 0.0
+        if self.spread_polling:
+            spread = self.scan_interval.total_seconds() / len(entities)
+
+        tasks = []
+        for index, entity in enumerate(entities):
+            entity_id = entity.entity_id
+
+            if entity_id in self._polls_in_progress:
+                self._poll_timing(entity_id).skipped += 1
+                self.logger.warning(
+                    "Updating %s %s took longer than the scheduled update interval %s",
+                    self.platform_name,
+                    entity_id,
+                    self.scan_interval,
+                )
+                continue
 
-            if tasks:
-                await asyncio.gather(*tasks)
+            self._polls_in_progress.add(entity_id)
+
+            if index and spread:
+                self.hass.loop.call_later(
+                    index * spread, self._async_schedule_poll_entity, entity
+                )
+            else:
+                tasks.append(self._async_poll_entity(entity))
+
+        if tasks:
+            await asyncio.gather(*tasks)
+
+    @callback
+    def _async_schedule_poll_entity(self, entity: "Entity") -> None:
+        """Start a poll that was spread over the scan interval."""
+        self.hass.async_create_task(self._async_poll_entity(entity))
+
+    async def _async_poll_entity(self, entity: "Entity") -> None:
+        """Update a polling entity and keep track of how long it took."""
+        entity_id = entity.entity_id
+
+        try:
+            # Entity was removed while its poll was scheduled
+            if self.entities.get(entity_id) is not entity:
+                return
+
+            start = self.hass.loop.time()
+            await entity.async_update_ha_state(True)
+            if self.entities.get(entity_id) is entity:
+                self._poll_timing(entity_id).add(self.hass.loop.time() - start)
+        finally:
+            self._polls_in_progress.discard(entity_id)
+
+    @callback
+    def _poll_timing(self, entity_id: str) -> PollTiming:
+        """Return the poll timing of an entity."""
+        timing = self.poll_timings.get(entity_id)
+        if timing is None:
+            timing = self.poll_timings[entity_id] = PollTiming()
+        return timing
 
 
 current_platform: ContextVar[Optional[EntityPlatform]] = ContextVar(
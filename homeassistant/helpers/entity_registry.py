@@ -125,7 +125,10 @@ class EntityRegistry:
         self.hass = hass
         self.entities: Dict[str, RegistryEntry]
         self._index: Dict[Tuple[str, str, str], str] = {}
-        self._store = hass.helpers.storage.Store(STORAGE_VERSION, STORAGE_KEY)
+        self._device_index: Dict[str, Dict[str, None]] = {}
+        self._store = hass.helpers.storage.Store(
+            STORAGE_VERSION, STORAGE_KEY, journal=True
+        )
         self.hass.bus.async_listen(
             EVENT_DEVICE_REGISTRY_UPDATED, self.async_device_removed
         )
@@ -490,6 +493,8 @@ class EntityRegistry:
 
     def _add_index(self, entry: RegistryEntry) -> None:
         self._index[(entry.domain, entry.platform, entry.unique_id)] = entry.entity_id
+        if entry.device_id is not None:
+            self._device_index.setdefault(entry.device_id, {})[entry.entity_id] = None
 
     def _unregister_entry(self, entry: RegistryEntry) -> None:
         self._remove_index(entry)
@@ -497,9 +502,15 @@ class EntityRegistry:
 
     def _remove_index(self, entry: RegistryEntry) -> None:
         del self._index[(entry.domain, entry.platform, entry.unique_id)]
+        entity_ids = self._device_index.get(entry.device_id)
+        if entity_ids is not None:
+            entity_ids.pop(entry.entity_id, None)
+            if not entity_ids:
+                del self._device_index[entry.device_id]
 
     def _rebuild_index(self) -> None:
         self._index = {}
+        self._device_index = {}
         for entry in self.entities.values():
             self._add_index(entry)
 
@@ -517,8 +528,10 @@ def async_entries_for_device(
     registry: EntityRegistry, device_id: str
 ) -> List[RegistryEntry]:
     """Return entries that match a device."""
+    # pylint: disable=protected-access
     return [
-        entry for entry in registry.entities.values() if entry.device_id == device_id
+        registry.entities[entity_id]
+        for entity_id in registry._device_index.get(device_id, ())
     ]
 
 
@@ -33,6 +33,7 @@ from homeassistant.const import (
 from homeassistant.core import (
     CALLBACK_TYPE,
     Event,
+    HassJob,
     HomeAssistant,
     State,
     callback,
@@ -158,6 +159,8 @@ def async_track_state_change(
     else:
         entity_ids = tuple(entity_id.lower() for entity_id in entity_ids)
 
+    job = HassJob(action)
+
     @callback
     def state_change_listener(event: Event) -> None:
         """Handle specific state changes."""
@@ -176,8 +179,8 @@ def async_track_state_change(
             if not match_to_state(new_state):
                 return
 
-        hass.async_run_job(
-            action,
+        hass.async_run_hass_job(
+            job,
             event.data.get("entity_id"),
             event.data.get("old_state"),
             event.data.get("new_state"),
@@ -230,9 +233,9 @@ def async_track_state_change_event(
             if entity_id not in entity_callbacks:
                 return
 
-            for action in entity_callbacks[entity_id][:]:
+            for job in entity_callbacks[entity_id][:]:
                 try:
-                    hass.async_run_job(action, event)
+                    hass.async_run_hass_job(job, event)
                 except Exception:  # pylint: disable=broad-except
                     _LOGGER.exception(
                         "Error while processing state changed for %s", entity_id
@@ -244,8 +247,10 @@ def async_track_state_change_event(
 
     entity_ids = _async_string_to_lower_list(entity_ids)
 
+    job = HassJob(action)
+
     for entity_id in entity_ids:
-        entity_callbacks.setdefault(entity_id, []).append(action)
+        entity_callbacks.setdefault(entity_id, []).append(job)
 
     @callback
     def remove_listener() -> None:
@@ -255,7 +260,7 @@ def async_track_state_change_event(
             TRACK_STATE_CHANGE_CALLBACKS,
             TRACK_STATE_CHANGE_LISTENER,
             entity_ids,
-            action,
+            job,
         )
 
     return remove_listener
@@ -267,14 +272,14 @@ def _async_remove_indexed_listeners(
     data_key: str,
     listener_key: str,
     storage_keys: Iterable[str],
-    action: Callable[[Event], Any],
+    job: HassJob,
 ) -> None:
     """Remove a listener."""
 
     callbacks = hass.data[data_key]
 
     for storage_key in storage_keys:
-        callbacks[storage_key].remove(action)
+        callbacks[storage_key].remove(job)
         if len(callbacks[storage_key]) == 0:
             del callbacks[storage_key]
 
@@ -306,9 +311,9 @@ def async_track_entity_registry_updated_event(
             if entity_id not in entity_callbacks:
                 return
 
-            for action in entity_callbacks[entity_id][:]:
+            for job in entity_callbacks[entity_id][:]:
                 try:
-                    hass.async_run_job(action, event)
+                    hass.async_run_hass_job(job, event)
                 except Exception:  # pylint: disable=broad-except
                     _LOGGER.exception(
                         "Error while processing entity registry update for %s",
@@ -321,8 +326,10 @@ def async_track_entity_registry_updated_event(
 
     entity_ids = _async_string_to_lower_list(entity_ids)
 
+    job = HassJob(action)
+
     for entity_id in entity_ids:
-        entity_callbacks.setdefault(entity_id, []).append(action)
+        entity_callbacks.setdefault(entity_id, []).append(job)
 
     @callback
     def remove_listener() -> None:
@@ -332,7 +339,7 @@ def async_track_entity_registry_updated_event(
             TRACK_ENTITY_REGISTRY_UPDATED_CALLBACKS,
             TRACK_ENTITY_REGISTRY_UPDATED_LISTENER,
             entity_ids,
-            action,
+            job,
         )
 
     return remove_listener
@@ -340,7 +347,7 @@ def async_track_entity_registry_updated_event(
 
 @callback
 def _async_dispatch_domain_event(
-    hass: HomeAssistant, event: Event, callbacks: Dict[str, List]
+    hass: HomeAssistant, event: Event, callbacks: Dict[str, List[HassJob]]
 ) -> None:
     domain = split_entity_id(event.data["entity_id"])[0]
 
@@ -349,9 +356,9 @@ def _async_dispatch_domain_event(
 
     listeners = callbacks.get(domain, []) + callbacks.get(MATCH_ALL, [])
 
-    for action in listeners:
+    for job in listeners:
         try:
-            hass.async_run_job(action, event)
+            hass.async_run_hass_job(job, event)
         except Exception:  # pylint: disable=broad-except
             _LOGGER.exception(
                 "Error while processing event %s for domain %s", event, domain
@@ -384,8 +391,10 @@ def async_track_state_added_domain(
 
     domains = _async_string_to_lower_list(domains)
 
+    job = HassJob(action)
+
     for domain in domains:
-        domain_callbacks.setdefault(domain, []).append(action)
+        domain_callbacks.setdefault(domain, []).append(job)
 
     @callback
     def remove_listener() -> None:
@@ -395,7 +404,7 @@ def async_track_state_added_domain(
             TRACK_STATE_ADDED_DOMAIN_CALLBACKS,
             TRACK_STATE_ADDED_DOMAIN_LISTENER,
             domains,
-            action,
+            job,
         )
 
     return remove_listener
@@ -427,8 +436,10 @@ def async_track_state_removed_domain(
 
     domains = _async_string_to_lower_list(domains)
 
+    job = HassJob(action)
+
     for domain in domains:
-        domain_callbacks.setdefault(domain, []).append(action)
+        domain_callbacks.setdefault(domain, []).append(job)
 
     @callback
     def remove_listener() -> None:
@@ -438,7 +449,7 @@ def async_track_state_removed_domain(
             TRACK_STATE_REMOVED_DOMAIN_CALLBACKS,
             TRACK_STATE_REMOVED_DOMAIN_LISTENER,
             domains,
-            action,
+            job,
         )
 
     return remove_listener
@@ -497,6 +508,8 @@ def async_track_template(
 
     """
 
+    job = HassJob(action)
+
     @callback
     def _template_changed_listener(
         event: Event, updates: List[TrackTemplateResult]
@@ -523,8 +536,8 @@ def async_track_template(
         ):
             return
 
-        hass.async_run_job(
-            action,
+        hass.async_run_hass_job(
+            job,
             event.data.get("entity_id"),
             event.data.get("old_state"),
             event.data.get("new_state"),
@@ -548,10 +561,12 @@ class _TrackTemplateResultInfo:
         hass: HomeAssistant,
         track_templates: Iterable[TrackTemplate],
         action: Callable,
+        rate_limit: Optional[timedelta] = None,
     ):
         """Handle removal / refresh of tracker init."""
         self.hass = hass
-        self._action = action
+        self._job = HassJob(action)
+        self._rate_limit = rate_limit.total_seconds() if rate_limit else None
 
         for track_template_ in track_templates:
             track_template_.template.hass = hass
@@ -565,6 +580,11 @@ class _TrackTemplateResultInfo:
         self._last_domains: Set = set()
         self._last_entities: Set = set()
 
+        self._last_render: float = 0
+        self._pending_templates: Dict[Template, TrackTemplate] = {}
+        self._pending_event: Optional[Event] = None
+        self._pending_refresh: Optional[asyncio.TimerHandle] = None
+
     def async_setup(self, raise_on_template_error: bool) -> None:
         """Activation of template tracking."""
         for track_template_ in self._track_templates:
@@ -715,6 +735,15 @@ class _TrackTemplateResultInfo:
         self._cancel_listener(_TEMPLATE_ALL_LISTENER)
         self._cancel_listener(_TEMPLATE_DOMAINS_LISTENER)
         self._cancel_listener(_TEMPLATE_ENTITIES_LISTENER)
+        self._cancel_pending_refresh()
+
+    @callback
+    def _cancel_pending_refresh(self) -> None:
+        if self._pending_refresh is not None:
+            self._pending_refresh.cancel()
+            self._pending_refresh = None
+        self._pending_templates.clear()
+        self._pending_event = None
 
     @callback
     def async_refresh(self) -> None:
@@ -723,24 +752,64 @@ class _TrackTemplateResultInfo:
 
     @callback
     def _refresh(self, event: Optional[Event]) -> None:
-        entity_id = event and event.data.get(ATTR_ENTITY_ID)
-        lifecycle_event = event and (
+        if event is None:
+            # Forced refresh, render everything right away
+            self._cancel_pending_refresh()
+            self._render(None, self._track_templates)
+            return
+
+        entity_id = event.data.get(ATTR_ENTITY_ID)
+        lifecycle_event = (
             event.data.get("new_state") is None or event.data.get("old_state") is None
         )
+        track_templates = [
+            track_template_
+            for track_template_ in self._track_templates
+            if not entity_id
+            or self._last_info[track_template_.template].filter(entity_id)
+            or (
+                lifecycle_event
+                and self._last_info[track_template_.template].filter_lifecycle(
+                    entity_id
+                )
+            )
+        ]
+
+        if not track_templates:
+            return
+
+        if self._rate_limit is None:
+            self._render(event, track_templates)
+            return
+
+        # Coalesce the changes until the next render is allowed
+        for track_template_ in track_templates:
+            self._pending_templates[track_template_.template] = track_template_
+        self._pending_event = event
+
+        if self._pending_refresh is not None:
+            return
+
+        delay = max(0, self._last_render + self._rate_limit - self.hass.loop.time())
+        self._pending_refresh = self.hass.loop.call_later(delay, self._refresh_pending)
+
+    @callback
+    def _refresh_pending(self) -> None:
+        event = self._pending_event
+        track_templates = list(self._pending_templates.values())
+        self._cancel_pending_refresh()
+        self._render(event, track_templates)
+
+    @callback
+    def _render(
+        self, event: Optional[Event], track_templates: Iterable[TrackTemplate]
+    ) -> None:
+        self._last_render = self.hass.loop.time()
         updates = []
         info_changed = False
 
-        for track_template_ in self._track_templates:
+        for track_template_ in track_templates:
             template = track_template_.template
-            if (
-                entity_id
-                and not self._last_info[template].filter(entity_id)
-                and (
-                    not lifecycle_event
-                    or not self._last_info[template].filter_lifecycle(entity_id)
-                )
-            ):
-                continue
 
             _LOGGER.debug(
                 "Template update %s triggered by event: %s",
@@ -751,7 +820,10 @@ class _TrackTemplateResultInfo:
             self._info[template] = template.async_render_to_info(
                 track_template_.variables
             )
-            info_changed = True
+            if not info_changed and _render_info_listeners_changed(
+                self._last_info[template], self._info[template]
+            ):
+                info_changed = True
 
             try:
                 result: Union[str, TemplateError] = self._info[template].result()
@@ -778,7 +850,8 @@ class _TrackTemplateResultInfo:
                 self._track_templates,
                 self.listeners,
             )
-            self._last_info = self._info.copy()
+
+        self._last_info = self._info.copy()
 
         if not updates:
             return
@@ -786,7 +859,7 @@ class _TrackTemplateResultInfo:
         for track_result in updates:
             self._last_result[track_result.template] = track_result.result
 
-        self.hass.async_run_job(self._action, event, updates)
+        self.hass.async_run_hass_job(self._job, event, updates)
 
 
 TrackTemplateResultListener = Callable[
@@ -815,6 +888,7 @@ def async_track_template_result(
     track_templates: Iterable[TrackTemplate],
     action: TrackTemplateResultListener,
     raise_on_template_error: bool = False,
+    rate_limit: Optional[timedelta] = None,
 ) -> _TrackTemplateResultInfo:
     """Add a listener that fires when a the result of a template changes.
 
@@ -843,13 +917,17 @@ def async_track_template_result(
         processing the template during setup, the system
         will raise the exception instead of setting up
         tracking.
+    rate_limit
+        When set, state changes are coalesced and each template
+        is rendered at most once per rate_limit. Changes arriving
+        in the same event loop iteration are always rendered once.
 
     Returns
     -------
     Info object used to unregister the listener, and refresh the template.
 
     """
-    tracker = _TrackTemplateResultInfo(hass, track_templates, action)
+    tracker = _TrackTemplateResultInfo(hass, track_templates, action, rate_limit)
     tracker.async_setup(raise_on_template_error)
     return tracker
 
@@ -871,6 +949,8 @@ def async_track_same_state(
     async_remove_state_for_cancel: Optional[CALLBACK_TYPE] = None
     async_remove_state_for_listener: Optional[CALLBACK_TYPE] = None
 
+    job = HassJob(action)
+
     @callback
     def clear_listener() -> None:
         """Clear all unsub listener."""
@@ -889,7 +969,7 @@ def async_track_same_state(
         nonlocal async_remove_state_for_listener
         async_remove_state_for_listener = None
         clear_listener()
-        hass.async_run_job(action)
+        hass.async_run_hass_job(job)
 
     @callback
     def state_for_cancel_listener(event: Event) -> None:
@@ -928,11 +1008,12 @@ def async_track_point_in_time(
     hass: HomeAssistant, action: Callable[..., None], point_in_time: datetime
 ) -> CALLBACK_TYPE:
     """Add a listener that fires once after a specific point in time."""
+    job = HassJob(action)
 
     @callback
     def utc_converter(utc_now: datetime) -> None:
         """Convert passed in UTC now to local now."""
-        hass.async_run_job(action, dt_util.as_local(utc_now))
+        hass.async_run_hass_job(job, dt_util.as_local(utc_now))
 
     return async_track_point_in_utc_time(hass, utc_converter, point_in_time)
 
@@ -951,8 +1032,8 @@ def async_track_point_in_utc_time(
 
     cancel_callback = hass.loop.call_at(
         hass.loop.time() + point_in_time.timestamp() - time.time(),
-        hass.async_run_job,
-        action,
+        hass.async_run_hass_job,
+        HassJob(action),
         utc_point_in_time,
     )
 
@@ -990,6 +1071,7 @@ def async_track_time_interval(
 ) -> CALLBACK_TYPE:
     """Add a listener that fires repetitively at every timedelta interval."""
     remove = None
+    job = HassJob(action)
 
     def next_interval() -> datetime:
         """Return the next interval."""
@@ -1000,7 +1082,7 @@ def async_track_time_interval(
         """Handle elapsed intervals."""
         nonlocal remove
         remove = async_track_point_in_utc_time(hass, interval_listener, next_interval())
-        hass.async_run_job(action, now)
+        hass.async_run_hass_job(job, now)
 
     remove = async_track_point_in_utc_time(hass, interval_listener, next_interval())
 
@@ -1019,7 +1101,7 @@ class SunListener:
     """Helper class to help listen to sun events."""
 
     hass: HomeAssistant = attr.ib()
-    action: Callable[..., None] = attr.ib()
+    job: HassJob = attr.ib()
     event: str = attr.ib()
     offset: Optional[timedelta] = attr.ib()
     _unsub_sun: Optional[CALLBACK_TYPE] = attr.ib(default=None)
@@ -1063,7 +1145,7 @@ class SunListener:
         """Handle solar event."""
         self._unsub_sun = None
         self._listen_next_sun_event()
-        self.hass.async_run_job(self.action)
+        self.hass.async_run_hass_job(self.job)
 
     @callback
     def _handle_config_event(self, _event: Any) -> None:
@@ -1080,7 +1162,7 @@ def async_track_sunrise(
     hass: HomeAssistant, action: Callable[..., None], offset: Optional[timedelta] = None
 ) -> CALLBACK_TYPE:
     """Add a listener that will fire a specified offset from sunrise daily."""
-    listener = SunListener(hass, action, SUN_EVENT_SUNRISE, offset)
+    listener = SunListener(hass, HassJob(action), SUN_EVENT_SUNRISE, offset)
     listener.async_attach()
     return listener.async_detach
 
@@ -1094,7 +1176,7 @@ def async_track_sunset(
     hass: HomeAssistant, action: Callable[..., None], offset: Optional[timedelta] = None
 ) -> CALLBACK_TYPE:
     """Add a listener that will fire a specified offset from sunset daily."""
-    listener = SunListener(hass, action, SUN_EVENT_SUNSET, offset)
+    listener = SunListener(hass, HassJob(action), SUN_EVENT_SUNSET, offset)
     listener.async_attach()
     return listener.async_detach
 
@@ -1116,6 +1198,7 @@ def async_track_utc_time_change(
     local: bool = False,
 ) -> CALLBACK_TYPE:
     """Add a listener that will fire if time matches a pattern."""
+    job = HassJob(action)
     # We do not have to wrap the function with time pattern matching logic
     # if no pattern given
     if all(val is None for val in (hour, minute, second)):
@@ -1123,7 +1206,7 @@ def async_track_utc_time_change(
         @callback
         def time_change_listener(event: Event) -> None:
             """Fire every time event that comes in."""
-            hass.async_run_job(action, event.data[ATTR_NOW])
+            hass.async_run_hass_job(job, event.data[ATTR_NOW])
 
         return hass.bus.async_listen(EVENT_TIME_CHANGED, time_change_listener)
 
@@ -1153,7 +1236,7 @@ def async_track_utc_time_change(
         nonlocal next_time, cancel_callback
 
         now = pattern_utc_now()
-        hass.async_run_job(action, dt_util.as_local(now) if local else now)
+        hass.async_run_hass_job(job, dt_util.as_local(now) if local else now)
 
         calculate_next(now + timedelta(seconds=1))
 
@@ -1237,6 +1320,19 @@ def process_state_match(
     return lambda state: state in parameter_set
 
 
+def _render_info_listeners_changed(old_info: RenderInfo, new_info: RenderInfo) -> bool:
+    """Return if a new render needs different listeners than the old one."""
+    return (
+        old_info.all_states != new_info.all_states
+        or old_info.all_states_lifecycle != new_info.all_states_lifecycle
+        or old_info.is_static != new_info.is_static
+        or (old_info.exception is None) != (new_info.exception is None)
+        or old_info.entities != new_info.entities
+        or old_info.domains != new_info.domains
+        or old_info.domains_lifecycle != new_info.domains_lifecycle
+    )
+
+
 def _entities_domains_from_info(render_infos: Iterable[RenderInfo]) -> Tuple[Set, Set]:
     """Combine from multiple RenderInfo."""
     entities = set()
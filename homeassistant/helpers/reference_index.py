@@ -0,0 +1,143 @@
+"""Index of the entities and devices referenced by other entities.
+
+Automations, scripts, scenes and groups register the entities and devices
+they reference when they are added to Home Assistant and remove them again
+when they are removed. This allows answering "who references X" without
+walking every automation, script, scene or group.
+"""
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from homeassistant.core import HomeAssistant, callback, split_entity_id
+from homeassistant.loader import bind_hass
+
+DATA_REFERENCE_INDEX = "reference_index"
+
+# Sources per referenced id, grouped by the domain of the source
+_IndexType = Dict[str, Dict[str, Dict[str, None]]]
+
+
+class ReferenceIndex:
+    """Keep track of the entities and devices that entities reference."""
+
+    def __init__(self) -> None:
+        """Initialize the index."""
+        self._references: Dict[str, Tuple[Tuple[str, ...], Tuple[str, ...]]] = {}
+        self._entities: _IndexType = {}
+        self._devices: _IndexType = {}
+
+    @callback
+    def async_set(
+        self,
+        source: str,
+        entity_ids: Iterable[str] = (),
+        device_ids: Iterable[str] = (),
+    ) -> None:
+        """Set the entities and devices referenced by a source entity."""
+        self.async_remove(source)
+
+        domain = split_entity_id(source)[0]
+        references = (tuple(entity_ids), tuple(device_ids))
+        self._references[source] = references
+
+        for index, ids in zip((self._entities, self._devices), references):
+            for item_id in ids:
+                index.setdefault(domain, {}).setdefault(item_id, {})[source] = None
+
+    @callback
+    def async_remove(self, source: str) -> None:
+        """Remove the references of a source entity."""
+        references = self._references.pop(source, None)
+
+        if references is None:
+            return
+
+        domain = split_entity_id(source)[0]
+
+        for index, ids in zip((self._entities, self._devices), references):
+            domain_index = index.get(domain)
+            if domain_index is None:
+                continue
+            for item_id in ids:
+                sources = domain_index.get(item_id)
+                if sources is None:
+                    continue
+                sources.pop(source, None)
+                if not sources:
+                    del domain_index[item_id]
+            if not domain_index:
+                del index[domain]
+
+    @callback
+    def async_entities(self, source: str) -> List[str]:
+        """Return the entities referenced by a source entity."""
+        references = self._references.get(source)
+        return [] if references is None else list(references[0])
+
+    @callback
+    def async_devices(self, source: str) -> List[str]:
+        """Return the devices referenced by a source entity."""
+        references = self._references.get(source)
+        return [] if references is None else list(references[1])
+
+    @callback
+    def async_sources_with_entity(
+        self, entity_id: str, domain: Optional[str] = None
+    ) -> List[str]:
+        """Return the sources that reference an entity.
+
+        Limited to the sources of one domain if domain is given.
+        """
+        return _sources_with(self._entities, entity_id, domain)
+
+    @callback
+    def async_sources_with_device(
+        self, device_id: str, domain: Optional[str] = None
+    ) -> List[str]:
+        """Return the sources that reference a device.
+
+        Limited to the sources of one domain if domain is given.
+        """
+        return _sources_with(self._devices, device_id, domain)
+
+    @callback
+    def async_related(
+        self,
+        entity_ids: Iterable[str] = (),
+        device_ids: Iterable[str] = (),
+    ) -> Dict[str, Set[str]]:
+        """Return the sources referencing any of the entities and devices.
+
+        The result is keyed by the domain of the sources.
+        """
+        related: Dict[str, Set[str]] = {}
+        for index, ids in ((self._entities, entity_ids), (self._devices, device_ids)):
+            for item_id in ids:
+                for domain, domain_index in index.items():
+                    sources = domain_index.get(item_id)
+                    if sources:
+                        related.setdefault(domain, set()).update(sources)
+        return related
+
+
+def _sources_with(index: _IndexType, item_id: str, domain: Optional[str]) -> List[str]:
+    """Return the sources in the index that reference item_id."""
+    if domain is not None:
+        return list(index.get(domain, {}).get(item_id, ()))
+
+    return [
+        source
+        for domain_index in index.values()
+        for source in domain_index.get(item_id, ())
+    ]
+
+
+@callback
+@bind_hass
+def async_get(hass: HomeAssistant) -> ReferenceIndex:
+    """Return the reference index."""
+    index: Optional[ReferenceIndex] = hass.data.get(DATA_REFERENCE_INDEX)
+
+    if index is None:
+        index = hass.data[DATA_REFERENCE_INDEX] = ReferenceIndex()
+
+    return index
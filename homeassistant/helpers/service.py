@@ -383,43 +383,37 @@ async def entity_service_call(
     # A list with entities to call the service on.
     entity_candidates: List["Entity"] = []
 
-    if entity_perms is None:
+    if target_all_entities:
         for platform in platforms:
-            if target_all_entities:
+            if entity_perms is None:
                 entity_candidates.extend(platform.entities.values())
             else:
+                # If we target all entities, we will select all entities the
+                # user is allowed to control.
                 entity_candidates.extend(
                     [
                         entity
                         for entity in platform.entities.values()
-                        if entity.entity_id in entity_ids
+                        if entity_perms(entity.entity_id, POLICY_CONTROL)
                     ]
                 )
 
-    elif target_all_entities:
-        # If we target all entities, we will select all entities the user
-        # is allowed to control.
-        for platform in platforms:
-            entity_candidates.extend(
-                [
-                    entity
-                    for entity in platform.entities.values()
-                    if entity_perms(entity.entity_id, POLICY_CONTROL)
-                ]
-            )
-
     else:
+        # Look the targeted entities up in the entity_id index of each
+        # platform, so the call does not scale with the number of entities.
         for platform in platforms:
             platform_entities = []
-            for entity in platform.entities.values():
-
-                if entity.entity_id not in entity_ids:
+            for entity_id in entity_ids:
+                entity = platform.entities.get(entity_id)
+                if entity is None:
                     continue
 
-                if not entity_perms(entity.entity_id, POLICY_CONTROL):
+                if entity_perms is not None and not entity_perms(
+                    entity_id, POLICY_CONTROL
+                ):
                     raise Unauthorized(
                         context=call.context,
-                        entity_id=entity.entity_id,
+                        entity_id=entity_id,
                         permission=POLICY_CONTROL,
                     )
 
@@ -427,7 +421,6 @@ async def entity_service_call(
 
             entity_candidates.extend(platform_entities)
 
-    if not target_all_entities:
         for entity in entity_candidates:
             entity_ids.remove(entity.entity_id)
 
@@ -1,5 +1,6 @@
 """Helper to help store data."""
 import asyncio
+import json
 from json import JSONEncoder
 import logging
 import os
@@ -7,6 +8,7 @@ from typing import Any, Callable, Dict, List, Optional, Type, Union
 
 from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE
 from homeassistant.core import CALLBACK_TYPE, CoreState, HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.event import async_call_later
 from homeassistant.loader import bind_hass
 from homeassistant.util import json as json_util
@@ -15,6 +17,9 @@ from homeassistant.util import json as json_util
 # mypy: no-check-untyped-defs
 
 STORAGE_DIR = ".storage"
+JOURNAL_SUFFIX = ".journal"
+# Rewrite the full file once the journal holds this many entries
+JOURNAL_MAX_ENTRIES = 100
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -72,8 +77,15 @@ class Store:
         private: bool = False,
         *,
         encoder: Optional[Type[JSONEncoder]] = None,
+        compact: bool = False,
+        journal: bool = False,
     ):
-        """Initialize storage class."""
+        """Initialize storage class.
+
+        Compact stores are written without indentation. Journal stores are
+        compact and append the changes since the last write to a journal file,
+        which is folded back into the main file once it grows too large.
+        """
         self.version = version
         self.key = key
         self.hass = hass
@@ -84,12 +96,24 @@ class Store:
         self._write_lock = asyncio.Lock()
         self._load_task: Optional[asyncio.Future] = None
         self._encoder = encoder
+        self._compact = compact or journal
+        self._journal = journal
+        # Last data written to or loaded from disk, used to diff journal writes
+        self._journal_snapshot: Optional[Dict[str, Any]] = None
+        self._journal_entries = 0
+        self._journal_size = 0
+        self._base_size = 0
 
     @property
     def path(self):
         """Return the config path."""
         return self.hass.config.path(STORAGE_DIR, self.key)
 
+    @property
+    def journal_path(self):
+        """Return the journal path."""
+        return f"{self.path}{JOURNAL_SUFFIX}"
+
     async def async_load(self) -> Union[Dict, List, None]:
         """Load data.
 
@@ -114,9 +138,7 @@ class Store:
             if "data_func" in data:
                 data["data"] = data.pop("data_func")()
         else:
-            data = await self.hass.async_add_executor_job(
-                json_util.load_json, self.path
-            )
+            data = await self.hass.async_add_executor_job(self._load_data)
 
             if data == {}:
                 return None
@@ -224,13 +246,108 @@ class Store:
             except (json_util.SerializationError, json_util.WriteError) as err:
                 _LOGGER.error("Error writing config for %s: %s", self.key, err)
 
+    def _load_data(self) -> Dict:
+        """Load the data and replay the journal."""
+        data = json_util.load_json(self.path)
+
+        if not self._journal or data == {}:
+            return data
+
+        self._base_size = os.path.getsize(self.path)
+        self._journal_entries = 0
+        self._journal_size = 0
+
+        try:
+            with open(self.journal_path, encoding="utf-8") as fdesc:
+                for line in fdesc:
+                    try:
+                        ops = json.loads(line)
+                    except ValueError:
+                        # A write was interrupted, compact on the next write
+                        _LOGGER.warning("Ignoring truncated journal for %s", self.key)
+                        self._journal_entries = JOURNAL_MAX_ENTRIES
+                        break
+                    data = _apply_ops(data, ops)
+                    self._journal_entries += 1
+                    self._journal_size += len(line)
+        except FileNotFoundError:
+            pass
+        except OSError as err:
+            raise HomeAssistantError(err) from err
+
+        self._journal_snapshot = json.loads(json.dumps(data))
+        return data
+
     def _write_data(self, path: str, data: Dict) -> None:
         """Write the data."""
         if not os.path.isdir(os.path.dirname(path)):
             os.makedirs(os.path.dirname(path))
 
         _LOGGER.debug("Writing data for %s", self.key)
-        json_util.save_json(path, data, self._private, encoder=self._encoder)
+
+        if not self._journal:
+            json_util.save_json(
+                path,
+                data,
+                self._private,
+                encoder=self._encoder,
+                compact=self._compact,
+            )
+            return
+
+        try:
+            json_data = json.dumps(data, separators=(",", ":"), cls=self._encoder)
+        except TypeError as error:
+            msg = f"Failed to serialize to JSON: {path}. Bad data at {json_util.format_unserializable_data(json_util.find_paths_unserializable_data(data))}"
+            _LOGGER.error(msg)
+            raise json_util.SerializationError(msg) from error
+
+        new_snapshot = json.loads(json_data)
+
+        if self._journal_snapshot is not None:
+            ops: List[list] = []
+            _diff(self._journal_snapshot, new_snapshot, [], ops)
+
+            if not ops:
+                return
+
+            line = json.dumps(ops, separators=(",", ":")) + "\n"
+
+            if (
+                self._journal_entries < JOURNAL_MAX_ENTRIES
+                and self._journal_size + len(line) < self._base_size
+            ):
+                self._append_journal(line)
+                self._journal_snapshot = new_snapshot
+                return
+
+        # Compact: rewrite the main file and drop the journal
+        json_util.write_utf8_file(path, json_data, self._private)
+        self._journal_snapshot = new_snapshot
+        self._base_size = len(json_data)
+        self._journal_entries = 0
+        self._journal_size = 0
+        try:
+            os.unlink(self.journal_path)
+        except FileNotFoundError:
+            pass
+
+    def _append_journal(self, line: str) -> None:
+        """Append a line to the journal."""
+        try:
+            fdesc = os.open(
+                self.journal_path,
+                os.O_WRONLY | os.O_APPEND | os.O_CREAT,
+                0o600 if self._private else 0o644,
+            )
+            with open(fdesc, "w", encoding="utf-8") as journal:
+                journal.write(line)
+        except OSError as error:
+            _LOGGER.exception("Appending to journal failed: %s", self.journal_path)
+            raise json_util.WriteError(error) from error
+
+        self._journal_entries += 1
+        self._journal_size += len(line)
 
     async def _async_migrate_func(self, old_version, old_data):
         """Migrate to the new version."""
@@ -238,7 +355,77 @@ class Store:
 
     async def async_remove(self):
         """Remove all data."""
-        try:
-            await self.hass.async_add_executor_job(os.unlink, self.path)
-        except FileNotFoundError:
-            pass
+        self._journal_snapshot = None
+        for path in (self.path, self.journal_path):
+            try:
+                await self.hass.async_add_executor_job(os.unlink, path)
+            except FileNotFoundError:
+                pass
+
+
+def _diff(old: Any, new: Any, path: list, ops: List[list]) -> None:
+    """Append the operations that turn old into new to ops.
+
+    Operations are ["set", path, value], ["del", path] and
+    ["splice", path, start, stop, items] for lists.
+    """
+    if old == new:
+        return
+
+    if isinstance(old, dict) and isinstance(new, dict):
+        for key in old:
+            if key not in new:
+                ops.append(["del", path + [key]])
+        for key, value in new.items():
+            if key in old:
+                _diff(old[key], value, path + [key], ops)
+            else:
+                ops.append(["set", path + [key], value])
+        return
+
+    if isinstance(old, list) and isinstance(new, list):
+        start = 0
+        old_end = len(old)
+        new_end = len(new)
+        while start < old_end and start < new_end and old[start] == new[start]:
+            start += 1
+        while (
+            old_end > start and new_end > start and old[old_end - 1] == new[new_end - 1]
+        ):
+            old_end -= 1
+            new_end -= 1
+
+        if old_end == new_end:
+            for idx in range(start, old_end):
+                _diff(old[idx], new[idx], path + [idx], ops)
+        else:
+            ops.append(["splice", path, start, old_end, new[start:new_end]])
+        return
+
+    ops.append(["set", path, new])
+
+
+def _apply_ops(data: Any, ops: List[list]) -> Any:
+    """Apply operations generated by _diff to data and return the result."""
+    for op, path, *args in ops:
+        if op == "splice":
+            target = data
+            for key in path:
+                target = target[key]
+            target[args[0] : args[1]] = args[2]
+            continue
+
+        if not path:
+            data = args[0]
+            continue
+
+        parent = data
+        for key in path[:-1]:
+            parent = parent[key]
+
+        if op == "set":
+            parent[path[-1]] = args[0]
+        else:
+            del parent[path[-1]]
+
+    return data
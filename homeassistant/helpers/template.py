@@ -1,6 +1,7 @@
 """Template helper methods for rendering strings with Home Assistant data."""
 import asyncio
 import base64
+from collections import OrderedDict
 import collections.abc
 from datetime import datetime, timedelta
 from functools import wraps
@@ -57,6 +58,9 @@ _RE_GET_ENTITIES = re.compile(
 
 _RE_JINJA_DELIMITERS = re.compile(r"\{%|\{\{|\{#")
 
+# Number of compiled templates kept alive after their last user is gone
+TEMPLATE_CACHE_SIZE = 1024
+
 _RESERVED_NAMES = {"contextfunction", "evalcontextfunction", "environmentfunction"}
 
 _GROUP_DOMAIN_PREFIX = "group."
@@ -1201,6 +1205,9 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
         super().__init__()
         self.hass = hass
         self.template_cache = weakref.WeakValueDictionary()
+        self._recent_templates: OrderedDict = OrderedDict()
+        self.cache_hits = 0
+        self.cache_misses = 0
         self.filters["round"] = forgiving_round
         self.filters["multiply"] = multiply
         self.filters["log"] = logarithm
@@ -1310,7 +1317,18 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
         cached = self.template_cache.get(source)
 
         if cached is None:
+            self.cache_misses += 1
             cached = self.template_cache[source] = super().compile(source)
+        else:
+            self.cache_hits += 1
+
+        # Keep the most recently compiled templates alive so templates
+        # recreated on reload do not have to be compiled again.
+        recent = self._recent_templates
+        recent[source] = cached
+        recent.move_to_end(source)
+        if len(recent) > TEMPLATE_CACHE_SIZE:
+            recent.popitem(last=False)
 
         return cached
 
@@ -2,18 +2,32 @@
 import argparse
 import asyncio
 import collections
-from contextlib import suppress
-from datetime import datetime
+from contextlib import contextmanager, suppress
+from datetime import datetime, timedelta
+import itertools
 import json
 import logging
+import platform
+import sys
 from timeit import default_timer as timer
-from typing import Callable, Dict, TypeVar
+import tracemalloc
+from typing import Callable, Dict, Optional, TypeVar
 
-from homeassistant import core
+from homeassistant import config_entries, core
 from homeassistant.components.websocket_api.const import JSON_DUMP
-from homeassistant.const import ATTR_NOW, EVENT_STATE_CHANGED, EVENT_TIME_CHANGED
+from homeassistant.const import (
+    ATTR_NOW,
+    EVENT_HOMEASSISTANT_START,
+    EVENT_STATE_CHANGED,
+    EVENT_TIME_CHANGED,
+    MATCH_ALL,
+    __version__,
+)
+from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.entityfilter import convert_include_exclude_filter
+from homeassistant.helpers.event import TrackTemplate, async_track_template_result
 from homeassistant.helpers.json import JSONEncoder
+from homeassistant.helpers.template import Template
 from homeassistant.util import dt as dt_util
 
 # mypy: allow-untyped-calls, allow-untyped-defs, no-check-untyped-defs
@@ -32,24 +46,115 @@ def run(args):
     parser = argparse.ArgumentParser(description=("Run a Home Assistant benchmark."))
     parser.add_argument("name", choices=BENCHMARKS)
     parser.add_argument("--script", choices=["benchmark"])
+    parser.add_argument(
+        "--runs",
+        type=int,
+        default=0,
+        help="Number of runs, by default run until interrupted",
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Print the result of every run as a line of JSON",
+    )
+    parser.add_argument(
+        "--allocations",
+        action="store_true",
+        help="Trace memory allocations, this slows down the benchmark",
+    )
 
     args = parser.parse_args()
 
     bench = BENCHMARKS[args.name]
-    print("Using event loop:", asyncio.get_event_loop_policy().loop_name)
+    if not args.json:
+        print("Using event loop:", asyncio.get_event_loop_policy().loop_name)
 
+    runs = itertools.count() if args.runs <= 0 else range(args.runs)
     with suppress(KeyboardInterrupt):
-        while True:
-            asyncio.run(run_benchmark(bench))
-
-
-async def run_benchmark(bench):
-    """Run a benchmark."""
+        for _ in runs:
+            result = asyncio.run(run_benchmark(bench, args.allocations))
+            if args.json:
+                print(json.dumps(result), flush=True)
+            elif result["operations"] is None:
+                print(f"Benchmark {result['benchmark']} done in {result['runtime']}s")
+            else:
+                print(
+                    f"Benchmark {result['benchmark']} done in {result['runtime']}s "
+                    f"({result['ops_per_sec']:.0f} ops/sec)"
+                )
+
+
+async def run_benchmark(bench, trace_allocations=False):
+    """Run a benchmark and return its result.
+
+    Benchmarks return their runtime, or a tuple of the runtime and the
+    number of operations they timed.
+    """
     hass = core.HomeAssistant()
-    runtime = await bench(hass)
-    print(f"Benchmark {bench.__name__} done in {runtime}s")
+    if trace_allocations:
+        tracemalloc.start()
+    with fake_clock():
+        result = await bench(hass)
+    allocations = None
+    if trace_allocations:
+        snapshot = tracemalloc.take_snapshot()
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        # Memory still allocated at the end of the run, not every allocation
+        allocations = {
+            "retained_blocks": sum(
+                stat.count for stat in snapshot.statistics("filename")
+            ),
+            "current_bytes": current,
+            "peak_bytes": peak,
+        }
     await hass.async_stop()
 
+    operations: Optional[int] = None
+    if isinstance(result, tuple):
+        runtime, operations = result
+    else:
+        runtime = result
+
+    return {
+        "benchmark": bench.__name__,
+        "version": __version__,
+        "python": platform.python_version(),
+        "event_loop": asyncio.get_event_loop_policy().loop_name,
+        "runtime": runtime,
+        "operations": operations,
+        "ops_per_sec": operations / runtime if operations and runtime else None,
+        "allocations": allocations,
+    }
+
+
+class FakeClock:
+    """Clock that replaces dt_util.utcnow while a benchmark runs.
+
+    Every call advances the time by a microsecond, so timestamps stay
+    unique and runs do not depend on the wall clock.
+    """
+
+    def __init__(self, now: datetime) -> None:
+        """Initialize the clock."""
+        self.now = now
+
+    def __call__(self) -> datetime:
+        """Return the current fake time."""
+        self.now += timedelta(microseconds=1)
+        return self.now
+
+
+@contextmanager
+def fake_clock():
+    """Patch dt_util.utcnow with a FakeClock."""
+    original = dt_util.utcnow
+    dt_util.utcnow = FakeClock(datetime(2020, 10, 1, tzinfo=dt_util.UTC))
+    try:
+        yield
+    finally:
+        dt_util.utcnow = original
+
 
 def benchmark(func: CALLABLE_T) -> CALLABLE_T:
     """Decorate to mark a benchmark."""
@@ -82,7 +187,7 @@ async def fire_events(hass):
 
     await event.wait()
 
-    return timer() - start
+    return timer() - start, 10 ** 6
 
 
 @benchmark
@@ -110,7 +215,7 @@ async def time_changed_helper(hass):
 
     await event.wait()
 
-    return timer() - start
+    return timer() - start, 10 ** 6
 
 
 @benchmark
@@ -146,7 +251,7 @@ async def state_changed_helper(hass):
 
     await event.wait()
 
-    return timer() - start
+    return timer() - start, 10 ** 6
 
 
 @benchmark
@@ -182,7 +287,7 @@ async def state_changed_event_helper(hass):
 
     await event.wait()
 
-    return timer() - start
+    return timer() - start, 10 ** 6
 
 
 @benchmark
@@ -233,7 +338,7 @@ async def _logbook_filtering(hass, last_changed, last_updated):
 
     list(logbook.humanify(hass, yield_events(event), entity_attr_cache, {}))
 
-    return timer() - start
+    return timer() - start, 10 ** 5
 
 
 @benchmark
@@ -298,7 +403,7 @@ async def filtering_entity_id(hass):
     for i in range(10 ** 5):
         entities_filter(entity_ids[i % size])
 
-    return timer() - start
+    return timer() - start, 10 ** 5
 
 
 @benchmark
@@ -307,7 +412,7 @@ async def valid_entity_id(hass):
     start = timer()
     for _ in range(10 ** 6):
         core.valid_entity_id("light.kitchen")
-    return timer() - start
+    return timer() - start, 10 ** 6
 
 
 @benchmark
@@ -320,7 +425,260 @@ async def json_serialize_states(hass):
 
     start = timer()
     JSON_DUMP(states)
-    return timer() - start
+    return timer() - start, 10 ** 6
+
+
+@benchmark
+async def mqtt_message_dispatch(hass):
+    """Dispatch 100k MQTT messages with 1500 subscriptions."""
+    # pylint: disable=import-outside-toplevel
+    from paho.mqtt.client import MQTTMessage
+
+    from homeassistant.components import mqtt
+
+    conf = mqtt.CONFIG_SCHEMA({mqtt.DOMAIN: {mqtt.CONF_BROKER: "localhost"}})[
+        mqtt.DOMAIN
+    ]
+    entry = config_entries.ConfigEntry(
+        1,
+        mqtt.DOMAIN,
+        "benchmark",
+        {},
+        config_entries.SOURCE_USER,
+        config_entries.CONN_CLASS_LOCAL_PUSH,
+        system_options={},
+    )
+    client = mqtt.MQTT(hass, entry, conf)
+    count = 0
+
+    @core.callback
+    def listener(_):
+        """Handle message."""
+        nonlocal count
+        count += 1
+
+    for idx in range(1000):
+        await client.async_subscribe(f"zigbee2mqtt/device_{idx}", listener, 0)
+    for idx in range(500):
+        await client.async_subscribe(f"tele/tasmota_{idx}/+", listener, 0)
+    await client.async_subscribe("homeassistant/#", listener, 0)
+
+    messages = []
+    for idx in range(10 ** 5):
+        if idx % 2:
+            msg = MQTTMessage(topic=f"zigbee2mqtt/device_{idx % 1000}".encode())
+        else:
+            msg = MQTTMessage(topic=f"tele/tasmota_{idx % 500}/STATE".encode())
+        msg.payload = b"{}"
+        messages.append(msg)
+
+    start = timer()
+
+    for msg in messages:
+        # pylint: disable=protected-access
+        client._mqtt_handle_message(msg)
+
+    assert count == 10 ** 5
+
+    return timer() - start, 10 ** 5
+
+
+@benchmark
+async def state_write_listeners(hass):
+    """Write 20k states with 50 state changed listeners."""
+    count = 0
+    writes = 2 * 10 ** 4
+    listeners = 50
+    event = asyncio.Event()
+
+    @core.callback
+    def listener(_):
+        """Handle event."""
+        nonlocal count
+        count += 1
+
+        if count == writes * listeners:
+            event.set()
+
+    for _ in range(listeners):
+        hass.bus.async_listen(EVENT_STATE_CHANGED, listener)
+
+    start = timer()
+
+    for idx in range(writes):
+        hass.states.async_set(f"light.kitchen_{idx % 100}", str(idx))
+
+    await event.wait()
+
+    return timer() - start, writes
+
+
+@benchmark
+async def match_all_fanout(hass):
+    """Fire 10k events of different types to 100 MATCH_ALL listeners."""
+    count = 0
+    events = 10 ** 4
+    listeners = 100
+    event = asyncio.Event()
+
+    @core.callback
+    def listener(_):
+        """Handle event."""
+        nonlocal count
+        count += 1
+
+        if count == events * listeners:
+            event.set()
+
+    for _ in range(listeners):
+        hass.bus.async_listen(MATCH_ALL, listener)
+
+    start = timer()
+
+    for idx in range(events):
+        hass.bus.async_fire(f"benchmark_event_{idx % 10}")
+
+    await event.wait()
+
+    return timer() - start, events
+
+
+@benchmark
+async def entity_write_state(hass):
+    """Write the state of 1000 entities 100 times each."""
+
+    class BenchmarkEntity(Entity):
+        """Entity that changes its state on every write."""
+
+        def __init__(self, entity_id):
+            """Initialize the entity."""
+            self.hass = hass
+            self.entity_id = entity_id
+            self.value = 0
+
+        @property
+        def should_poll(self):
+            """Do not poll."""
+            return False
+
+        @property
+        def state(self):
+            """Return the state."""
+            return self.value
+
+    entities = [BenchmarkEntity(f"sensor.benchmark_{idx}") for idx in range(1000)]
+    writes = 10 ** 5
+
+    start = timer()
+
+    for idx in range(writes):
+        entity = entities[idx % 1000]
+        entity.value = idx
+        entity.async_write_ha_state()
+
+    return timer() - start, writes
+
+
+@benchmark
+async def template_render_storm(hass):
+    """Re-render 10 templates over 100 sensors for 500 state changes."""
+    count = 0
+    sensors = 100
+    changes = 500
+    templates = 10
+    event = asyncio.Event()
+
+    for idx in range(sensors):
+        hass.states.async_set(f"sensor.benchmark_{idx}", "0")
+
+    @core.callback
+    def listener(_event, updates):
+        """Handle template result change."""
+        nonlocal count
+        count += len(updates)
+
+        if count >= changes * templates:
+            event.set()
+
+    trackers = []
+    for idx in range(templates):
+        trackers.append(
+            async_track_template_result(
+                hass,
+                [
+                    TrackTemplate(
+                        Template(
+                            "{{ states.sensor | map(attribute='state') | join(',') }}"
+                            f"{idx}",
+                            hass,
+                        ),
+                        None,
+                    )
+                ],
+                listener,
+            )
+        )
+    count = 0
+
+    start = timer()
+
+    for idx in range(changes):
+        hass.states.async_set(f"sensor.benchmark_{idx % sensors}", str(idx + 1))
+        # Render after every change, queued changes would only be seen once
+        await hass.async_block_till_done()
+
+    await event.wait()
+
+    runtime = timer() - start
+    for tracker in trackers:
+        tracker.async_remove()
+    return runtime, changes * templates
+
+
+@benchmark
+async def recorder_ingest(hass):
+    """Record 10k state changes in an in-memory SQLite database."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.components import recorder
+
+    instance = recorder.Recorder(
+        hass,
+        auto_purge=False,
+        keep_days=1,
+        commit_interval=1,
+        uri="sqlite://",
+        db_max_retries=1,
+        db_retry_wait=0,
+        entity_filter=lambda entity_id: True,
+        exclude_t=[],
+        db_integrity_check=False,
+    )
+    instance.async_initialize()
+    instance.start()
+    if not await instance.async_db_ready:
+        sys.exit("The recorder could not be started")
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_START)
+
+    writes = 10 ** 4
+    event_data = {ATTR_NOW: dt_util.utcnow()}
+
+    start = timer()
+
+    for idx in range(writes):
+        hass.states.async_set(
+            f"sensor.benchmark_{idx % 100}", str(idx), {"unit_of_measurement": "W"}
+        )
+    hass.bus.async_fire(EVENT_TIME_CHANGED, event_data)
+    # Let the listeners queue every event before the recorder is waited on.
+    # The time changed event commits the session and the queue is processed
+    # in order, so the wait returns once the states are committed.
+    await hass.async_block_till_done()
+    await hass.async_add_executor_job(instance.block_till_done)
+
+    runtime = timer() - start
+    instance.queue.put(None)
+    await hass.async_add_executor_job(instance.join)
+    return runtime, writes
 
 
 def _create_state_changed_event_from_old_new(
@@ -48,18 +48,27 @@ def save_json(
     private: bool = False,
     *,
     encoder: Optional[Type[json.JSONEncoder]] = None,
+    compact: bool = False,
 ) -> None:
     """Save JSON data to a file.
 
-    Returns True on success.
+    Compact output skips indentation, which lets the C encoder do the work.
     """
     try:
-        json_data = json.dumps(data, indent=4, cls=encoder)
+        if compact:
+            json_data = json.dumps(data, separators=(",", ":"), cls=encoder)
+        else:
+            json_data = json.dumps(data, indent=4, cls=encoder)
     except TypeError as error:
         msg = f"Failed to serialize to JSON: {filename}. Bad data at {format_unserializable_data(find_paths_unserializable_data(data))}"
         _LOGGER.error(msg)
         raise SerializationError(msg) from error
 
+    write_utf8_file(filename, json_data, private)
+
+
+def write_utf8_file(filename: str, utf8_data: str, private: bool = False) -> None:
+    """Atomically write a string to a file using a temporary file."""
     tmp_filename = ""
     tmp_path = os.path.split(filename)[0]
     try:
@@ -67,7 +76,7 @@ def save_json(
         with tempfile.NamedTemporaryFile(
             mode="w", encoding="utf-8", dir=tmp_path, delete=False
         ) as fdesc:
-            fdesc.write(json_data)
+            fdesc.write(utf8_data)
             tmp_filename = fdesc.name
         if not private:
             os.chmod(tmp_filename, 0o644)
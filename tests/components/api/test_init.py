@@ -33,6 +33,35 @@ async def test_api_list_state_entities(hass, mock_api_client):
     assert remote_data == hass.states.async_all()
 
 
+async def test_api_get_states_since(hass, mock_api_client):
+    """Test getting the states changed since a revision."""
+    hass.states.async_set("hello.world", "nice")
+    hass.states.async_set("hello.bye", "bad")
+
+    resp = await mock_api_client.get("/api/states", params={"since": 0})
+    assert resp.status == 200
+    json = await resp.json()
+    assert json["full"]
+    assert json["removed"] == []
+    assert [ha.State.from_dict(item) for item in json["changed"]] == (
+        hass.states.async_all()
+    )
+
+    hass.states.async_set("hello.world", "nicer")
+    hass.states.async_remove("hello.bye")
+
+    resp = await mock_api_client.get("/api/states", params={"since": json["revision"]})
+    assert resp.status == 200
+    json = await resp.json()
+    assert not json["full"]
+    assert json["revision"] == hass.states.revision
+    assert [item["entity_id"] for item in json["changed"]] == ["hello.world"]
+    assert json["removed"] == ["hello.bye"]
+
+    resp = await mock_api_client.get("/api/states", params={"since": "abc"})
+    assert resp.status == const.HTTP_BAD_REQUEST
+
+
 async def test_api_get_state(hass, mock_api_client):
     """Test if the debug interface allows us to get a state."""
     hass.states.async_set("hello.world", "nice", {"attr": 1})
@@ -0,0 +1,45 @@
+"""Test camera img_util module."""
+import io
+
+from PIL import Image
+
+from homeassistant.components.camera.img_util import (
+    TurboJPEGSingleton,
+    scale_jpeg_image,
+)
+
+from tests.async_mock import Mock, patch
+
+
+def _jpeg(width, height):
+    """Return a jpeg image of the given size."""
+    output = io.BytesIO()
+    Image.new("RGB", (width, height)).save(output, format="JPEG")
+    return output.getvalue()
+
+
+def test_scale_jpeg_image_turbojpeg():
+    """Test we scale a jpeg image with TurboJPEG."""
+    turbo_jpeg = Mock()
+    turbo_jpeg.decode_header.return_value = (640, 480, 0, 0)
+    turbo_jpeg.scale_with_quality.return_value = b"scaled"
+
+    with patch("turbojpeg.TurboJPEG", return_value=turbo_jpeg):
+        TurboJPEGSingleton()
+        assert scale_jpeg_image(b"image", 640) == b"image"
+        assert scale_jpeg_image(b"image", 320) == b"scaled"
+
+    assert turbo_jpeg.scale_with_quality.call_args[1]["scaling_factor"] == (1, 2)
+
+
+def test_scale_jpeg_image_pillow():
+    """Test we fall back to Pillow without TurboJPEG."""
+    image = _jpeg(640, 480)
+
+    with patch("turbojpeg.TurboJPEG", side_effect=Exception):
+        TurboJPEGSingleton()
+        scaled = scale_jpeg_image(image, 160)
+        assert scale_jpeg_image(image, 640) == image
+        assert scale_jpeg_image(b"not a jpeg", 160) == b"not a jpeg"
+
+    assert Image.open(io.BytesIO(scaled)).size == (160, 120)
@@ -6,6 +6,7 @@ import io
 import pytest
 
 from homeassistant.components import camera
+from homeassistant.components.camera import hub as hub_module
 from homeassistant.components.camera.const import DOMAIN, PREF_PRELOAD_STREAM
 from homeassistant.components.camera.prefs import CameraEntityPreferences
 from homeassistant.components.websocket_api.const import TYPE_RESULT
@@ -110,6 +111,114 @@ async def test_get_image_fails(hass, image_mock_url):
         await camera.async_get_image(hass, "camera.demo_camera")
 
 
+async def test_get_image_shared(hass, image_mock_url):
+    """Test concurrent image requests share one fetch and are cached."""
+    calls = []
+    release = asyncio.Event()
+
+    async def mock_camera_image(self):
+        calls.append(self)
+        await release.wait()
+        return f"Image {len(calls)}".encode()
+
+    with patch(
+        "homeassistant.components.demo.camera.DemoCamera.async_camera_image",
+        mock_camera_image,
+    ):
+        tasks = [
+            hass.async_create_task(camera.async_get_image(hass, "camera.demo_camera"))
+            for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+        release.set()
+        images = await asyncio.gather(*tasks)
+
+        assert len(calls) == 1
+        assert [image.content for image in images] == [b"Image 1"] * 3
+
+        image = await camera.async_get_image(hass, "camera.demo_camera")
+        assert image.content == b"Image 1"
+        assert len(calls) == 1
+
+        with patch("homeassistant.components.camera.hub.SNAPSHOT_CACHE_TTL", 0):
+            image = await camera.async_get_image(hass, "camera.demo_camera")
+        assert image.content == b"Image 2"
+
+
+async def test_hub_fan_out(hass, image_mock_url):
+    """Test frames of a camera are fetched once for all subscriptions."""
+    demo_camera = hass.data[camera.DOMAIN].get_entity("camera.demo_camera")
+    hub = demo_camera.hub
+    images = [b"Image 1", b"Image 2"]
+    calls = []
+
+    async def mock_camera_image(self):
+        calls.append(self)
+        return images[0]
+
+    with patch(
+        "homeassistant.components.demo.camera.DemoCamera.async_camera_image",
+        mock_camera_image,
+    ):
+        sub_1 = hub.async_subscribe(0.5)
+        sub_2 = hub.async_subscribe(2)
+
+        assert await sub_1.async_get() == b"Image 1"
+        assert await sub_2.async_get() == b"Image 1"
+        assert len(calls) == 1
+
+        # A late viewer gets the current frame right away
+        sub_3 = hub.async_subscribe(1)
+        assert await sub_3.async_get() == b"Image 1"
+        sub_3.async_unsubscribe()
+
+        sub_1.async_unsubscribe()
+        assert hub._stream_task is not None
+        sub_2.async_unsubscribe()
+        assert hub._stream_task is None
+
+
+async def test_subscription_drops_frames(hass, image_mock_url):
+    """Test slow viewers only get the latest frame."""
+    demo_camera = hass.data[camera.DOMAIN].get_entity("camera.demo_camera")
+    subscription = hub_module.CameraSubscription(demo_camera.hub, 1)
+
+    subscription.async_put(b"Image 1")
+    subscription.async_put(b"Image 2")
+    assert await subscription.async_get() == b"Image 2"
+
+    subscription.async_put(None)
+    assert await subscription.async_get() is None
+
+
+async def test_camera_image_view_width(hass, hass_client, mock_camera):
+    """Test the image view serves scaled images and scales them once."""
+    client = await hass_client()
+
+    with patch(
+        "homeassistant.components.camera.hub.scale_jpeg_image",
+        side_effect=lambda image, width: f"{image.decode()} {width}".encode(),
+    ) as mock_scale:
+        resp = await client.get("/api/camera_proxy/camera.demo_camera?width=320")
+        assert resp.status == 200
+        assert await resp.read() == b"Test 320"
+
+        resp = await client.get("/api/camera_proxy/camera.demo_camera?width=320")
+        assert await resp.read() == b"Test 320"
+        assert len(mock_scale.mock_calls) == 1
+
+        resp = await client.get("/api/camera_proxy/camera.demo_camera")
+        assert await resp.read() == b"Test"
+
+        image = await camera.async_get_image(hass, "camera.demo_camera", width=160)
+        assert image.content == b"Test 160"
+        assert len(mock_scale.mock_calls) == 2
+
+    for width in ("0", "abc"):
+        resp = await client.get(f"/api/camera_proxy/camera.demo_camera?width={width}")
+        assert resp.status == 400
+
+
 async def test_snapshot_service(hass, mock_camera):
     """Test snapshot service."""
     mopen = mock_open()
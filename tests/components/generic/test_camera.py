@@ -43,7 +43,12 @@ async def test_fetching_url(aioclient_mock, hass, hass_client):
     body = await resp.text()
     assert body == "hello world"
 
+    # Snapshots are shared for a short time
     resp = await client.get("/api/camera_proxy/camera.config_test")
+    assert aioclient_mock.call_count == 1
+
+    with patch("homeassistant.components.camera.hub.SNAPSHOT_CACHE_TTL", 0):
+        resp = await client.get("/api/camera_proxy/camera.config_test")
     assert aioclient_mock.call_count == 2
 
 
@@ -101,6 +106,7 @@ async def test_fetching_url_with_verify_ssl(aioclient_mock, hass, hass_client):
     assert resp.status == 200
 
 
+@patch("homeassistant.components.camera.hub.SNAPSHOT_CACHE_TTL", 0)
 async def test_limit_refetch(aioclient_mock, hass, hass_client):
     """Test that it fetches the given url."""
     aioclient_mock.get("http://example.com/5a", text="hello world")
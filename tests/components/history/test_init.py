@@ -268,6 +268,83 @@ class TestComponentHistory(unittest.TestCase):
 
         assert states == hist
 
+    def test_stream_significant_states(self):
+        """Test streaming returns the same states one entity at a time."""
+        zero, four, _ = self.record_states()
+        for minimal_response in (False, True):
+            hist = history.get_significant_states(
+                self.hass,
+                zero,
+                four,
+                filters=history.Filters(),
+                minimal_response=minimal_response,
+            )
+            with recorder.session_scope(hass=self.hass) as session:
+                streamed = list(
+                    history.stream_significant_states(
+                        self.hass,
+                        session,
+                        zero,
+                        four,
+                        filters=history.Filters(),
+                        minimal_response=minimal_response,
+                    )
+                )
+            assert {
+                ent_results[0].entity_id: ent_results for ent_results in streamed
+            } == hist
+
+    def test_get_downsampled_states(self):
+        """Test numeric states are aggregated into buckets."""
+        self.test_setup()
+        start = dt_util.utcnow().replace(microsecond=0)
+        values = ["1", "3", "unavailable", "10", "20", "5"]
+        with patch("homeassistant.components.recorder.dt_util.utcnow") as mock_now:
+            for minute, value in enumerate(values):
+                point = start + timedelta(minutes=minute, seconds=30)
+                mock_now.return_value = point
+                with patch("homeassistant.core.dt_util.utcnow", return_value=point):
+                    self.hass.states.set("sensor.temperature", value)
+                    self.hass.states.set("switch.heater", "on" if minute < 3 else "off")
+                wait_recording_done(self.hass)
+
+        hist = history.get_downsampled_states(
+            self.hass, start, start + timedelta(minutes=6), timedelta(minutes=3)
+        )
+
+        assert hist["sensor.temperature"] == [
+            {
+                "start": start.isoformat(),
+                "min": 1.0,
+                "max": 3.0,
+                "mean": 2.0,
+                "last": "unavailable",
+            },
+            {
+                "start": (start + timedelta(minutes=3)).isoformat(),
+                "min": 5.0,
+                "max": 20.0,
+                "mean": 35 / 3,
+                "last": "5",
+            },
+        ]
+        assert hist["switch.heater"] == [
+            {
+                "start": start.isoformat(),
+                "min": None,
+                "max": None,
+                "mean": None,
+                "last": "on",
+            },
+            {
+                "start": (start + timedelta(minutes=3)).isoformat(),
+                "min": None,
+                "max": None,
+                "mean": None,
+                "last": "off",
+            },
+        ]
+
     def test_get_significant_states_with_initial(self):
         """Test that only significant states are returned.
 
@@ -940,3 +1017,184 @@ async def test_fetch_period_api_with_entity_glob_include_and_exclude(hass, hass_
     assert response_json[0][0]["entity_id"] == "light.match"
     assert response_json[1][0]["entity_id"] == "media_player.test"
     assert response_json[2][0]["entity_id"] == "switch.match"
+
+
+async def test_fetch_period_api_stream(hass, hass_client):
+    """Test the fetch period view streams the same result."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "history", {})
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+    hass.states.async_set("light.kitchen", "on", {"brightness": 10})
+    hass.states.async_set("switch.match", "on")
+    await hass.async_block_till_done()
+    hass.states.async_set("light.kitchen", "off")
+    await hass.async_block_till_done()
+
+    await hass.async_add_executor_job(trigger_db_commit, hass)
+    await hass.async_block_till_done()
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    client = await hass_client()
+    start = (dt_util.utcnow() - timedelta(hours=1)).isoformat()
+    response = await client.get(
+        f"/api/history/period/{start}", params={"skip_initial_state": ""}
+    )
+    assert response.status == 200
+    expected = await response.json()
+
+    response = await client.get(
+        f"/api/history/period/{start}", params={"skip_initial_state": "", "stream": ""}
+    )
+    assert response.status == 200
+    response_json = await response.json()
+    assert response_json == expected
+    assert [states[0]["entity_id"] for states in response_json] == [
+        "light.kitchen",
+        "switch.match",
+    ]
+    assert [state["state"] for state in response_json[0]] == ["on", "off"]
+
+
+async def test_ws_stream_history_period(hass, hass_ws_client):
+    """Test streaming history over the websocket."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "history", {})
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+    hass.states.async_set("light.kitchen", "on")
+    hass.states.async_set("switch.match", "on")
+    await hass.async_block_till_done()
+    hass.states.async_set("switch.match", "off")
+    await hass.async_block_till_done()
+
+    await hass.async_add_executor_job(trigger_db_commit, hass)
+    await hass.async_block_till_done()
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/stream_period",
+            "start_time": (dt_util.utcnow() - timedelta(hours=1)).isoformat(),
+            "entity_ids": ["switch.match"],
+            "include_start_time_state": False,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+
+    response = await client.receive_json()
+    assert response["type"] == "event"
+    assert [state["state"] for state in response["event"]["states"]] == ["on", "off"]
+
+    response = await client.receive_json()
+    assert response["event"] == {"finished": True}
+
+
+async def test_ws_stream_history_period_invalid_start_time(hass, hass_ws_client):
+    """Test streaming history rejects an invalid start time."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "history", {})
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {"id": 1, "type": "history/stream_period", "start_time": "not a date"}
+    )
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "invalid_start_time"
+
+
+async def test_ws_statistics_during_period(hass, hass_ws_client):
+    """Test fetching the statistics rollups over the websocket."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "history", {})
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+    hour = dt_util.utcnow().replace(minute=0, second=0, microsecond=0)
+    with patch("homeassistant.core.dt_util.utcnow", return_value=hour):
+        for value in ("10", "20"):
+            hass.states.async_set("sensor.power", value)
+            await hass.async_block_till_done()
+        hass.states.async_set("sensor.other", "1")
+
+    await hass.async_add_executor_job(trigger_db_commit, hass)
+    await hass.async_block_till_done()
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/statistics_during_period",
+            "start_time": (hour - timedelta(hours=1)).isoformat(),
+            "entity_ids": ["sensor.power"],
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] == {
+        "sensor.power": [
+            {
+                "start": hour.isoformat(),
+                "count": 2,
+                "min": 10.0,
+                "max": 20.0,
+                "mean": 15.0,
+                "sum": 30.0,
+                "last": 20.0,
+            }
+        ]
+    }
+
+    await client.send_json(
+        {
+            "id": 2,
+            "type": "history/statistics_during_period",
+            "start_time": "not a date",
+        }
+    )
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "invalid_start_time"
+
+
+async def test_fetch_period_api_with_resolution(hass, hass_client):
+    """Test the fetch period view aggregates states with resolution."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "history", {})
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+    for value in range(10):
+        hass.states.async_set("sensor.temperature", str(value))
+        await hass.async_block_till_done()
+
+    await hass.async_add_executor_job(trigger_db_commit, hass)
+    await hass.async_block_till_done()
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    client = await hass_client()
+    start = (dt_util.utcnow() - timedelta(hours=1)).isoformat()
+    response = await client.get(
+        f"/api/history/period/{start}", params={"resolution": "2"}
+    )
+    assert response.status == 200
+    response_json = await response.json()
+    assert len(response_json) == 1
+    assert len(response_json[0]) == 1
+    bucket = response_json[0][0]
+    assert bucket["entity_id"] == "sensor.temperature"
+    assert bucket["min"] == 0
+    assert bucket["max"] == 9
+    assert bucket["mean"] == 4.5
+    assert bucket["last"] == "9"
+
+    for resolution in ("0", "many"):
+        response = await client.get(
+            f"/api/history/period/{start}", params={"resolution": resolution}
+        )
+        assert response.status == 400
+
+    for param in ("stream", "minimal_response", "skip_initial_state"):
+        response = await client.get(
+            f"/api/history/period/{start}", params={"resolution": "2", param: ""}
+        )
+        assert response.status == 400
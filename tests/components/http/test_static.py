@@ -0,0 +1,115 @@
+"""Tests for static file handling."""
+import gzip
+import mimetypes
+
+from aiohttp import hdrs, web
+import pytest
+
+from homeassistant.components.http import static
+from homeassistant.components.http.static import CachingStaticResource
+
+from tests.async_mock import patch
+
+SCRIPT = "console.log('hello world');\n" * 100
+
+
+@pytest.fixture(name="static_dir")
+def static_dir_fixture(tmp_path):
+    """Return a directory with static files."""
+    (tmp_path / "app.js").write_text(SCRIPT)
+    (tmp_path / "small.js").write_text("1;")
+    (tmp_path / "bundle.js").write_text(SCRIPT)
+    (tmp_path / "bundle.js.gz").write_bytes(b"precompressed gzip")
+    (tmp_path / "bundle.js.br").write_bytes(b"precompressed brotli")
+    return tmp_path
+
+
+@pytest.fixture(name="client")
+async def client_fixture(aiohttp_client, static_dir):
+    """Return a client for a static resource."""
+    app = web.Application()
+    app.router.register_resource(CachingStaticResource("/static", str(static_dir)))
+    with patch.object(static, "COMPRESSED_CACHE", static.CompressedCache()):
+        # Check the bodies as they are sent
+        yield await aiohttp_client(app, auto_decompress=False)
+
+
+async def test_etag(client):
+    """Test static files are served with an ETag and revalidated."""
+    resp = await client.get("/static/small.js", headers={"Accept-Encoding": ""})
+    assert resp.status == 200
+    assert await resp.text() == "1;"
+    assert resp.headers[hdrs.CACHE_CONTROL] == static.CACHE_HEADERS[hdrs.CACHE_CONTROL]
+    etag = resp.headers[hdrs.ETAG]
+
+    resp = await client.get("/static/small.js", headers={"If-None-Match": etag})
+    assert resp.status == 304
+    assert resp.headers[hdrs.ETAG] == etag
+
+    resp = await client.get("/static/small.js", headers={"If-None-Match": '"other"'})
+    assert resp.status == 200
+
+
+async def test_precompressed_siblings(client):
+    """Test precompressed siblings are served when accepted."""
+    resp = await client.get(
+        "/static/bundle.js",
+        headers={"Accept-Encoding": "gzip, br"},
+    )
+    assert resp.status == 200
+    assert resp.headers[hdrs.CONTENT_ENCODING] == "br"
+    assert resp.headers[hdrs.CONTENT_TYPE] == mimetypes.guess_type("bundle.js")[0]
+    assert resp.headers[hdrs.VARY] == hdrs.ACCEPT_ENCODING
+    assert await resp.read() == b"precompressed brotli"
+
+    resp = await client.get(
+        "/static/bundle.js",
+        headers={"Accept-Encoding": "gzip"},
+    )
+    assert resp.headers[hdrs.CONTENT_ENCODING] == "gzip"
+    assert await resp.read() == b"precompressed gzip"
+
+    resp = await client.get("/static/bundle.js", headers={"Accept-Encoding": ""})
+    assert hdrs.CONTENT_ENCODING not in resp.headers
+    assert await resp.text() == SCRIPT
+
+
+async def test_compress_once(client, static_dir):
+    """Test files without a sibling are compressed once."""
+    with patch.object(static.gzip, "compress", wraps=gzip.compress) as mock_compress:
+        for _ in range(2):
+            resp = await client.get(
+                "/static/app.js",
+                headers={"Accept-Encoding": "gzip"},
+            )
+            assert resp.headers[hdrs.CONTENT_ENCODING] == "gzip"
+            assert gzip.decompress(await resp.read()).decode() == SCRIPT
+
+    assert mock_compress.call_count == 1
+
+    # Small files are not worth compressing
+    resp = await client.get("/static/small.js", headers={"Accept-Encoding": "gzip"})
+    assert hdrs.CONTENT_ENCODING not in resp.headers
+
+
+async def test_not_found(client, static_dir):
+    """Test missing files, including removed ones, are not found."""
+    resp = await client.get("/static/missing.js")
+    assert resp.status == 404
+
+    resp = await client.get("/static/small.js")
+    assert resp.status == 200
+    (static_dir / "small.js").unlink()
+    resp = await client.get("/static/small.js")
+    assert resp.status == 404
+
+
+def test_precompress_directory(static_dir):
+    """Test precompressing skips files with siblings and small files."""
+    with patch.object(static, "COMPRESSED_CACHE", static.CompressedCache()) as cache:
+        assert static.precompress_directory(static_dir) == 1
+        assert static.precompress_directory(static_dir) == 0
+        assert cache.size > 0
+
+    with patch.object(static, "COMPRESSED_CACHE", static.CompressedCache(0)):
+        assert static.precompress_directory(static_dir) == 0
@@ -1,4 +1,5 @@
 """Tests for Home Assistant View."""
+from aiohttp import hdrs
 from aiohttp.web_exceptions import (
     HTTPBadRequest,
     HTTPInternalServerError,
@@ -38,6 +39,28 @@ async def test_invalid_json(caplog):
     assert str(float("NaN")) in caplog.text
 
 
+async def test_json_etag():
+    """Test JSON responses get an ETag when the request is passed."""
+    view = HomeAssistantView()
+
+    response = view.json({"hello": "world"})
+    assert hdrs.ETAG not in response.headers
+
+    request = Mock(headers={})
+    response = view.json({"hello": "world"}, request=request)
+    assert response.status == 200
+    etag = response.headers[hdrs.ETAG]
+
+    request = Mock(headers={hdrs.IF_NONE_MATCH: etag})
+    response = view.json({"hello": "world"}, request=request)
+    assert response.status == 304
+    assert response.body is None
+
+    response = view.json({"hello": "there"}, request=request)
+    assert response.status == 200
+    assert response.headers[hdrs.ETAG] != etag
+
+
 async def test_handling_unauthorized(mock_request):
     """Test handling unauth exceptions."""
     with pytest.raises(HTTPUnauthorized):
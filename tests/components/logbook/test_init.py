@@ -29,6 +29,7 @@ from homeassistant.const import (
     EVENT_HOMEASSISTANT_STARTED,
     EVENT_HOMEASSISTANT_STOP,
     EVENT_STATE_CHANGED,
+    HTTP_BAD_REQUEST,
     STATE_NOT_HOME,
     STATE_OFF,
     STATE_ON,
@@ -1659,6 +1660,104 @@ async def test_logbook_context_from_template(hass, hass_client):
     assert json_dict[5]["context_user_id"] == "9400facee45711eaa9308bfd3d19e474"
 
 
+async def test_logbook_view_limit(hass, hass_client):
+    """Test paging through the logbook view with a limit."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "logbook", {})
+    assert await async_setup_component(
+        hass,
+        "switch",
+        {
+            "switch": {
+                "platform": "template",
+                "switches": {
+                    "test_template_switch": {
+                        "value_template": "{{ states.switch.test_state.state }}",
+                        "turn_on": {
+                            "service": "switch.turn_on",
+                            "entity_id": "switch.test_state",
+                        },
+                        "turn_off": {
+                            "service": "switch.turn_off",
+                            "entity_id": "switch.test_state",
+                        },
+                    }
+                },
+            }
+        },
+    )
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+    await hass.async_block_till_done()
+    await hass.async_start()
+    await hass.async_block_till_done()
+
+    hass.states.async_set("switch.test_state", STATE_ON)
+    await hass.async_block_till_done()
+    hass.states.async_set("switch.test_state", STATE_OFF)
+    await hass.async_block_till_done()
+    hass.states.async_set("switch.test_state", STATE_ON)
+    await _async_commit_and_wait(hass)
+
+    client = await hass_client()
+
+    start = dt_util.utcnow().date()
+    start_date = datetime(start.year, start.month, start.day)
+    end_time = start + timedelta(hours=24)
+
+    response = await client.get(
+        f"/api/logbook/{start_date.isoformat()}?end_time={end_time}"
+    )
+    assert response.status == 200
+    all_entries = await response.json()
+    assert len(all_entries) == 6
+
+    response = await client.get(
+        f"/api/logbook/{start_date.isoformat()}?end_time={end_time}&limit=3"
+    )
+    assert response.status == 200
+    first_page = await response.json()
+    assert first_page == all_entries[:3]
+
+    # The last entry is the cursor for the next page
+    response = await client.get(
+        f"/api/logbook/{first_page[-1]['when']}?end_time={end_time}&limit=3"
+    )
+    assert response.status == 200
+    second_page = await response.json()
+    assert second_page == all_entries[3:]
+    # Context started on the first page is still resolved
+    assert second_page[0]["context_entity_id"] == "switch.test_state"
+
+    response = await client.get(
+        f"/api/logbook/{start_date.isoformat()}?end_time={end_time}&limit=0"
+    )
+    assert response.status == HTTP_BAD_REQUEST
+
+
+async def test_logbook_entity_name_cache_invalidated(hass, hass_client):
+    """Test cached entity names are refreshed when attributes change."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "logbook", {})
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    hass.states.async_set("light.kitchen", STATE_OFF, {ATTR_FRIENDLY_NAME: "Old"})
+    hass.states.async_set("light.kitchen", STATE_ON, {ATTR_FRIENDLY_NAME: "Old"})
+    await _async_commit_and_wait(hass)
+
+    client = await hass_client()
+    start = dt_util.utcnow().date()
+    start_date = datetime(start.year, start.month, start.day)
+
+    response = await client.get(f"/api/logbook/{start_date.isoformat()}")
+    assert [entry["name"] for entry in await response.json()] == ["Old"]
+
+    hass.states.async_set("light.kitchen", STATE_OFF, {ATTR_FRIENDLY_NAME: "New"})
+    await _async_commit_and_wait(hass)
+
+    response = await client.get(f"/api/logbook/{start_date.isoformat()}")
+    assert [entry["name"] for entry in await response.json()] == ["New", "New"]
+
+
 async def test_logbook_entity_matches_only(hass, hass_client):
     """Test the logbook view with a single entity and entity_matches_only."""
     await hass.async_add_executor_job(init_recorder_component, hass)
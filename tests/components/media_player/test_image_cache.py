@@ -0,0 +1,121 @@
+"""Test the media player image cache."""
+import asyncio
+import os
+
+from aiohttp import hdrs
+
+from homeassistant.components.media_player import image_cache
+
+from tests.async_mock import patch
+
+URL = "http://example.com/art.jpg"
+
+
+async def test_bounded_by_bytes(hass, aioclient_mock):
+    """Test the least recently used images are evicted above the size limit."""
+    for idx in range(3):
+        aioclient_mock.get(f"http://example.com/{idx}.jpg", content=b"x" * 10)
+    aioclient_mock.get("http://example.com/big.jpg", content=b"x" * 100)
+
+    cache = image_cache.ImageCache(hass, max_bytes=25)
+
+    await cache.async_get("http://example.com/0.jpg")
+    await cache.async_get("http://example.com/1.jpg")
+    await cache.async_get("http://example.com/0.jpg")
+    await cache.async_get("http://example.com/2.jpg")
+    assert cache.size == 20
+    assert aioclient_mock.call_count == 3
+
+    # 1.jpg was evicted, 0.jpg was used more recently
+    await cache.async_get("http://example.com/0.jpg")
+    assert aioclient_mock.call_count == 3
+    await cache.async_get("http://example.com/1.jpg")
+    assert aioclient_mock.call_count == 4
+
+    # Images larger than the cache are not cached
+    assert await cache.async_get("http://example.com/big.jpg") == (b"x" * 100, None)
+    assert cache.size == 20
+
+
+async def test_coalesce_fetches(hass, aioclient_mock):
+    """Test concurrent requests for an image share one fetch."""
+    aioclient_mock.get(
+        URL, content=b"image", headers={hdrs.CONTENT_TYPE: "image/jpeg; charset=utf-8"}
+    )
+    cache = image_cache.ImageCache(hass)
+
+    results = await asyncio.gather(*(cache.async_get(URL) for _ in range(3)))
+
+    assert results == [(b"image", "image/jpeg")] * 3
+    assert aioclient_mock.call_count == 1
+
+
+async def test_revalidate(hass, aioclient_mock):
+    """Test old images are revalidated with the server."""
+    aioclient_mock.get(
+        URL,
+        content=b"image",
+        headers={
+            hdrs.ETAG: '"abc"',
+            hdrs.LAST_MODIFIED: "Wed, 21 Oct 2015 07:28:00 GMT",
+        },
+    )
+    cache = image_cache.ImageCache(hass)
+    await cache.async_get(URL)
+
+    aioclient_mock.clear_requests()
+    aioclient_mock.get(URL, status=304)
+
+    later = image_cache.time.time() + image_cache.CACHE_REVALIDATE_AFTER
+    with patch.object(image_cache.time, "time", return_value=later):
+        assert await cache.async_get(URL) == (b"image", None)
+        assert await cache.async_get(URL) == (b"image", None)
+
+    assert aioclient_mock.call_count == 1
+    assert aioclient_mock.mock_calls[0][3] == {
+        "If-None-Match": '"abc"',
+        "If-Modified-Since": "Wed, 21 Oct 2015 07:28:00 GMT",
+    }
+
+    # The stale image is served when the server fails
+    aioclient_mock.clear_requests()
+    aioclient_mock.get(URL, status=500)
+    with patch.object(image_cache.time, "time", return_value=later * 2):
+        assert await cache.async_get(URL) == (b"image", None)
+    assert aioclient_mock.call_count == 1
+
+
+async def test_disk_tier(hass, aioclient_mock, tmp_path):
+    """Test images are kept on disk across instances and trimmed."""
+    aioclient_mock.get(URL, content=b"image", headers={hdrs.ETAG: '"abc"'})
+    aioclient_mock.get("http://example.com/other.jpg", content=b"other")
+
+    cache = image_cache.ImageCache(hass, disk_dir=str(tmp_path), disk_max_bytes=8)
+    assert await cache.async_get(URL) == (b"image", None)
+    await hass.async_block_till_done()
+
+    cache = image_cache.ImageCache(hass, disk_dir=str(tmp_path), disk_max_bytes=8)
+    assert await cache.async_get(URL) == (b"image", None)
+    assert aioclient_mock.call_count == 1
+
+    # Adding another image trims the least recently used one
+    os.utime(cache._disk_path(URL), (0, 0))
+    await cache.async_get("http://example.com/other.jpg")
+    await hass.async_block_till_done()
+    assert sorted(os.listdir(tmp_path)) == sorted(
+        [
+            os.path.basename(cache._disk_path("http://example.com/other.jpg")),
+            os.path.basename(cache._disk_path("http://example.com/other.jpg"))
+            + ".json",
+        ]
+    )
+
+
+async def test_disk_tier_disabled(hass, aioclient_mock, tmp_path):
+    """Test nothing is written when the cache directory does not exist."""
+    aioclient_mock.get(URL, content=b"image")
+    cache = image_cache.ImageCache(hass, disk_dir=str(tmp_path / "missing"))
+
+    assert await cache.async_get(URL) == (b"image", None)
+    await hass.async_block_till_done()
+    assert not os.path.exists(tmp_path / "missing")
@@ -625,6 +625,30 @@ async def test_not_calling_unsubscribe_with_active_subscribers(
     assert not mqtt_client_mock.unsubscribe.called
 
 
+async def test_unsubscribe_stops_dispatch_to_overlapping_filters(
+    hass, mqtt_mock, calls, record_calls
+):
+    """Test only remaining subscriptions receive messages after unsubscribing."""
+    unsub_exact = await mqtt.async_subscribe(hass, "test/state", record_calls)
+    unsub_level = await mqtt.async_subscribe(hass, "test/+", record_calls)
+    await mqtt.async_subscribe(hass, "test/#", record_calls)
+
+    async_fire_mqtt_message(hass, "test/state", "online")
+    await hass.async_block_till_done()
+    assert sorted(call[0].subscribed_topic for call in calls) == [
+        "test/#",
+        "test/+",
+        "test/state",
+    ]
+
+    calls.clear()
+    unsub_exact()
+    unsub_level()
+    async_fire_mqtt_message(hass, "test/state", "online")
+    await hass.async_block_till_done()
+    assert [call[0].subscribed_topic for call in calls] == ["test/#"]
+
+
 async def test_restore_subscriptions_on_reconnect(hass, mqtt_client_mock, mqtt_mock):
     """Test subscriptions are restored on reconnect."""
     # Fake that the client is connected
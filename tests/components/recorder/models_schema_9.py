@@ -0,0 +1,85 @@
+"""Models for SQLAlchemy.
+
+This file contains the tables of schema version 9, before the shared state
+attributes were added. It is used to test the schema migration logic.
+"""
+from sqlalchemy import (
+    Boolean,
+    Column,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+)
+from sqlalchemy.ext.declarative import declarative_base
+
+import homeassistant.util.dt as dt_util
+
+# SQLAlchemy Schema
+# pylint: disable=invalid-name
+Base = declarative_base()
+
+SCHEMA_VERSION = 9
+
+
+class Events(Base):  # type: ignore
+    """Event history data."""
+
+    __tablename__ = "events"
+    event_id = Column(Integer, primary_key=True)
+    event_type = Column(String(32))
+    event_data = Column(Text)
+    origin = Column(String(32))
+    time_fired = Column(DateTime(timezone=True), index=True)
+    created = Column(DateTime(timezone=True), default=dt_util.utcnow)
+    context_id = Column(String(36), index=True)
+    context_user_id = Column(String(36), index=True)
+    context_parent_id = Column(String(36), index=True)
+
+    __table_args__ = (
+        Index("ix_events_event_type_time_fired", "event_type", "time_fired"),
+    )
+
+
+class States(Base):  # type: ignore
+    """State change history."""
+
+    __tablename__ = "states"
+    state_id = Column(Integer, primary_key=True)
+    domain = Column(String(64))
+    entity_id = Column(String(255))
+    state = Column(String(255))
+    attributes = Column(Text)
+    event_id = Column(Integer, ForeignKey("events.event_id"), index=True)
+    last_changed = Column(DateTime(timezone=True), default=dt_util.utcnow)
+    last_updated = Column(DateTime(timezone=True), default=dt_util.utcnow, index=True)
+    created = Column(DateTime(timezone=True), default=dt_util.utcnow)
+    old_state_id = Column(Integer)
+
+    __table_args__ = (
+        Index("ix_states_entity_id_last_updated", "entity_id", "last_updated"),
+    )
+
+
+class RecorderRuns(Base):  # type: ignore
+    """Representation of recorder run."""
+
+    __tablename__ = "recorder_runs"
+    run_id = Column(Integer, primary_key=True)
+    start = Column(DateTime(timezone=True), default=dt_util.utcnow)
+    end = Column(DateTime(timezone=True))
+    closed_incorrect = Column(Boolean, default=False)
+    created = Column(DateTime(timezone=True), default=dt_util.utcnow)
+
+    __table_args__ = (Index("ix_recorder_runs_start_end", "start", "end"),)
+
+
+class SchemaChanges(Base):  # type: ignore
+    """Representation of schema version changes."""
+
+    __tablename__ = "schema_changes"
+    change_id = Column(Integer, primary_key=True)
+    schema_version = Column(Integer)
+    changed = Column(DateTime(timezone=True), default=dt_util.utcnow)
@@ -4,6 +4,7 @@ from datetime import datetime, timedelta
 import unittest
 
 import pytest
+from sqlalchemy import event
 
 from homeassistant.components.recorder import (
     CONFIG_SCHEMA,
@@ -14,7 +15,12 @@ from homeassistant.components.recorder import (
     run_information_with_session,
 )
 from homeassistant.components.recorder.const import DATA_INSTANCE
-from homeassistant.components.recorder.models import Events, RecorderRuns, States
+from homeassistant.components.recorder.models import (
+    Events,
+    RecorderRuns,
+    StateAttributes,
+    States,
+)
 from homeassistant.components.recorder.util import session_scope
 from homeassistant.const import MATCH_ALL, STATE_LOCKED, STATE_UNLOCKED
 from homeassistant.core import Context, callback
@@ -131,6 +137,7 @@ def _add_entities(hass, entity_ids):
 
 
 def _add_events(hass, events):
+    wait_recording_done(hass)
     with session_scope(hass=hass) as session:
         session.query(Events).delete(synchronize_session=False)
     for event_type in events:
@@ -383,6 +390,114 @@ def test_saving_sets_old_state(hass_recorder):
         assert states[3].old_state_id == states[1].state_id
 
 
+def test_saving_sets_old_state_within_one_commit(hass_recorder):
+    """Test old states are linked when several changes are committed together."""
+    hass = hass_recorder()
+
+    hass.states.set("test.one", "on", {})
+    hass.states.set("test.one", "off", {})
+    hass.states.set("test.one", "on", {})
+    hass.states.remove("test.one")
+    hass.states.set("test.one", "off", {})
+    wait_recording_done(hass)
+    hass.states.set("test.one", "on", {})
+    wait_recording_done(hass)
+
+    with session_scope(hass=hass) as session:
+        states = list(session.query(States))
+        assert len(states) == 6
+        assert all(state.event_id > 0 for state in states)
+        assert [state.state for state in states] == [
+            "on",
+            "off",
+            "on",
+            None,
+            "off",
+            "on",
+        ]
+
+        assert states[0].old_state_id is None
+        assert states[1].old_state_id == states[0].state_id
+        assert states[2].old_state_id == states[1].state_id
+        assert states[3].old_state_id == states[2].state_id
+        assert states[3].state is None
+        assert states[4].old_state_id is None
+        assert states[5].old_state_id == states[4].state_id
+
+
+def test_saving_state_shares_attributes(hass_recorder):
+    """Test identical attributes are only stored once."""
+    hass = hass_recorder()
+
+    hass.states.set("test.one", "on", {"color": "red"})
+    hass.states.set("test.two", "on", {"color": "red"})
+    hass.states.set("test.one", "off", {"color": "blue"})
+    wait_recording_done(hass)
+    hass.states.set("test.two", "off", {"color": "red"})
+    hass.states.set("test.one", "on", {"color": "blue"})
+    wait_recording_done(hass)
+
+    with session_scope(hass=hass) as session:
+        states = list(session.query(States))
+        assert len(states) == 5
+        assert all(state.attributes is None for state in states)
+        assert states[0].attributes_id == states[1].attributes_id
+        assert states[0].attributes_id == states[3].attributes_id
+        assert states[2].attributes_id == states[4].attributes_id
+        assert states[0].attributes_id != states[2].attributes_id
+        assert session.query(StateAttributes).count() == 2
+        assert [state.to_native().attributes for state in states] == [
+            {"color": "red"},
+            {"color": "red"},
+            {"color": "blue"},
+            {"color": "red"},
+            {"color": "blue"},
+        ]
+
+
+def test_saving_states_in_one_statement(hass_recorder):
+    """Test the states of one commit are inserted with a single statement."""
+    hass = hass_recorder()
+    wait_recording_done(hass)
+    statements = []
+
+    @event.listens_for(hass.data[DATA_INSTANCE].engine, "before_cursor_execute")
+    def log_statement(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith("INSERT INTO states"):
+            statements.append(len(parameters) if executemany else 1)
+
+    hass.states.set("test.one", "on", {})
+    hass.states.set("test.two", "on", {})
+    hass.states.set("test.one", "off", {})
+    wait_recording_done(hass)
+
+    assert statements == [3]
+
+
+def test_loading_states_joins_attributes(hass_recorder):
+    """Test the shared attributes are loaded with the states in one query."""
+    hass = hass_recorder()
+    for idx in range(3):
+        hass.states.set(f"test.entity_{idx}", "on", {"idx": idx})
+    wait_recording_done(hass)
+    statements = []
+
+    @event.listens_for(hass.data[DATA_INSTANCE].engine, "before_cursor_execute")
+    def log_statement(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith("SELECT"):
+            statements.append(statement)
+
+    with session_scope(hass=hass) as session:
+        states = [state.to_native() for state in session.query(States)]
+
+    assert [state.attributes for state in states] == [
+        {"idx": 0},
+        {"idx": 1},
+        {"idx": 2},
+    ]
+    assert len(statements) == 1
+
+
 def test_saving_state_with_serializable_data(hass_recorder, caplog):
     """Test saving data that cannot be serialized does not crash."""
     hass = hass_recorder()
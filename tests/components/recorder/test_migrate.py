@@ -1,6 +1,7 @@
 """The tests for the Recorder component."""
 import pytest
 from sqlalchemy import create_engine
+from sqlalchemy.engine import reflection
 from sqlalchemy.pool import StaticPool
 
 from homeassistant.bootstrap import async_setup_component
@@ -8,7 +9,7 @@ from homeassistant.components.recorder import const, migration, models
 
 # pylint: disable=protected-access
 from tests.async_mock import call, patch
-from tests.components.recorder import models_original
+from tests.components.recorder import models_original, models_schema_9
 
 
 def create_engine_test(*args, **kwargs):
@@ -59,6 +60,40 @@ async def test_schema_migrate(hass):
         assert setup_run.called
 
 
+async def test_schema_migrate_from_version_9(hass, tmp_path):
+    """Test a version 9 database file is migrated and not moved away."""
+    db_path = tmp_path / "home-assistant_v2.db"
+    engine = create_engine(f"sqlite:///{db_path}")
+    models_schema_9.Base.metadata.create_all(engine)
+    engine.execute("INSERT INTO schema_changes (schema_version) VALUES (9)")
+    engine.execute(
+        "INSERT INTO states (entity_id, state, attributes) "
+        "VALUES ('sensor.old', 'on', '{}')"
+    )
+    engine.dispose()
+
+    assert await async_setup_component(
+        hass, "recorder", {"recorder": {"db_url": f"sqlite:///{db_path}"}}
+    )
+    await hass.async_block_till_done()
+
+    assert [path.name for path in tmp_path.iterdir()] == [db_path.name]
+
+    engine = create_engine(f"sqlite:///{db_path}")
+    assert engine.execute("SELECT entity_id FROM states").fetchall() == [
+        ("sensor.old",)
+    ]
+    assert engine.execute(
+        "SELECT MAX(schema_version) FROM schema_changes"
+    ).scalar() == (models.SCHEMA_VERSION)
+    inspector = reflection.Inspector.from_engine(engine)
+    assert {
+        (tuple(key["constrained_columns"]), key["referred_table"])
+        for key in inspector.get_foreign_keys("states")
+    } == {(("event_id",), "events"), (("attributes_id",), "state_attributes")}
+    engine.dispose()
+
+
 def test_invalid_update():
     """Test that an invalid new version raises an exception."""
     with pytest.raises(ValueError):
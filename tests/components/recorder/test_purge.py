@@ -3,11 +3,22 @@ from datetime import datetime, timedelta
 import json
 import unittest
 
+from sqlalchemy import event
+
 from homeassistant.components import recorder
-from homeassistant.components.recorder.const import DATA_INSTANCE
-from homeassistant.components.recorder.models import Events, RecorderRuns, States
+from homeassistant.components.recorder.const import (
+    DATA_INSTANCE,
+    EVENT_RECORDER_PURGE_PROGRESS,
+)
+from homeassistant.components.recorder.models import (
+    Events,
+    RecorderRuns,
+    StateAttributes,
+    States,
+)
 from homeassistant.components.recorder.purge import purge_old_data
 from homeassistant.components.recorder.util import session_scope
+from homeassistant.core import callback
 from homeassistant.util import dt as dt_util
 
 from .common import wait_recording_done
@@ -134,14 +145,19 @@ class TestRecorderPurge(unittest.TestCase):
             states = session.query(States)
             assert states.count() == 6
 
-            # run purge_old_data()
-            finished = purge_old_data(self.hass.data[DATA_INSTANCE], 4, repack=False)
-            assert not finished
-            assert states.count() == 4
+            # run purge_old_data() in chunks of two rows
+            with patch("homeassistant.components.recorder.purge.PURGE_CHUNK_SIZE", 2):
+                finished = purge_old_data(
+                    self.hass.data[DATA_INSTANCE], 4, repack=False
+                )
+                assert not finished
+                assert states.count() == 4
 
-            finished = purge_old_data(self.hass.data[DATA_INSTANCE], 4, repack=False)
-            assert not finished
-            assert states.count() == 2
+                finished = purge_old_data(
+                    self.hass.data[DATA_INSTANCE], 4, repack=False
+                )
+                assert not finished
+                assert states.count() == 2
 
             finished = purge_old_data(self.hass.data[DATA_INSTANCE], 4, repack=False)
             assert finished
@@ -155,20 +171,133 @@ class TestRecorderPurge(unittest.TestCase):
             events = session.query(Events).filter(Events.event_type.like("EVENT_TEST%"))
             assert events.count() == 6
 
-            # run purge_old_data()
-            finished = purge_old_data(self.hass.data[DATA_INSTANCE], 4, repack=False)
-            assert not finished
-            assert events.count() == 4
+            # run purge_old_data() in chunks of two rows
+            with patch("homeassistant.components.recorder.purge.PURGE_CHUNK_SIZE", 2):
+                finished = purge_old_data(
+                    self.hass.data[DATA_INSTANCE], 4, repack=False
+                )
+                assert not finished
+                assert events.count() == 4
 
-            finished = purge_old_data(self.hass.data[DATA_INSTANCE], 4, repack=False)
-            assert not finished
-            assert events.count() == 2
+                finished = purge_old_data(
+                    self.hass.data[DATA_INSTANCE], 4, repack=False
+                )
+                assert not finished
+                assert events.count() == 2
 
             # we should only have 2 events left
             finished = purge_old_data(self.hass.data[DATA_INSTANCE], 4, repack=False)
             assert finished
             assert events.count() == 2
 
+    def test_purge_progress_event(self):
+        """Test the purge progress is reported on the event bus."""
+        self._add_test_states()
+        self._add_test_events()
+        events = []
+
+        @callback
+        def event_listener(event):
+            events.append(event)
+
+        self.hass.bus.listen(EVENT_RECORDER_PURGE_PROGRESS, event_listener)
+
+        with patch("homeassistant.components.recorder.purge.PURGE_CHUNK_SIZE", 3):
+            while not purge_old_data(self.hass.data[DATA_INSTANCE], 4, repack=False):
+                pass
+        self.hass.block_till_done()
+
+        assert [event.data["finished"] for event in events] == [False, False, True]
+        assert events[0].data["deleted_states"] == 3
+        assert events[0].data["remaining_rows"] == 5
+        assert events[0].data["time_remaining"] is not None
+        assert events[-1].data["deleted_states"] == 4
+        assert events[-1].data["deleted_events"] == 4
+        assert events[-1].data["remaining_rows"] == 0
+        assert self.hass.data[DATA_INSTANCE].purge_progress is None
+
+    def test_purge_queries_use_time_index(self):
+        """Test the purge finds its chunks through the time indexes."""
+        self._add_test_states()
+        self._add_test_events()
+        instance = self.hass.data[DATA_INSTANCE]
+        statements = []
+
+        def log_statement(conn, cursor, statement, parameters, context, executemany):
+            if statement.startswith("SELECT") and (
+                "states.last_updated <" in statement
+                or "events.time_fired <" in statement
+            ):
+                statements.append((statement, parameters))
+
+        event.listen(instance.engine, "before_cursor_execute", log_statement)
+        with patch("homeassistant.components.recorder.purge.PURGE_CHUNK_SIZE", 3):
+            while not purge_old_data(instance, 4, repack=False):
+                pass
+        event.remove(instance.engine, "before_cursor_execute", log_statement)
+
+        assert statements
+        for statement, parameters in statements:
+            plan = " ".join(
+                str(row[-1])
+                for row in instance.engine.execute(
+                    f"EXPLAIN QUERY PLAN {statement}", parameters
+                )
+            )
+            assert "INDEX ix_" in plan, statement
+            assert "TEMP B-TREE" not in plan, statement
+
+    def test_purge_unused_state_attributes(self):
+        """Test shared attributes are removed once no state references them."""
+        self.hass.states.set("test.one", "on", {"old": True})
+        self.hass.states.set("test.two", "on", {"kept": True})
+        wait_recording_done(self.hass)
+
+        eleven_days_ago = dt_util.utcnow() - timedelta(days=11)
+        with session_scope(hass=self.hass) as session:
+            session.query(States).filter(States.entity_id == "test.one").update(
+                {States.last_updated: eleven_days_ago}
+            )
+            assert session.query(StateAttributes).count() == 2
+
+        self.assertTrue(purge_old_data(self.hass.data[DATA_INSTANCE], 4, repack=False))
+
+        with session_scope(hass=self.hass) as session:
+            shared_attrs = [row.shared_attrs for row in session.query(StateAttributes)]
+            assert shared_attrs == ['{"kept": true}']
+
+        # Attributes seen before the purge have to be written again
+        self.hass.states.set("test.one", "off", {"old": True})
+        wait_recording_done(self.hass)
+
+        with session_scope(hass=self.hass) as session:
+            state = session.query(States).filter(States.entity_id == "test.one").one()
+            assert state.to_native().attributes == {"old": True}
+            assert session.query(StateAttributes).count() == 2
+
+    def test_purge_unused_state_attributes_in_chunks(self):
+        """Test unused attributes are deleted in chunks after the states."""
+        for idx in range(3):
+            self.hass.states.set(f"test.old_{idx}", "on", {"idx": idx})
+        wait_recording_done(self.hass)
+
+        eleven_days_ago = dt_util.utcnow() - timedelta(days=11)
+        with session_scope(hass=self.hass) as session:
+            session.query(States).update({States.last_updated: eleven_days_ago})
+            attributes = session.query(StateAttributes)
+            assert attributes.count() == 3
+
+            with patch("homeassistant.components.recorder.purge.PURGE_CHUNK_SIZE", 2):
+                instance = self.hass.data[DATA_INSTANCE]
+                assert not purge_old_data(instance, 4, repack=False)
+                assert attributes.count() == 3
+
+                assert not purge_old_data(instance, 4, repack=False)
+                assert attributes.count() == 1
+
+                assert purge_old_data(instance, 4, repack=False)
+                assert attributes.count() == 0
+
     def test_purge_method(self):
         """Test purge method."""
         service_data = {"keep_days": 4}
@@ -0,0 +1,133 @@
+"""The tests for the recorder statistics rollups."""
+# pylint: disable=protected-access
+from datetime import timedelta
+
+import pytest
+
+from homeassistant.components.recorder.const import DATA_INSTANCE
+from homeassistant.components.recorder.statistics import (
+    PERIOD_DAY,
+    PERIOD_HOUR,
+    statistics_during_period,
+)
+import homeassistant.util.dt as dt_util
+
+from .common import wait_recording_done
+
+from tests.async_mock import patch
+from tests.common import get_test_home_assistant, init_recorder_component
+
+
+@pytest.fixture
+def hass_recorder():
+    """Home Assistant fixture with in-memory recorder."""
+    hass = get_test_home_assistant()
+
+    def setup_recorder(config=None):
+        """Set up with params."""
+        init_recorder_component(hass, config)
+        hass.start()
+        hass.block_till_done()
+        hass.data[DATA_INSTANCE].block_till_done()
+        return hass
+
+    yield setup_recorder
+    hass.stop()
+
+
+def _set_states(hass, entity_id, start, values):
+    """Set states one minute apart, starting at start."""
+    for minute, value in enumerate(values):
+        point = start + timedelta(minutes=minute)
+        with patch("homeassistant.core.dt_util.utcnow", return_value=point):
+            hass.states.set(entity_id, value)
+    wait_recording_done(hass)
+
+
+def test_rollups(hass_recorder):
+    """Test numeric states are rolled up per hour and per day."""
+    hass = hass_recorder()
+    start = dt_util.start_of_local_day() + timedelta(hours=3, minutes=58)
+
+    _set_states(hass, "sensor.temperature", start, ["1", "3", "unavailable", "8"])
+    _set_states(hass, "light.kitchen", start, ["on", "off"])
+
+    hour = dt_util.as_utc(start).replace(minute=0)
+    hourly = statistics_during_period(hass, hour)
+    assert list(hourly) == ["sensor.temperature"]
+    assert hourly["sensor.temperature"] == [
+        {
+            "start": hour,
+            "count": 2,
+            "min": 1.0,
+            "max": 3.0,
+            "mean": 2.0,
+            "sum": 4.0,
+            "last": 3.0,
+        },
+        {
+            "start": hour + timedelta(hours=1),
+            "count": 1,
+            "min": 8.0,
+            "max": 8.0,
+            "mean": 8.0,
+            "sum": 8.0,
+            "last": 8.0,
+        },
+    ]
+
+    day = dt_util.as_utc(dt_util.start_of_local_day())
+    daily = statistics_during_period(hass, day, period=PERIOD_DAY)
+    assert daily["sensor.temperature"] == [
+        {
+            "start": day,
+            "count": 3,
+            "min": 1.0,
+            "max": 8.0,
+            "mean": 4.0,
+            "sum": 12.0,
+            "last": 8.0,
+        }
+    ]
+
+
+def test_rollups_continue_existing_rows(hass_recorder):
+    """Test rollups are merged with rows written before they were forgotten."""
+    hass = hass_recorder()
+    start = dt_util.utcnow().replace(minute=0, second=0, microsecond=0)
+
+    _set_states(hass, "sensor.power", start, ["10", "20"])
+    hass.data[DATA_INSTANCE]._statistics.reset()
+    _set_states(hass, "sensor.power", start + timedelta(minutes=2), ["0"])
+
+    hourly = statistics_during_period(
+        hass, start, start + timedelta(hours=1), ["sensor.power"], PERIOD_HOUR
+    )
+    assert hourly["sensor.power"] == [
+        {
+            "start": start,
+            "count": 3,
+            "min": 0.0,
+            "max": 20.0,
+            "mean": 10.0,
+            "sum": 30.0,
+            "last": 0.0,
+        }
+    ]
+
+
+def test_rollups_continue_after_purge(hass_recorder):
+    """Test rollups keep being written after a purge closed the session."""
+    hass = hass_recorder()
+    start = dt_util.utcnow().replace(minute=0, second=0, microsecond=0)
+
+    _set_states(hass, "sensor.power", start, ["10", "20"])
+    hass.data[DATA_INSTANCE].do_adhoc_purge(keep_days=4)
+    wait_recording_done(hass)
+    _set_states(hass, "sensor.power", start + timedelta(minutes=2), ["0"])
+
+    hourly = statistics_during_period(
+        hass, start, start + timedelta(hours=1), ["sensor.power"], PERIOD_HOUR
+    )
+    assert hourly["sensor.power"][0]["count"] == 3
+    assert hourly["sensor.power"][0]["last"] == 0.0
@@ -178,6 +178,17 @@ def test_basic_sanity_check(hass_recorder):
         util.basic_sanity_check(cursor)
 
 
+def test_basic_sanity_check_before_migration(hass_recorder):
+    """Test tables added by schema migrations are not required."""
+    hass = hass_recorder()
+
+    cursor = hass.data[DATA_INSTANCE].engine.raw_connection().cursor()
+    for table in ("state_attributes", "statistics_hourly", "statistics_daily"):
+        cursor.execute(f"DROP TABLE {table};")
+
+    assert util.basic_sanity_check(cursor) is True
+
+
 def test_combined_checks(hass_recorder):
     """Run Checks on the open database."""
     hass = hass_recorder()
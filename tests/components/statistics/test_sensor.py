@@ -8,6 +8,8 @@ import pytest
 
 from homeassistant import config as hass_config
 from homeassistant.components import recorder
+from homeassistant.components.recorder.models import StatisticsHourly
+from homeassistant.components.recorder.util import session_scope
 from homeassistant.components.statistics.sensor import DOMAIN, StatisticsSensor
 from homeassistant.const import (
     ATTR_UNIT_OF_MEASUREMENT,
@@ -450,6 +452,81 @@ class TestStatisticsSensor(unittest.TestCase):
             hours=1
         )
 
+    def test_initialize_from_rollups(self):
+        """Test initializing the statistics from the rollups of purged states."""
+        init_recorder_component(self.hass)
+        self.hass.block_till_done()
+        self.hass.data[recorder.DATA_INSTANCE].block_till_done()
+        for value in self.values:
+            self.hass.states.set(
+                "sensor.test_monitored", value, {ATTR_UNIT_OF_MEASUREMENT: TEMP_CELSIUS}
+            )
+            self.hass.block_till_done()
+        wait_recording_done(self.hass)
+
+        # The states of these hours were purged, only the rollups are left
+        hour = dt_util.utcnow().replace(minute=0, second=0, microsecond=0)
+        rollups = [
+            (hour - timedelta(hours=30), 10, 1.0, 30.0, 100.0),
+            (hour - timedelta(hours=5), 4, 2.0, 40.0, 60.0),
+        ]
+        with session_scope(hass=self.hass) as session:
+            for start, count, min_value, max_value, total in rollups:
+                session.add(
+                    StatisticsHourly(
+                        entity_id="sensor.test_monitored",
+                        start=start,
+                        count=count,
+                        min=min_value,
+                        max=max_value,
+                        mean=total / count,
+                        sum=total,
+                        last=max_value,
+                    )
+                )
+
+        assert setup_component(
+            self.hass,
+            "sensor",
+            {
+                "sensor": [
+                    {
+                        "platform": "statistics",
+                        "name": "test",
+                        "entity_id": "sensor.test_monitored",
+                        "sampling_size": 100,
+                        "max_age": {"days": 1},
+                    },
+                    {
+                        "platform": "statistics",
+                        "name": "test_sampling_size",
+                        "entity_id": "sensor.test_monitored",
+                        "sampling_size": self.count + 10,
+                        "max_age": {"days": 2},
+                    },
+                ]
+            },
+        )
+        self.hass.block_till_done()
+        self.hass.start()
+        self.hass.block_till_done()
+
+        # The rollup older than max_age is left out
+        state = self.hass.states.get("sensor.test")
+        assert state.attributes.get("count") == self.count + 4
+        assert state.attributes.get("total") == round(self.total + 60, 2)
+        assert float(state.state) == round((self.total + 60) / (self.count + 4), 2)
+        assert state.attributes.get("min_value") == 2.0
+        assert state.attributes.get("max_value") == 40.0
+        assert state.attributes.get("median") == self.median
+        assert state.attributes.get("change") == self.change
+        assert state.attributes.get("min_age") == rollups[1][0]
+
+        # The older rollup does not fit in the sample size
+        state = self.hass.states.get("sensor.test_sampling_size")
+        assert state.attributes.get("count") == self.count + 4
+        assert state.attributes.get("min_value") == 2.0
+
 
 async def test_reload(hass):
     """Verify we can reload filter sensors."""
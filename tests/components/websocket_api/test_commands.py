@@ -187,6 +187,47 @@ async def test_subscribe_unsubscribe_events(hass, websocket_client):
     assert sum(hass.bus.async_listeners().values()) == init_count
 
 
+async def test_subscribe_events_share_listener(hass, websocket_client):
+    """Test subscriptions to the same event type share one bus listener."""
+    init_count = sum(hass.bus.async_listeners().values())
+
+    for iden in (5, 6):
+        await websocket_client.send_json(
+            {"id": iden, "type": "subscribe_events", "event_type": "test_event"}
+        )
+        msg = await websocket_client.receive_json()
+        assert msg["id"] == iden
+        assert msg["success"]
+
+    assert sum(hass.bus.async_listeners().values()) == init_count + 1
+
+    hass.bus.async_fire("test_event", {"hello": "world"})
+
+    msgs = []
+    with timeout(3):
+        msgs.append(await websocket_client.receive_json())
+        msgs.append(await websocket_client.receive_json())
+
+    assert sorted(msg["id"] for msg in msgs) == [5, 6]
+    for msg in msgs:
+        assert msg["type"] == "event"
+        assert msg["event"]["data"] == {"hello": "world"}
+
+    await websocket_client.send_json(
+        {"id": 7, "type": "unsubscribe_events", "subscription": 5}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    assert sum(hass.bus.async_listeners().values()) == init_count + 1
+
+    await websocket_client.send_json(
+        {"id": 8, "type": "unsubscribe_events", "subscription": 6}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    assert sum(hass.bus.async_listeners().values()) == init_count
+
+
 async def test_get_states(hass, websocket_client):
     """Test get_states command."""
     hass.states.async_set("greeting.hello", "world")
@@ -323,6 +364,46 @@ async def test_states_filters_visible(hass, hass_admin_user, websocket_client):
     assert msg["result"][0]["entity_id"] == "test.entity"
 
 
+async def test_get_states_since(hass, websocket_client, hass_admin_user):
+    """Test get_states command with a revision."""
+    hass.states.async_set("test.entity", "hello")
+    hass.states.async_set("test.not_visible_entity", "invisible")
+    revision = hass.states.revision
+
+    hass.states.async_set("test.entity", "world")
+    hass.states.async_set("test.other", "new")
+    hass.states.async_remove("test.not_visible_entity")
+
+    await websocket_client.send_json({"id": 5, "type": "get_states", "since": revision})
+
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    assert msg["result"]["revision"] == hass.states.revision
+    assert not msg["result"]["full"]
+    assert [state["entity_id"] for state in msg["result"]["changed"]] == [
+        "test.entity",
+        "test.other",
+    ]
+    assert msg["result"]["removed"] == ["test.not_visible_entity"]
+
+    # Removals are filtered by permissions too
+    hass_admin_user.mock_policy({"entities": {"entity_ids": {"test.entity": True}}})
+
+    await websocket_client.send_json({"id": 6, "type": "get_states", "since": 0})
+
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    assert msg["result"]["full"]
+    assert [state["entity_id"] for state in msg["result"]["changed"]] == ["test.entity"]
+    assert msg["result"]["removed"] == []
+
+    await websocket_client.send_json({"id": 7, "type": "get_states", "since": revision})
+
+    msg = await websocket_client.receive_json()
+    assert [state["entity_id"] for state in msg["result"]["changed"]] == ["test.entity"]
+    assert msg["result"]["removed"] == []
+
+
 async def test_get_states_not_allows_nan(hass, websocket_client):
     """Test get_states command not allows NaN floats."""
     hass.states.async_set("greeting.hello", "world", {"hello": float("NaN")})
@@ -730,6 +811,41 @@ async def test_entity_source_admin(hass, websocket_client, hass_admin_user):
     assert msg["error"]["code"] == const.ERR_UNAUTHORIZED
 
 
+async def test_entity_poll_timings(hass, websocket_client, hass_admin_user):
+    """Check that we fetch the poll timings of polling entities."""
+    platform = MockEntityPlatform(hass)
+
+    await platform.async_add_entities(
+        [
+            MockEntity(name="Entity 1", should_poll=True),
+            MockEntity(name="Entity 2", should_poll=False),
+        ]
+    )
+    await platform._update_entity_states(None)
+
+    await websocket_client.send_json({"id": 5, "type": "entity/poll_timings"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 5
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+    assert len(msg["result"]) == 1
+    result = msg["result"][0]
+    assert result["domain"] == "test_domain"
+    assert result["platform"] == "test_platform"
+    assert result["scan_interval"] == platform.scan_interval.total_seconds()
+    assert list(result["entities"]) == ["test_domain.entity_1"]
+    assert result["entities"]["test_domain.entity_1"]["count"] == 1
+    assert result["entities"]["test_domain.entity_1"]["skipped"] == 0
+
+    hass_admin_user.groups = []
+    await websocket_client.send_json({"id": 6, "type": "entity/poll_timings"})
+
+    msg = await websocket_client.receive_json()
+    assert not msg["success"]
+    assert msg["error"]["code"] == const.ERR_UNAUTHORIZED
+
+
 async def test_subscribe_trigger(hass, websocket_client):
     """Test subscribing to a trigger."""
     init_count = sum(hass.bus.async_listeners().values())
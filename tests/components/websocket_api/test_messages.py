@@ -1,6 +1,7 @@
 """Test Websocket API messages module."""
 
 from homeassistant.components.websocket_api.messages import (
+    _cached_event_message as lru_event_cache,
     cached_event_message,
     message_to_json,
 )
@@ -24,6 +25,7 @@ async def test_cached_event_message(hass):
     await hass.async_block_till_done()
 
     assert len(events) == 2
+    lru_event_cache.cache_clear()
 
     msg0 = cached_event_message(2, events[0])
     assert msg0 == cached_event_message(2, events[0])
@@ -33,18 +35,50 @@ async def test_cached_event_message(hass):
 
     assert msg0 != msg1
 
-    cache_info = cached_event_message.cache_info()
+    cache_info = lru_event_cache.cache_info()
     assert cache_info.hits == 2
     assert cache_info.misses == 2
     assert cache_info.currsize == 2
 
     cached_event_message(2, events[1])
-    cache_info = cached_event_message.cache_info()
+    cache_info = lru_event_cache.cache_info()
     assert cache_info.hits == 3
     assert cache_info.misses == 2
     assert cache_info.currsize == 2
 
 
+async def test_cached_event_message_with_different_idens(hass):
+    """Test that we cache event messages when the subscription idens differ."""
+
+    events = []
+
+    @callback
+    def _event_listener(event):
+        events.append(event)
+
+    hass.bus.async_listen(EVENT_STATE_CHANGED, _event_listener)
+
+    hass.states.async_set("light.window", "on")
+    await hass.async_block_till_done()
+
+    assert len(events) == 1
+    lru_event_cache.cache_clear()
+
+    msg0 = cached_event_message(2, events[0])
+    msg1 = cached_event_message(3, events[0])
+    msg2 = cached_event_message(4, events[0])
+
+    assert msg0.startswith('{"id": 2, "type": "event"')
+    assert msg1.startswith('{"id": 3, "type": "event"')
+    assert msg2.startswith('{"id": 4, "type": "event"')
+    assert msg0[len('{"id": 2') :] == msg1[len('{"id": 3') :]
+
+    cache_info = lru_event_cache.cache_info()
+    assert cache_info.hits == 2
+    assert cache_info.misses == 1
+    assert cache_info.currsize == 1
+
+
 async def test_message_to_json(caplog):
     """Test we can serialize websocket messages."""
 
@@ -340,6 +340,40 @@ async def test_removing_area_id(registry):
     assert entry_w_area != entry_wo_area
 
 
+async def test_entries_for_area(registry):
+    """Test the area index follows updates and removals."""
+    entry = registry.async_get_or_create(
+        config_entry_id="123",
+        connections={(device_registry.CONNECTION_NETWORK_MAC, "12:34:56:AB:CD:EF")},
+        identifiers={("bridgeid", "0123")},
+    )
+    other = registry.async_get_or_create(
+        config_entry_id="123",
+        connections={(device_registry.CONNECTION_NETWORK_MAC, "34:56:78:CD:EF:12")},
+        identifiers={("bridgeid", "4567")},
+    )
+
+    registry.async_update_device(entry.id, area_id="kitchen")
+    registry.async_update_device(other.id, area_id="kitchen")
+    assert [
+        device.id
+        for device in device_registry.async_entries_for_area(registry, "kitchen")
+    ] == [entry.id, other.id]
+
+    registry.async_update_device(other.id, area_id="hallway")
+    assert [
+        device.id
+        for device in device_registry.async_entries_for_area(registry, "kitchen")
+    ] == [entry.id]
+    assert [
+        device.id
+        for device in device_registry.async_entries_for_area(registry, "hallway")
+    ] == [other.id]
+
+    registry.async_remove_device(entry.id)
+    assert device_registry.async_entries_for_area(registry, "kitchen") == []
+
+
 async def test_deleted_device_removing_area_id(registry):
     """Make sure we can clear area id of deleted device."""
     entry = registry.async_get_or_create(
@@ -6,15 +6,19 @@ import threading
 
 import pytest
 
+from homeassistant.config import DATA_CUSTOMIZE
 from homeassistant.const import ATTR_DEVICE_CLASS, STATE_UNAVAILABLE
 from homeassistant.core import Context
 from homeassistant.helpers import entity, entity_registry
+from homeassistant.helpers.entity_values import EntityValues
+import homeassistant.util.dt as dt_util
 
 from tests.async_mock import MagicMock, PropertyMock, patch
 from tests.common import (
     MockConfigEntry,
     MockEntity,
     MockEntityPlatform,
+    async_fire_time_changed,
     get_test_home_assistant,
     mock_registry,
 )
@@ -534,6 +538,47 @@ async def test_async_remove_no_platform(hass):
     assert len(hass.states.async_entity_ids()) == 0
 
 
+async def test_state_write_interval(hass):
+    """Test state writes within the state write interval are coalesced."""
+    written = []
+
+    def track_write(event):
+        if event.data["new_state"] is not None:
+            written.append(event.data["new_state"].state)
+
+    hass.bus.async_listen("state_changed", track_write)
+
+    ent = entity.Entity()
+    ent.hass = hass
+    ent.entity_id = "sensor.power"
+    ent.add_to_platform_start(hass, None, None, timedelta(seconds=10))
+
+    for value in ("1", "2", "3"):
+        with patch.object(entity.Entity, "state", value):
+            ent.async_write_ha_state()
+            await hass.async_block_till_done()
+
+    # The first write goes out right away, the others are held back
+    assert written == ["1"]
+
+    with patch.object(entity.Entity, "state", "4"):
+        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=11))
+        await hass.async_block_till_done()
+
+    # Only the latest state is written at the end of the interval
+    assert written == ["1", "4"]
+
+    with patch.object(entity.Entity, "state", "5"):
+        ent.async_write_ha_state()
+        await ent.async_remove()
+        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=11))
+        await hass.async_block_till_done()
+
+    # Pending writes are dropped when the entity is removed
+    assert written == ["1", "4"]
+    assert hass.states.get("sensor.power") is None
+
+
 async def test_async_remove_runs_callbacks(hass):
     """Test async_remove method when no platform set."""
     result = []
@@ -657,6 +702,34 @@ async def test_capability_attrs(hass):
     assert state.attributes["always"] == "there"
 
 
+async def test_static_attributes_cached(hass):
+    """Test capability attributes are only read when needed."""
+    capability_attributes = PropertyMock(return_value={"max": 10})
+
+    with patch.object(entity.Entity, "capability_attributes", capability_attributes):
+        ent = entity.Entity()
+        ent.hass = hass
+        ent.entity_id = "sensor.power"
+        ent.async_write_ha_state()
+        ent.async_write_ha_state()
+
+        assert capability_attributes.call_count == 1
+
+        # Customize config was reloaded
+        hass.data[DATA_CUSTOMIZE] = EntityValues({"sensor.power": {"max": 20}})
+        ent.async_write_ha_state()
+        assert capability_attributes.call_count == 2
+        assert hass.states.get("sensor.power").attributes["max"] == 20
+
+        capability_attributes.return_value = {"max": 30}
+        ent.async_invalidate_static_attributes()
+        hass.data[DATA_CUSTOMIZE] = EntityValues()
+        ent.async_write_ha_state()
+        assert capability_attributes.call_count == 3
+
+    assert hass.states.get("sensor.power").attributes["max"] == 30
+
+
 async def test_warn_slow_write_state(hass, caplog):
     """Check that we log a warning if reading properties takes too long."""
     mock_entity = entity.Entity()
@@ -90,6 +90,99 @@ async def test_polling_updates_entities_with_exception(hass):
     assert len(update_err) == 1
 
 
+async def test_polling_skips_only_slow_entities(hass):
+    """Test a slow entity does not hold back the polling of other entities."""
+    component = EntityComponent(_LOGGER, DOMAIN, hass, timedelta(seconds=20))
+    release = asyncio.Event()
+    slow_updates = []
+    fast_updates = []
+
+    class SlowEntity(MockEntity):
+        """Mock entity with an update that hangs."""
+
+        async def async_update(self):
+            slow_updates.append(None)
+            await release.wait()
+
+    class FastEntity(MockEntity):
+        """Mock entity with a quick update."""
+
+        async def async_update(self):
+            fast_updates.append(None)
+
+    slow_ent = SlowEntity(should_poll=True)
+    fast_ent = FastEntity(should_poll=True)
+    await component.async_add_entities([slow_ent, fast_ent])
+
+    now = dt_util.utcnow()
+    for seconds in (20, 40):
+        async_fire_time_changed(hass, now + timedelta(seconds=seconds))
+        for _ in range(5):
+            await asyncio.sleep(0)
+
+    assert len(slow_updates) == 1
+    assert len(fast_updates) == 2
+
+    release.set()
+    await hass.async_block_till_done()
+
+    timings = component._platforms[DOMAIN].poll_timings
+    assert timings[slow_ent.entity_id].count == 1
+    assert timings[slow_ent.entity_id].skipped == 1
+    assert timings[fast_ent.entity_id].count == 2
+    assert timings[fast_ent.entity_id].skipped == 0
+
+
+async def test_spread_polling(hass):
+    """Test polling can be spread over the scan interval."""
+    platform = MockPlatform()
+    platform.SPREAD_POLLING = True
+    platform.SCAN_INTERVAL = timedelta(seconds=30)
+
+    mock_entity_platform(hass, "test_domain.platform", platform)
+
+    component = EntityComponent(_LOGGER, DOMAIN, hass)
+    await component.async_setup({DOMAIN: {"platform": "platform"}})
+    await hass.async_block_till_done()
+
+    handle = list(component._platforms.values())[-1]
+    assert handle.spread_polling
+
+    updates = []
+
+    class PollEntity(MockEntity):
+        """Mock entity that records its updates."""
+
+        async def async_update(self):
+            updates.append(self.entity_id)
+
+    entities = [PollEntity(should_poll=True) for _ in range(3)]
+    await handle.async_add_entities(entities)
+
+    now = dt_util.utcnow()
+    with patch.object(hass.loop, "call_later") as mock_call_later:
+        async_fire_time_changed(hass, now + timedelta(seconds=30))
+        await hass.async_block_till_done()
+
+    # The first entity is updated right away, the others later in the interval
+    assert updates == [entities[0].entity_id]
+    spread_calls = [
+        call[1]
+        for call in mock_call_later.mock_calls
+        if len(call[1]) == 3 and call[1][1] == handle._async_schedule_poll_entity
+    ]
+    assert [(delay, entity) for delay, _, entity in spread_calls] == [
+        (10, entities[1]),
+        (20, entities[2]),
+    ]
+
+    for _, poll, entity in spread_calls:
+        poll(entity)
+    await hass.async_block_till_done()
+
+    assert updates == [entity.entity_id for entity in entities]
+
+
 async def test_update_state_adds_entities(hass):
     """Test if updating poll entities cause an entity to be added works."""
     component = EntityComponent(_LOGGER, DOMAIN, hass)
@@ -287,6 +380,26 @@ async def test_parallel_updates_async_platform_with_constant(hass):
     assert entity.parallel_updates._value == 2
 
 
+async def test_state_write_interval_platform_constant(hass):
+    """Test platform can set the state write interval of its entities."""
+    platform = MockPlatform()
+    platform.STATE_WRITE_INTERVAL = timedelta(seconds=2)
+
+    mock_entity_platform(hass, "test_domain.platform", platform)
+
+    component = EntityComponent(_LOGGER, DOMAIN, hass)
+    component._platforms = {}
+
+    await component.async_setup({DOMAIN: {"platform": "platform"}})
+    await hass.async_block_till_done()
+
+    handle = list(component._platforms.values())[-1]
+
+    entity = MockEntity()
+    await handle.async_add_entities([entity])
+    assert entity.state_write_interval == timedelta(seconds=2)
+
+
 async def test_parallel_updates_sync_platform(hass):
     """Test sync platform parallel_updates default set to 1."""
     platform = MockPlatform()
@@ -487,6 +487,21 @@ async def test_update_entity(registry):
         entry = updated_entry
 
 
+async def test_entries_for_device(registry):
+    """Test the device index follows updates and removals."""
+    entry = registry.async_get_or_create("light", "hue", "1234", device_id="device-1")
+    registry.async_get_or_create("light", "hue", "5678", device_id="device-2")
+
+    assert entity_registry.async_entries_for_device(registry, "device-1") == [entry]
+
+    entry = registry.async_update_entity(entry.entity_id, new_entity_id="light.renamed")
+    assert entity_registry.async_entries_for_device(registry, "device-1") == [entry]
+
+    registry.async_remove(entry.entity_id)
+    assert entity_registry.async_entries_for_device(registry, "device-1") == []
+    assert len(entity_registry.async_entries_for_device(registry, "device-2")) == 1
+
+
 async def test_disabled_by(registry):
     """Test that we can disable an entry when we create it."""
     entry = registry.async_get_or_create("light", "hue", "5678", disabled_by="hass")
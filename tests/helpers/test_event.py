@@ -1279,6 +1279,80 @@ async def test_string(hass):
     assert refresh_runs == ["no_template"]
 
 
+async def test_track_template_result_rate_limit(hass):
+    """Test bursts of state changes are coalesced into one render."""
+    template_sum = Template(
+        "{{ states.sensor | map(attribute='state') | map('int') | sum }}", hass
+    )
+    renders = []
+
+    @ha.callback
+    def sum_listener(event, updates):
+        renders.append(updates.pop().result)
+
+    info = async_track_template_result(
+        hass,
+        [TrackTemplate(template_sum, None)],
+        sum_listener,
+        rate_limit=timedelta(seconds=0.1),
+    )
+    hass.states.async_set("sensor.one", "1")
+    hass.states.async_set("sensor.two", "2")
+    hass.states.async_set("sensor.three", "3")
+    await hass.async_block_till_done()
+    await asyncio.sleep(0.01)
+
+    assert renders == ["6"]
+
+    hass.states.async_set("sensor.one", "4")
+    hass.states.async_set("sensor.two", "5")
+    await hass.async_block_till_done()
+    await asyncio.sleep(0.01)
+
+    # Rendered at most once per rate limit
+    assert renders == ["6"]
+
+    await asyncio.sleep(0.15)
+    assert renders == ["6", "12"]
+
+    hass.states.async_set("sensor.one", "1")
+    await hass.async_block_till_done()
+    info.async_remove()
+    await asyncio.sleep(0.15)
+
+    assert renders == ["6", "12"]
+
+
+async def test_track_template_result_skips_unchanged_listeners(hass):
+    """Test listeners are only rebuilt when the tracked states change."""
+    template_condition = Template(
+        "{{ states.switch.test.state == 'on' and states.sensor.test.state }}", hass
+    )
+    runs = []
+
+    @ha.callback
+    def condition_listener(event, updates):
+        runs.append(updates.pop().result)
+
+    info = async_track_template_result(
+        hass, [TrackTemplate(template_condition, None)], condition_listener
+    )
+    hass.states.async_set("switch.test", "off")
+    await hass.async_block_till_done()
+    assert info.listeners["entities"] == {"switch.test"}
+
+    with patch.object(info, "_update_listeners") as update_listeners:
+        hass.states.async_set("switch.test", "off", {"changed": True})
+        await hass.async_block_till_done()
+
+    assert not update_listeners.called
+
+    hass.states.async_set("switch.test", "on")
+    await hass.async_block_till_done()
+    assert info.listeners["entities"] == {"switch.test", "sensor.test"}
+    assert runs == ["False", ""]
+
+
 async def test_track_template_result_refresh_cancel(hass):
     """Test cancelling and refreshing result."""
     template_refresh = Template("{{states.switch.test.state == 'on' and now() }}", hass)
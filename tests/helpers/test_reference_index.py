@@ -0,0 +1,61 @@
+"""Tests for the reference index helper."""
+from homeassistant.helpers import reference_index
+
+
+async def test_set_and_query(hass):
+    """Test registering and querying references."""
+    index = reference_index.async_get(hass)
+    assert reference_index.async_get(hass) is index
+
+    index.async_set(
+        "automation.wake_up",
+        entity_ids=["light.bedroom", "switch.coffee"],
+        device_ids=["device-1"],
+    )
+    index.async_set("script.morning", entity_ids=["light.bedroom"])
+    index.async_set("group.empty")
+
+    assert index.async_entities("automation.wake_up") == [
+        "light.bedroom",
+        "switch.coffee",
+    ]
+    assert index.async_devices("automation.wake_up") == ["device-1"]
+    assert index.async_entities("group.empty") == []
+    assert index.async_entities("automation.unknown") == []
+
+    assert sorted(index.async_sources_with_entity("light.bedroom")) == [
+        "automation.wake_up",
+        "script.morning",
+    ]
+    assert index.async_sources_with_entity("light.bedroom", "script") == [
+        "script.morning"
+    ]
+    assert index.async_sources_with_entity("light.bedroom", "scene") == []
+    assert index.async_sources_with_device("device-1") == ["automation.wake_up"]
+
+    assert index.async_related(["switch.coffee"], ["device-1"]) == {
+        "automation": {"automation.wake_up"},
+    }
+    assert index.async_related(["light.bedroom"]) == {
+        "automation": {"automation.wake_up"},
+        "script": {"script.morning"},
+    }
+
+
+async def test_update_and_remove(hass):
+    """Test updating and removing references."""
+    index = reference_index.async_get(hass)
+
+    index.async_set("group.all", entity_ids=["light.kitchen"])
+    index.async_set("group.other")
+    index.async_set("group.all", entity_ids=["light.living_room"])
+
+    assert index.async_sources_with_entity("light.kitchen") == []
+    assert index.async_sources_with_entity("light.living_room") == ["group.all"]
+
+    index.async_remove("group.all")
+    index.async_remove("group.other")
+    index.async_remove("group.unknown")
+
+    assert index.async_sources_with_entity("light.living_room") == []
+    assert index.async_related(["light.living_room"]) == {}
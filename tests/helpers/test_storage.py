@@ -2,6 +2,7 @@
 import asyncio
 from datetime import timedelta
 import json
+import os
 
 import pytest
 
@@ -21,6 +22,11 @@ MOCK_KEY = "storage-test"
 MOCK_DATA = {"hello": "world"}
 MOCK_DATA2 = {"goodbye": "cruel world"}
 
+# The hass fixture mocks these out, keep the real ones for the journal tests
+ORIG_ASYNC_LOAD = storage.Store._async_load
+ORIG_WRITE_DATA = storage.Store._write_data
+ORIG_ASYNC_REMOVE = storage.Store.async_remove
+
 
 @pytest.fixture
 def store(hass):
@@ -236,3 +242,130 @@ async def test_migrator_transforming_config(hass, store, hass_storage):
         "version": MOCK_VERSION,
         "data": data,
     }
+
+
+@pytest.fixture
+def disk_storage(hass, tmp_path):
+    """Write stores to disk instead of to the mocked storage."""
+    hass.config.config_dir = str(tmp_path)
+    with patch(
+        "homeassistant.helpers.storage.Store._async_load", ORIG_ASYNC_LOAD
+    ), patch("homeassistant.helpers.storage.Store._write_data", ORIG_WRITE_DATA), patch(
+        "homeassistant.helpers.storage.Store.async_remove", ORIG_ASYNC_REMOVE
+    ):
+        yield
+
+
+def test_diff_and_apply():
+    """Test the journal diff operations reproduce the new data."""
+    old = {
+        "keep": 1,
+        "remove": 2,
+        "nested": {"value": [1, 2, 3]},
+        "items": [{"id": 1}, {"id": 2}, {"id": 3}],
+    }
+    new = {
+        "keep": 1,
+        "added": "yes",
+        "nested": {"value": [1, 3]},
+        "items": [{"id": 1}, {"id": 2, "name": "two"}, {"id": 3}, {"id": 4}],
+    }
+    ops = []
+    storage._diff(old, new, [], ops)
+    assert ["del", ["remove"]] in ops
+    assert ["set", ["added"], "yes"] in ops
+    assert ["splice", ["nested", "value"], 1, 2, []] in ops
+    assert [
+        "splice",
+        ["items"],
+        1,
+        3,
+        [{"id": 2, "name": "two"}, {"id": 3}, {"id": 4}],
+    ] in ops
+    assert storage._apply_ops(json.loads(json.dumps(old)), ops) == new
+
+    ops = []
+    storage._diff(old["items"], [{"id": 1}, {"id": 5}, {"id": 3}], [], ops)
+    assert ops == [["set", [1, "id"], 5]]
+
+    ops = []
+    storage._diff(old, [1], [], ops)
+    assert storage._apply_ops(old, ops) == [1]
+
+
+async def test_compact_store(hass, disk_storage):
+    """Test compact stores are written without indentation."""
+    store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, compact=True)
+    await store.async_save(MOCK_DATA)
+
+    with open(store.path) as fh:
+        assert fh.read() == (
+            '{"version":1,"key":"storage-test","data":{"hello":"world"}}'
+        )
+    assert await store.async_load() == MOCK_DATA
+
+
+async def test_journal_store(hass, disk_storage):
+    """Test journal stores append changes and compact."""
+    store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+    data = {"items": [{"id": idx, "name": f"item {idx}"} for idx in range(20)]}
+    await store.async_save(data)
+    assert not os.path.exists(store.journal_path)
+
+    with open(store.path) as fh:
+        base = fh.read()
+
+    data["items"][3]["name"] = "renamed"
+    await store.async_save(data)
+    data["items"].append({"id": 20, "name": "new"})
+    store.async_delay_save(lambda: data, 1)
+    async_fire_time_changed(hass, dt.utcnow() + timedelta(seconds=1))
+    await hass.async_block_till_done()
+
+    # Only the journal changed
+    with open(store.path) as fh:
+        assert fh.read() == base
+    with open(store.journal_path) as fh:
+        assert fh.read().splitlines() == [
+            '[["set",["data","items",3,"name"],"renamed"]]',
+            '[["splice",["data","items"],20,20,[{"id":20,"name":"new"}]]]',
+        ]
+
+    # Saving the same data does not write anything
+    await store.async_save(data)
+    with open(store.journal_path) as fh:
+        assert len(fh.read().splitlines()) == 2
+
+    store2 = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+    assert await store2.async_load() == data
+
+    with patch("homeassistant.helpers.storage.JOURNAL_MAX_ENTRIES", 2):
+        data["items"].pop(0)
+        await store2.async_save(data)
+
+    assert not os.path.exists(store2.journal_path)
+    assert await storage.Store(hass, MOCK_VERSION, MOCK_KEY).async_load() == data
+
+    await store2.async_remove()
+    assert not os.path.exists(store2.path)
+
+
+async def test_journal_store_truncated(hass, disk_storage, caplog):
+    """Test an interrupted journal write is ignored and compacted."""
+    store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+    data = {"items": list(range(50))}
+    await store.async_save(data)
+    data["items"][0] = "first"
+    await store.async_save(data)
+
+    with open(store.journal_path, "a") as fh:
+        fh.write('[["set",["data","ite')
+
+    store2 = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+    assert await store2.async_load() == data
+    assert "Ignoring truncated journal for storage-test" in caplog.text
+
+    data["items"][1] = "second"
+    await store2.async_save(data)
+    assert not os.path.exists(store2.journal_path)
+    assert await storage.Store(hass, MOCK_VERSION, MOCK_KEY).async_load() == data
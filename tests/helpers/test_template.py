@@ -2357,11 +2357,34 @@ async def test_cache_garbage_collection():
         template_string
     )  # pylint: disable=protected-access
     del tpl2
+    # Still kept alive as a recently used template
+    assert template._NO_HASS_ENV.template_cache.get(
+        template_string
+    )  # pylint: disable=protected-access
+
+    with patch.object(template, "TEMPLATE_CACHE_SIZE", 1):
+        template.Template("{{ 'evict' }}").ensure_valid()
+
     assert not template._NO_HASS_ENV.template_cache.get(
         template_string
     )  # pylint: disable=protected-access
 
 
+async def test_cache_hits_and_misses(hass):
+    """Test compiled templates are shared between template instances."""
+    env = template.Template("{{ 1 }}", hass)._env
+    hits, misses = env.cache_hits, env.cache_misses
+
+    template.Template("{{ states.sensor.cache | count }}", hass).ensure_valid()
+    assert env.cache_misses == misses + 1
+    assert env.cache_hits == hits
+
+    # Recreating a template, like a reload does, reuses the compiled code
+    template.Template("{{ states.sensor.cache | count }}", hass).ensure_valid()
+    assert env.cache_misses == misses + 1
+    assert env.cache_hits == hits + 1
+
+
 def test_is_template_string():
     """Test is template string."""
     assert template.is_template_string("{{ x }}") is True
@@ -48,43 +48,43 @@ def test_split_entity_id():
     assert ha.split_entity_id("domain.object_id") == ["domain", "object_id"]
 
 
-def test_async_add_job_schedule_callback():
+def test_async_add_hass_job_schedule_callback():
     """Test that we schedule coroutines and add jobs to the job pool."""
     hass = MagicMock()
     job = MagicMock()
 
-    ha.HomeAssistant.async_add_job(hass, ha.callback(job))
+    ha.HomeAssistant.async_add_hass_job(hass, ha.HassJob(ha.callback(job)))
     assert len(hass.loop.call_soon.mock_calls) == 1
     assert len(hass.loop.create_task.mock_calls) == 0
     assert len(hass.add_job.mock_calls) == 0
 
 
-def test_async_add_job_schedule_partial_callback():
+def test_async_add_hass_job_schedule_partial_callback():
     """Test that we schedule partial coros and add jobs to the job pool."""
     hass = MagicMock()
     job = MagicMock()
     partial = functools.partial(ha.callback(job))
 
-    ha.HomeAssistant.async_add_job(hass, partial)
+    ha.HomeAssistant.async_add_hass_job(hass, ha.HassJob(partial))
     assert len(hass.loop.call_soon.mock_calls) == 1
     assert len(hass.loop.create_task.mock_calls) == 0
     assert len(hass.add_job.mock_calls) == 0
 
 
-def test_async_add_job_schedule_coroutinefunction(loop):
+def test_async_add_hass_job_schedule_coroutinefunction(loop):
     """Test that we schedule coroutines and add jobs to the job pool."""
     hass = MagicMock(loop=MagicMock(wraps=loop))
 
     async def job():
         pass
 
-    ha.HomeAssistant.async_add_job(hass, job)
+    ha.HomeAssistant.async_add_hass_job(hass, ha.HassJob(job))
     assert len(hass.loop.call_soon.mock_calls) == 0
     assert len(hass.loop.create_task.mock_calls) == 1
     assert len(hass.add_job.mock_calls) == 0
 
 
-def test_async_add_job_schedule_partial_coroutinefunction(loop):
+def test_async_add_hass_job_schedule_partial_coroutinefunction(loop):
     """Test that we schedule partial coros and add jobs to the job pool."""
     hass = MagicMock(loop=MagicMock(wraps=loop))
 
@@ -93,25 +93,39 @@ def test_async_add_job_schedule_partial_coroutinefunction(loop):
 
     partial = functools.partial(job)
 
-    ha.HomeAssistant.async_add_job(hass, partial)
+    ha.HomeAssistant.async_add_hass_job(hass, ha.HassJob(partial))
     assert len(hass.loop.call_soon.mock_calls) == 0
     assert len(hass.loop.create_task.mock_calls) == 1
     assert len(hass.add_job.mock_calls) == 0
 
 
-def test_async_add_job_add_threaded_job_to_pool():
+def test_async_add_hass_job_add_threaded_job_to_pool():
     """Test that we schedule coroutines and add jobs to the job pool."""
     hass = MagicMock()
 
     def job():
         pass
 
-    ha.HomeAssistant.async_add_job(hass, job)
+    ha.HomeAssistant.async_add_hass_job(hass, ha.HassJob(job))
     assert len(hass.loop.call_soon.mock_calls) == 0
     assert len(hass.loop.create_task.mock_calls) == 0
     assert len(hass.loop.run_in_executor.mock_calls) == 1
 
 
+def test_async_add_job_creates_hass_job():
+    """Test that async_add_job classifies the target and delegates."""
+    hass = MagicMock()
+
+    def job():
+        pass
+
+    ha.HomeAssistant.async_add_job(hass, job)
+    assert len(hass.async_add_hass_job.mock_calls) == 1
+    hassjob = hass.async_add_hass_job.mock_calls[0][1][0]
+    assert hassjob.target is job
+    assert hassjob.job_type == ha.HassJobType.Executor
+
+
 def test_async_create_task_schedule_coroutine(loop):
     """Test that we schedule coroutines and add jobs to the job pool."""
     hass = MagicMock(loop=MagicMock(wraps=loop))
@@ -125,7 +139,7 @@ def test_async_create_task_schedule_coroutine(loop):
     assert len(hass.add_job.mock_calls) == 0
 
 
-def test_async_run_job_calls_callback():
+def test_async_run_hass_job_calls_callback():
     """Test that the callback annotation is respected."""
     hass = MagicMock()
     calls = []
@@ -133,12 +147,12 @@ def test_async_run_job_calls_callback():
     def job():
         calls.append(1)
 
-    ha.HomeAssistant.async_run_job(hass, ha.callback(job))
+    ha.HomeAssistant.async_run_hass_job(hass, ha.HassJob(ha.callback(job)))
     assert len(calls) == 1
-    assert len(hass.async_add_job.mock_calls) == 0
+    assert len(hass.async_add_hass_job.mock_calls) == 0
 
 
-def test_async_run_job_delegates_non_async():
+def test_async_run_hass_job_delegates_non_async():
     """Test that the callback annotation is respected."""
     hass = MagicMock()
     calls = []
@@ -146,9 +160,39 @@ def test_async_run_job_delegates_non_async():
     def job():
         calls.append(1)
 
-    ha.HomeAssistant.async_run_job(hass, job)
+    ha.HomeAssistant.async_run_hass_job(hass, ha.HassJob(job))
     assert len(calls) == 0
-    assert len(hass.async_add_job.mock_calls) == 1
+    assert len(hass.async_add_hass_job.mock_calls) == 1
+
+
+def test_async_run_job_creates_hass_job():
+    """Test that async_run_job classifies the target and delegates."""
+    hass = MagicMock()
+
+    @ha.callback
+    def job():
+        pass
+
+    ha.HomeAssistant.async_run_job(hass, job)
+    assert len(hass.async_run_hass_job.mock_calls) == 1
+    hassjob = hass.async_run_hass_job.mock_calls[0][1][0]
+    assert hassjob.target is job
+    assert hassjob.job_type == ha.HassJobType.Callback
+
+
+def test_hassjob_forbid_coroutine():
+    """Test hassjob forbids coroutines."""
+
+    async def bla():
+        pass
+
+    coro = bla()
+
+    with pytest.raises(ValueError):
+        ha.HassJob(coro)
+
+    # To avoid warning about unawaited coro
+    coro.close()
 
 
 def test_stage_shutdown():
@@ -645,6 +689,56 @@ class TestStateMachine(unittest.TestCase):
         assert len(events) == 1
 
 
+async def test_states_changes_since(hass):
+    """Test the state machine returns the changes since a revision."""
+    hass.states.async_set("light.bowl", "on")
+    hass.states.async_set("switch.ac", "off")
+    revision = hass.states.revision
+
+    assert hass.states.async_changes_since(revision) == ([], [])
+
+    hass.states.async_set("light.bowl", "off")
+    hass.states.async_set("switch.ac", "off")
+    hass.states.async_set("light.kitchen", "on")
+    hass.states.async_remove("switch.ac")
+    assert hass.states.revision == revision + 3
+
+    changed, removed = hass.states.async_changes_since(revision)
+    assert changed == [hass.states.get("light.bowl"), hass.states.get("light.kitchen")]
+    assert removed == ["switch.ac"]
+
+    # Adding a removed entity again is a change
+    hass.states.async_set("switch.ac", "on")
+    assert hass.states.async_changes_since(revision) == (
+        [
+            hass.states.get("light.bowl"),
+            hass.states.get("light.kitchen"),
+            hass.states.get("switch.ac"),
+        ],
+        [],
+    )
+
+    # Unknown revisions
+    assert hass.states.async_changes_since(hass.states.revision + 1) is None
+    assert hass.states.async_changes_since(0) is None
+
+
+async def test_states_changes_since_forgets_removed(hass):
+    """Test changes since before forgotten removals are unknown."""
+    revision = hass.states.revision
+
+    with patch.object(ha, "MAX_REMOVED_STATE_REVISIONS", 2):
+        for idx in range(3):
+            hass.states.async_set(f"light.bowl_{idx}", "on")
+            hass.states.async_remove(f"light.bowl_{idx}")
+
+    assert hass.states.async_changes_since(revision) is None
+    assert hass.states.async_changes_since(hass.states.revision - 3) == (
+        [],
+        ["light.bowl_1", "light.bowl_2"],
+    )
+
+
 def test_service_call_repr():
     """Test ServiceCall repr."""
     call = ha.ServiceCall("homeassistant", "start")
@@ -1492,3 +1586,21 @@ async def test_async_entity_ids_count(hass):
 
     assert hass.states.async_entity_ids_count() == 5
     assert hass.states.async_entity_ids_count("light") == 3
+
+
+async def test_domain_filter_after_remove(hass):
+    """Test domain filters stay in sync when states are removed."""
+    hass.states.async_set("switch.link", "on")
+    hass.states.async_set("light.bowl", "on")
+    hass.states.async_set("light.frog", "on")
+
+    assert hass.states.async_remove("light.bowl")
+    assert hass.states.async_entity_ids("light") == ["light.frog"]
+    assert hass.states.async_entity_ids_count(["light", "switch", "light"]) == 2
+
+    assert hass.states.async_remove("switch.link")
+    assert hass.states.async_all("switch") == []
+    assert hass.states.async_entity_ids_count("SWITCH") == 0
+
+    hass.states.async_set("switch.link", "off")
+    assert [state.state for state in hass.states.async_all(["switch"])] == ["off"]
@@ -77,6 +77,15 @@ def test_overwrite_and_reload():
     assert data == TEST_JSON_B
 
 
+def test_save_compact():
+    """Test saving without indentation."""
+    fname = _path_for("test_compact")
+    save_json(fname, TEST_JSON_A, compact=True)
+    with open(fname) as fh:
+        assert fh.read() == '{"a":1,"B":"two"}'
+    assert load_json(fname) == TEST_JSON_A
+
+
 def test_save_bad_data():
     """Test error from trying to save unserialisable data."""
     with pytest.raises(SerializationError) as excinfo: